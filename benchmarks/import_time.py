@@ -0,0 +1,67 @@
+"""Measure the import time of the SDK modules
+
+Every module is imported in a fresh interpreter without any configuration
+file, the best time out of several runs is reported.
+
+Usage: python benchmarks/import_time.py [--runs N] [module ...]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+MODULES = [
+    "ibmcloud_python_sdk.auth",
+    "ibmcloud_python_sdk.utils.common",
+    "ibmcloud_python_sdk.vpc.instance",
+    "ibmcloud_python_sdk.power.instance",
+    "ibmcloud_python_sdk.aio.vpc.instance",
+]
+
+SNIPPET = ("import time; start = time.perf_counter(); import {}; "
+           "print(time.perf_counter() - start)")
+
+
+def measure(module, runs, env):
+    """Import a module in fresh interpreters
+
+    :param module: Module to import
+    :type module: str
+    :param runs: Number of runs
+    :type runs: int
+    :param env: Environment of the interpreters
+    :type env: dict
+    :return: Best import time in seconds
+    :rtype: float
+    """
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", SNIPPET.format(module)],
+                                env=env, check=True, stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE,
+                                universal_newlines=True).stdout
+        timings.append(float(output))
+
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        # No clouds.yaml, sdk.yaml or credentials could be found
+        env = {key: value for key, value in os.environ.items()
+               if not key.startswith(("IC_", "SL_"))}
+        env["HOME"] = home
+
+        for module in args.modules:
+            print("{:<45} {:8.1f} ms".format(
+                module, measure(module, args.runs, env) * 1000))
+
+
+if __name__ == "__main__":
+    main()
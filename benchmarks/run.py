@@ -0,0 +1,284 @@
+"""Benchmark the SDK against a local stand-in of the IBM Cloud APIs
+
+A stand-in server (benchmarks/server.py) is started for every collection
+size and the SDK is pointed at it with the *_url options of a temporary
+clouds.yaml. Every scenario runs once to warm up the token and the
+connections, then it is repeated until --iterations or --duration is
+reached. Throughput, p50/p99 latency, queries sent and peak memory of each
+scenario are reported as JSON.
+
+Usage: python -m benchmarks.run [--sizes 100,1000,10000] [--latency MS]
+           [--iterations N] [--duration S] [--sdk-config FILE]
+           [--certfile PEM --keyfile PEM] [--output FILE] [scenario ...]
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+SERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                      "server.py")
+
+CLOUDS = """---
+clouds:
+  default: benchmark
+  benchmark:
+    key: benchmark
+    region: us-south
+    version: 2021-06-15
+    generation: 2
+    auth_url: {url}
+    rg_url: {url}
+    dns_url: {url}
+    em_url: {url}
+    is_url: {url}
+    pi_url: {url}
+"""
+
+
+def start_server(args, size):
+    """Start the stand-in server
+
+    :return: Server process and its URL
+    :rtype: tuple
+    """
+    command = [sys.executable, SERVER, "--size", str(size),
+               "--latency", str(args.latency)]
+    if args.certfile:
+        command += ["--certfile", args.certfile, "--keyfile", args.keyfile]
+
+    process = subprocess.Popen(command, stdout=subprocess.PIPE,
+                               universal_newlines=True)
+    url = process.stdout.readline().strip()
+    if not url:
+        process.wait()
+        raise RuntimeError("Stand-in server failed to start")
+
+    return process, url
+
+
+def scenarios(size):
+    """Build the benchmarked operations
+
+    Resources are picked at random, with a fixed seed, among the ones of
+    the stand-in server. Lookups by name are run with an empty resolution
+    cache, "cached" variants reuse the names resolved during warm-up.
+
+    :param size: Number of resources in each collection
+    :type size: int
+    :return: Operations by scenario name
+    :rtype: dict
+    """
+    from benchmarks import server
+    from ibmcloud_python_sdk.dns import private
+    from ibmcloud_python_sdk.power import pvm
+    from ibmcloud_python_sdk.resource import resource_group
+    from ibmcloud_python_sdk.utils.resolution import resolution_cache
+    from ibmcloud_python_sdk.vpc import instance, vpc
+
+    pick = random.Random(size).randrange
+    ic = instance.Instance()
+    vc = vpc.Vpc()
+    rg = resource_group.ResourceGroup()
+    dns = private.Dns()
+    pc = pvm.Pvm()
+    power = server.resource_id("resource_instances", 1, "")
+    named = "instance-{}".format(pick(size))
+
+    def uncached(func):
+        def run():
+            resolution_cache.invalidate()
+            return func()
+        return run
+
+    def create_delete_vpc():
+        created = vc.create_vpc(name="benchmark")
+        check(created)
+        return vc.delete_vpc(created["id"])
+
+    return {
+        "vpc.get_instances": ic.get_instances,
+        "vpc.list_instances": lambda: list(ic.iter_instances()),
+        "vpc.get_instance_by_id": lambda: ic.get_instance(
+            server.resource_id("instances", pick(size))),
+        "vpc.get_instance_by_name": uncached(lambda: ic.get_instance(
+            "instance-{}".format(pick(size)))),
+        "vpc.get_instance_by_name_cached": lambda: ic.get_instance(named),
+        "vpc.create_delete_vpc": create_delete_vpc,
+        "rg.get_resource_groups": rg.get_resource_groups,
+        "rg.get_resource_group_by_name": uncached(
+            lambda: rg.get_resource_group(
+                "resource-group-{}".format(pick(size)))),
+        "dns.get_dns_zones": lambda: dns.get_dns_zones(
+            resource_instance=server.DNS_INSTANCE),
+        "power.get_pvms": lambda: pc.get_pvms(power),
+        "power.get_pvm_by_name": uncached(lambda: pc.get_pvm(
+            power, "pvm-{}".format(pick(size)))),
+    }
+
+
+def check(result):
+    """Fail the scenario if the SDK returned an error
+
+    :raises RuntimeError: The operation failed
+    """
+    if result is None:
+        raise RuntimeError("No result")
+    errors = result if isinstance(result, list) else [result]
+    for item in errors:
+        if isinstance(item, dict) and "errors" in item:
+            raise RuntimeError(json.dumps(item["errors"]))
+
+
+def percentile(values, rank):
+    """Nearest-rank percentile of sorted values"""
+    return values[max(0, math.ceil(rank * len(values)) - 1)]
+
+
+def queries():
+    from ibmcloud_python_sdk.utils import metrics
+    return sum(value for labels, value in metrics.REQUESTS.values.items()
+               if labels[3] != "cache")
+
+
+def measure(operation, iterations, duration):
+    """Run an operation repeatedly
+
+    :param operation: Function to benchmark
+    :type operation: function
+    :param iterations: Maximum number of runs
+    :type iterations: int
+    :param duration: Maximum duration in seconds, at least one run is done
+    :type duration: float
+    :return: Statistics of the runs
+    :rtype: dict
+    """
+    check(operation())
+
+    latencies = []
+    sent = queries()
+    start = time.perf_counter()
+    while len(latencies) < iterations:
+        begin = time.perf_counter()
+        check(operation())
+        end = time.perf_counter()
+        latencies.append(end - begin)
+        if end - start >= duration:
+            break
+    elapsed = time.perf_counter() - start
+    sent = queries() - sent
+
+    tracemalloc.start()
+    try:
+        check(operation())
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "iterations": len(latencies),
+        "throughput": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.5) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "mean_ms": sum(latencies) / len(latencies) * 1000,
+        "queries_per_op": sent / len(latencies),
+        "peak_memory_bytes": peak,
+    }
+
+
+def run(args, size, workdir):
+    """Benchmark every scenario against a server of a given size
+
+    :return: Results of the scenarios
+    :rtype: list
+    """
+    process, url = start_server(args, size)
+    try:
+        clouds = os.path.join(workdir, "clouds-{}.yaml".format(size))
+        with open(clouds, "w") as config_file:
+            config_file.write(CLOUDS.format(url=url))
+        os.environ["IC_CONFIG_FILE"] = clouds
+
+        results = []
+        for name, operation in scenarios(size).items():
+            if args.scenarios and name not in args.scenarios:
+                continue
+            result = {"size": size, "scenario": name}
+            try:
+                result.update(measure(operation, args.iterations,
+                                      args.duration))
+            except Exception as error:
+                result["error"] = str(error)
+            results.append(result)
+            print("{:>7} {:<34} {}".format(
+                size, name, result.get("error") or
+                "{:9.1f} ops/s  p50 {:8.2f} ms  p99 {:8.2f} ms".format(
+                    result["throughput"], result["p50_ms"],
+                    result["p99_ms"])), file=sys.stderr)
+
+        return results
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,10000",
+                        help="comma separated collection sizes")
+    parser.add_argument("--latency", type=float, default=0,
+                        help="delay of each response in milliseconds")
+    parser.add_argument("--iterations", type=int, default=200,
+                        help="maximum runs of each scenario")
+    parser.add_argument("--duration", type=float, default=10,
+                        help="maximum seconds spent on each scenario")
+    parser.add_argument("--sdk-config",
+                        help="sdk.yaml used during the benchmark, such as "
+                             "one enabling the local cache")
+    parser.add_argument("--certfile", help="certificate to serve HTTPS, it "
+                        "must be valid for 127.0.0.1")
+    parser.add_argument("--keyfile", help="private key of the certificate")
+    parser.add_argument("--output", help="JSON file, stdout by default")
+    parser.add_argument("scenarios", nargs="*",
+                        help="scenarios to run, all by default")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # Never use the configuration of the user
+        os.environ["IC_SDK_CONFIG_FILE"] = args.sdk_config or \
+            os.path.join(workdir, "sdk.yaml")
+        if args.certfile:
+            os.environ["SSL_CERT_FILE"] = args.certfile
+
+        results = []
+        for size in [int(size) for size in args.sizes.split(",")]:
+            results.extend(run(args, size, workdir))
+
+    report = {
+        "date": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "latency_ms": args.latency,
+        "tls": bool(args.certfile),
+        "sdk_config": args.sdk_config,
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,439 @@
+"""Local stand-in of the IBM Cloud APIs used by the benchmarks
+
+Synthetic VPC, resource-controller, DNS and Power payloads are generated
+on the fly, every collection holds --size resources. Each response is
+delayed by --latency milliseconds. Writes are accepted but not stored:
+creating a resource returns it, and any well-formed ID could be retrieved
+or deleted.
+
+The URL of the server is printed on the first line of stdout, point the
+SDK at it with the *_url options of clouds.yaml.
+
+Usage: python benchmarks/server.py [--port N] [--size N] [--latency MS]
+           [--page-limit N] [--gzip] [--certfile PEM --keyfile PEM]
+"""
+import argparse
+import functools
+import gzip
+import json
+import re
+import ssl
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import jwt
+
+ACCOUNT = "a1b2c3d4e5f60718293a4b5c6d7e8f90"
+REGION = "us-south"
+# Key signing the IAM tokens, the SDK never checks the signature
+SECRET = "benchmark" * 4
+
+# Code embedded in the IDs of each kind of resource
+KINDS = {
+    "instances": 1, "vpcs": 2, "subnets": 3, "keys": 4, "images": 5,
+    "volumes": 6, "floating_ips": 7, "security_groups": 8,
+    "public_gateways": 9, "network_acls": 10, "resource_groups": 11,
+    "resource_instances": 12, "dnszones": 13, "pvm-instances": 14,
+}
+ID_REGEXP = re.compile(
+    r"^(?:r006-)?([0-9a-f]{8})-0000-4000-8000-([0-9a-f]{12})$")
+
+# Resource instances hosting the DNS zones and the Power instances
+DNS_INSTANCE = "dns-instance"
+POWER_INSTANCE = "power-instance"
+
+
+def resource_id(kind, index, prefix="r006-"):
+    """Build the ID of a synthetic resource
+
+    :param kind: Collection name such as "instances"
+    :type kind: str
+    :param index: Position of the resource in its collection
+    :type index: int
+    :return: ID matching the format of the real IDs
+    :rtype: str
+    """
+    return "{}{:08x}-0000-4000-8000-{:012x}".format(prefix, KINDS[kind], index)
+
+
+def parse_id(kind, value):
+    """Retrieve the position of a resource from its ID
+
+    :return: Position or None if the ID is not one of the collection
+    :rtype: int
+    """
+    match = ID_REGEXP.match(value)
+    if match and int(match.group(1), 16) == KINDS[kind]:
+        return int(match.group(2), 16)
+
+    return None
+
+
+def crn(service, guid):
+    return "crn:v1:bluemix:public:{}:{}:a/{}:{}::".format(
+        service, REGION, ACCOUNT, guid)
+
+
+def vpc_resource(kind, index, base):
+    """Build a VPC resource
+
+    Instances carry nested network interfaces, volumes and a profile so
+    their size is close to the one returned by the real API.
+
+    :rtype: dict
+    """
+    id = resource_id(kind, index)
+    resource = {
+        "id": id,
+        "crn": crn("is", id),
+        "href": "{}/v1/{}/{}".format(base, kind, id),
+        "name": "{}-{}".format(kind.replace("_", "-").rstrip("s"), index),
+        "created_at": "2021-06-15T10:00:00Z",
+        "resource_group": {"id": resource_id("resource_groups", 0, ""),
+                           "name": "default"},
+        "status": "available",
+        "zone": {"name": REGION + "-1"},
+    }
+    if kind == "instances":
+        resource.update({
+            "status": "running",
+            "profile": {"name": "bx2-2x8"},
+            "memory": 8,
+            "vcpu": {"architecture": "amd64", "count": 2},
+            "vpc": {"id": resource_id("vpcs", 0), "name": "vpc-0"},
+            "image": {"id": resource_id("images", 0), "name": "image-0"},
+            "primary_network_interface": {
+                "id": resource_id("subnets", index),
+                "name": "eth0",
+                "primary_ipv4_address": "10.{}.{}.{}".format(
+                    index >> 16 & 255, index >> 8 & 255, index & 255),
+                "subnet": {"id": resource_id("subnets", 0),
+                           "name": "subnet-0"},
+            },
+            "boot_volume_attachment": {
+                "device": {"id": resource_id("volumes", index)},
+                "name": "boot",
+                "volume": {"id": resource_id("volumes", index),
+                           "name": "volume-{}".format(index)},
+            },
+        })
+
+    return resource
+
+
+def rc_resource(kind, index):
+    """Build a resource group or a resource instance
+
+    The first resource instances host the DNS zones and the Power
+    instances.
+
+    :rtype: dict
+    """
+    guid = resource_id(kind, index, "")
+    name = "{}-{}".format(kind.replace("_", "-").rstrip("s"), index)
+    service = "resource-controller"
+    if kind == "resource_instances" and index == 0:
+        name, service = DNS_INSTANCE, "dns-svcs"
+    elif kind == "resource_instances" and index == 1:
+        name, service = POWER_INSTANCE, "power-iaas"
+
+    resource = {
+        "id": crn(service, guid) if kind == "resource_instances" else guid,
+        "guid": guid,
+        "crn": crn(service, guid),
+        "name": name,
+        "account_id": ACCOUNT,
+        "state": "active",
+        "created_at": "2021-06-15T10:00:00Z",
+        "default": index == 0,
+    }
+    if kind == "resource_instances":
+        resource.update({
+            "region_id": REGION,
+            "resource_group_id": resource_id("resource_groups", 0, ""),
+            "resource_plan_id": "a8b6a6c3-4cba-4bd5-a6d8-0e4d3e3d1f9b",
+            "type": "service_instance",
+        })
+
+    return resource
+
+
+def dns_zone(index):
+    id = "{}:{}".format(resource_id("dnszones", index, ""), index)
+    return {
+        "id": id,
+        "name": "zone-{}.example.com".format(index),
+        "instance_id": resource_id("resource_instances", 0, ""),
+        "state": "active",
+        "created_on": "2021-06-15 10:00:00 +0000 UTC",
+        "label": "benchmark",
+    }
+
+
+def pvm(index):
+    return {
+        "pvmInstanceID": resource_id("pvm-instances", index, ""),
+        "serverName": "pvm-{}".format(index),
+        "status": "ACTIVE",
+        "processors": 0.25,
+        "procType": "shared",
+        "memory": 2,
+        "sysType": "s922",
+        "networks": [{"ipAddress": "192.168.{}.{}".format(
+            index >> 8 & 255, index & 255), "networkName": "private"}],
+    }
+
+
+class FakeApi(ThreadingMixIn, HTTPServer):
+    """HTTP server answering like the IBM Cloud APIs
+
+    :param address: Listening address and port
+    :type address: tuple
+    :param size: Number of resources in each collection
+    :type size: int
+    :param latency: Delay of each response in seconds
+    :type latency: float
+    :param page_limit: Default number of resources per page
+    :type page_limit: int
+    :param compress: Compress responses when the client accepts gzip
+    :type compress: bool
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, size=1000, latency=0.0, page_limit=50,
+                 compress=False):
+        super().__init__(address, Handler)
+        self.size = size
+        self.latency = latency
+        self.page_limit = page_limit
+        self.compress = compress
+        self.scheme = "http"
+        self.render = functools.lru_cache(maxsize=1024)(self._render)
+
+    @property
+    def url(self):
+        return "{}://127.0.0.1:{}".format(self.scheme, self.server_address[1])
+
+    def use_tls(self, certfile, keyfile):
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(certfile, keyfile)
+        self.socket = context.wrap_socket(self.socket, server_side=True)
+        self.scheme = "https"
+
+    def token(self):
+        now = int(time.time())
+        return jwt.encode({"iat": now, "exp": now + 3600,
+                           "account": {"bss": ACCOUNT}}, SECRET,
+                          algorithm="HS256")
+
+    def _render(self, kind, start, limit):
+        """Encode a page of a collection, pages are reused across queries
+
+        :return: JSON body
+        :rtype: bytes
+        """
+        end = min(start + limit, self.size) if limit else self.size
+        if kind == "dnszones":
+            data = {"dnszones": [dns_zone(i) for i in range(start, end)],
+                    "count": end - start, "total_count": self.size}
+        elif kind == "pvm-instances":
+            data = {"pvmInstances": [pvm(i) for i in range(start, end)]}
+        elif kind in ("resource_groups", "resource_instances"):
+            data = {"rows_count": end - start, "next_url": None,
+                    "resources": [rc_resource(kind, i)
+                                  for i in range(start, end)]}
+        else:
+            collection = "{}/v1/{}".format(self.url, kind)
+            data = {kind: [vpc_resource(kind, i, self.url)
+                           for i in range(start, end)],
+                    "limit": limit, "total_count": self.size,
+                    "first": {"href": "{}?limit={}".format(collection,
+                                                           limit)}}
+            if end < self.size:
+                data["next"] = {"href": "{}?start={}&limit={}".format(
+                    collection, end, limit)}
+
+        return json.dumps(data).encode("utf-8")
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, without TCP_NODELAY the
+    # delayed ACK of the client adds 40ms to small responses
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def reply(self, status, data=None, body=None):
+        if data is not None:
+            body = json.dumps(data).encode("utf-8")
+        body = body or b""
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        self.send_response(status)
+        if body:
+            self.send_header("Content-Type", "application/json")
+            if (self.server.compress and len(body) > 1024 and "gzip" in
+                    self.headers.get("Accept-Encoding", "")):
+                body = gzip.compress(body, 1)
+                self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def not_found(self, what):
+        self.reply(404, {"errors": [{"code": "not_found",
+                                     "message": "{} not found".format(what)}],
+                         "status_code": 404})
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        try:
+            return json.loads(body) if body else {}
+        except ValueError:
+            return {}
+
+    def route(self):
+        url = urlsplit(self.path)
+        segments = url.path.strip("/").split("/")
+        query = {key: values[0] for key, values
+                 in parse_qs(url.query).items()}
+
+        return segments, query
+
+    def do_GET(self):
+        segments, query = self.route()
+        server = self.server
+        size = server.size
+
+        if segments[:2] == ["pcloud", "v1"] and len(segments) >= 4:
+            if len(segments) == 4:
+                return self.reply(200, {"name": segments[3],
+                                        "cloudInstanceID": segments[3],
+                                        "region": REGION, "enabled": True})
+            if len(segments) == 5 and segments[4] == "pvm-instances":
+                return self.reply(200, body=server.render(
+                    "pvm-instances", 0, 0))
+            index = parse_id("pvm-instances", segments[-1])
+            if index is not None:
+                return self.reply(200, pvm(index))
+            return self.not_found("Power instance")
+
+        rc_kinds = ("resource_groups", "resource_instances")
+        if segments[0] == "v2" and segments[1:2] and segments[1] in rc_kinds:
+            kind = segments[1]
+            if len(segments) >= 3:
+                # Resources could be retrieved by GUID or by CRN
+                id = unquote("/".join(segments[2:]))
+                if id.startswith("crn:"):
+                    id = id.split(":")[7]
+                index = parse_id(kind, id)
+                if index is not None:
+                    return self.reply(200, rc_resource(kind, index))
+                return self.not_found(kind)
+            if "name" in query:
+                match = re.match(r"^[a-z-]+-(\d+)$", query["name"])
+                names = {DNS_INSTANCE: 0, POWER_INSTANCE: 1}
+                index = names.get(query["name"])
+                if index is None and match:
+                    index = int(match.group(1))
+                resources = []
+                if index is not None and index < size:
+                    resource = rc_resource(kind, index)
+                    if resource["name"] == query["name"]:
+                        resources.append(resource)
+                return self.reply(200, {"rows_count": len(resources),
+                                        "resources": resources})
+            return self.reply(200, body=server.render(kind, 0, 0))
+
+        if segments[0] == "v1" and len(segments) >= 4 and \
+                segments[3] == "dnszones":
+            if len(segments) == 4:
+                return self.reply(200, body=server.render("dnszones", 0, 0))
+            return self.not_found("DNS zone")
+
+        if segments[0] == "v1" and len(segments) == 3 and \
+                segments[1] in KINDS:
+            index = parse_id(segments[1], segments[2])
+            if index is not None:
+                return self.reply(200, vpc_resource(segments[1], index,
+                                                    server.url))
+            return self.not_found(segments[1])
+
+        if segments[0] == "v1" and len(segments) == 2 and \
+                segments[1] in KINDS:
+            kind = segments[1]
+            limit = min(int(query.get("limit") or server.page_limit), 100)
+            start = int(query.get("start") or 0)
+            return self.reply(200, body=server.render(kind, start, limit))
+
+        self.not_found("Path")
+
+    def do_POST(self):
+        segments, _ = self.route()
+        payload = self.read_body()
+
+        if segments == ["identity", "token"]:
+            return self.reply(200, {"access_token": self.server.token(),
+                                    "refresh_token": "not-used",
+                                    "token_type": "Bearer",
+                                    "expires_in": 3600})
+
+        if segments[0] == "v1" and len(segments) == 2 and \
+                segments[1] in KINDS:
+            resource = vpc_resource(segments[1], self.server.size,
+                                    self.server.url)
+            resource.update(payload)
+            return self.reply(201, resource)
+
+        self.not_found("Path")
+
+    def do_DELETE(self):
+        segments, _ = self.route()
+        if segments[0] == "v1" and len(segments) == 3 and \
+                segments[1] in KINDS:
+            if parse_id(segments[1], segments[2]) is None:
+                return self.not_found(segments[1])
+            return self.reply(204)
+
+        self.not_found("Path")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--size", type=int, default=1000,
+                        help="resources per collection")
+    parser.add_argument("--latency", type=float, default=0,
+                        help="delay of each response in milliseconds")
+    parser.add_argument("--page-limit", type=int, default=50)
+    parser.add_argument("--gzip", action="store_true",
+                        help="compress responses larger than 1KB")
+    parser.add_argument("--certfile", help="certificate to serve HTTPS")
+    parser.add_argument("--keyfile", help="private key of the certificate")
+    args = parser.parse_args()
+
+    server = FakeApi(("127.0.0.1", args.port), args.size,
+                     args.latency / 1000, args.page_limit, args.gzip)
+    if args.certfile:
+        server.use_tls(args.certfile, args.keyfile)
+
+    print(server.url, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
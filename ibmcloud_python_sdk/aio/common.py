@@ -0,0 +1,233 @@
+import asyncio
+import time
+from ibmcloud_python_sdk import auth
+from ibmcloud_python_sdk.auth import token_manager
+from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.aio.transport import pool
+from ibmcloud_python_sdk.utils import cassette
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.utils.common import HOSTS
+from ibmcloud_python_sdk.utils.compression import ACCEPT_ENCODING
+from ibmcloud_python_sdk.utils.compression import decompress
+from ibmcloud_python_sdk.utils.hooks import Call
+from ibmcloud_python_sdk.utils.hooks import hooks
+from ibmcloud_python_sdk.utils.common import basic_auth
+from ibmcloud_python_sdk.utils.common import evict
+from ibmcloud_python_sdk.utils.common import first_page
+from ibmcloud_python_sdk.utils.common import read_page
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.retry import RetryPolicy
+
+
+async def get_headers():
+    """Generates the headers used for authenticated HTTP request.
+
+    The IAM token is shared with the synchronous API. If it has to be
+    renewed, the renewal runs in the default executor so the event loop is
+    never blocked.
+
+    :return: Dict of headers
+    :rtype: dict
+    """
+    if token_manager.usable():
+        return auth.get_headers()
+
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, auth.get_headers)
+
+
+async def query_wrapper(conn_type, method, path, headers=None, payload=None,
+                        retry=None):
+    """Execute HTTP query and return JSON response
+
+    Asynchronous counterpart of utils.common.query_wrapper using pooled
+    keep-alive connections and the aio_concurrency limit from sdk.yaml.
+    Failed queries are retried with the same policy and the hooks
+    registered in utils.hooks run for every call.
+
+    :param conn_type: Define which URL should be used for the connection
+        such as "iaas", "auth", "cis", or "rg" (resource group)
+    :type conn_type: str
+    :param method: HTTP method that should be used such as
+        GET, POST, PUT, DELETE, etc...
+    :type method: str
+    :param path: Path used by within the query
+    :type path: str
+    :param headers: Headers to send with the query is required such
+        authentication token, content type, etc...
+    :type headers: dict, optional
+    :param payload: JSON payload send during the query
+    :type payload: dict, optional
+    :param retry: Force retries on (True) for a POST safe to send again or
+        off (False), the HTTP method decides if not defined
+    :type retry: bool, optional
+    :return: JSON response
+    :rtype: dict
+    """
+    cfg = params()
+
+    if conn_type == "sl":
+        if headers and cfg["cis_username"] and cfg["cis_apikey"]:
+            headers["Authorization"] = basic_auth(cfg)
+
+    call = Call(conn_type, method, path, dict(headers or {}), payload)
+    hooks.run("before_request", call)
+    try:
+        result = await _query(cfg, call, payload, retry)
+    except Exception as error:
+        call.finish(error)
+        hooks.run("on_error", call)
+        raise
+
+    call.finish()
+    hooks.run("after_response", call)
+
+    return result
+
+
+async def _query(cfg, call, payload, retry):
+    """Execute HTTP query through the retry policy
+
+    Cached responses modified by a POST, PUT, PATCH or DELETE are evicted
+    like with the synchronous API.
+
+    :param cfg: Configuration from params()
+    :type cfg: dict
+    :param call: Query, filled with its outcome
+    :type call: Call
+    :return: JSON response
+    :rtype: dict
+    """
+    method, path = call.method, call.path
+    host = cfg[HOSTS[call.conn_type]]
+
+    # Negotiate compression without altering the caller headers
+    request_headers = dict(call.headers)
+    request_headers.setdefault("Accept-Encoding", ACCEPT_ENCODING)
+
+    tape = cassette.current()
+    policy = RetryPolicy()
+    retry = policy.allowed(method, retry)
+    started = time.monotonic()
+    attempt = 0
+    while True:
+        attempt += 1
+        call.attempts = attempt
+        try:
+            if tape is not None and tape.mode == "replay":
+                res, data = tape.play(call.conn_type, method, path, payload)
+            else:
+                res, data = await pool.request(host, method, path, payload,
+                                               request_headers,
+                                               cfg["http_timeout"])
+                if tape is not None:
+                    tape.record(call.conn_type, method, path, payload, res,
+                                decompress(res.getheader("Content-Encoding"),
+                                           data))
+        except (OSError, asyncio.TimeoutError,
+                asyncio.IncompleteReadError):
+            delay = policy.schedule(attempt, started) if retry else None
+            if delay is None:
+                raise
+            await _wait(call, delay)
+            continue
+
+        # Phases of every attempt add up
+        for phase, duration in getattr(res, "timings", {}).items():
+            call.timings[phase] = call.timings.get(phase, 0) + duration
+
+        if retry and policy.retryable(res):
+            delay = policy.schedule(attempt, started, res)
+            if delay is not None:
+                await _wait(call, delay)
+                continue
+
+        break
+
+    decompressed = time.monotonic()
+    data = decompress(res.getheader("Content-Encoding"), data)
+    call.timings["read"] = (call.timings.get("read", 0)
+                            + time.monotonic() - decompressed)
+    call.response = res
+    call.response_bytes = len(data)
+
+    # Cached responses are shared with the synchronous API
+    evict(call)
+
+    # Empty data is mostly due to DELETE request which doesn't return any
+    started = time.monotonic()
+    data = codec.loads(data) if data else None
+    call.timings["decode"] = time.monotonic() - started
+
+    # Return data, HTTP response and timings
+    return {"data": data, "response": res, "timings": call.timings}
+
+
+async def _wait(call, delay):
+    """Sleep before sending a query again
+
+    :param call: Query
+    :type call: Call
+    :param delay: Number of seconds to wait
+    :type delay: float
+    """
+    call.timings["retry_wait"] = call.timings.get("retry_wait", 0) + delay
+    await asyncio.sleep(delay)
+
+
+async def paginate(query, path, key, limit=None):
+    """Iterate over every resource of a paginated collection
+
+    Asynchronous counterpart of utils.common.paginate, pages are requested
+    one at a time by following the next link.
+
+    :param query: Coroutine function retrieving the JSON data of a path
+    :type query: function
+    :param path: Path of the collection including its query parameters
+    :type path: str
+    :param key: Name of the resources list in the JSON response
+    :type key: str
+    :param limit: Number of resources per page
+    :type limit: int, optional
+    :return: Asynchronous generator of resources
+    :rtype: async_generator
+    """
+    path = first_page(path, limit)
+    while path:
+        resources, path = read_page(path, await query(path), key)
+        for resource in resources:
+            yield resource
+
+
+async def find_resource(by_id, by_name, *args, fallback=None, id_key="id",
+                        name_key="name"):
+    """Retrieve a resource by ID or by name
+
+    Asynchronous counterpart of utils.common.find_resource running the
+    same steps, the resolution cache is shared with the synchronous API.
+
+    :param by_id: Coroutine function retrieving the resource by ID
+    :type by_id: function
+    :param by_name: Coroutine function retrieving the resource by name
+    :type by_name: function
+    :param args: Arguments passed to the lookup functions, the last one
+        being the resource name or ID
+    :param fallback: Coroutine function used if the resource is still not
+        found
+    :type fallback: function, optional
+    :param id_key: Name of the ID in the resource information
+    :type id_key: str, optional
+    :param name_key: Name of the name in the resource information, used
+        to detect a renamed resource
+    :type name_key: str, optional
+    :return: Resource information
+    :rtype: dict
+    """
+    steps = resolve(by_id, by_name, args, fallback, id_key, name_key)
+    data = None
+    while True:
+        try:
+            lookup, lookup_args = steps.send(data)
+        except StopIteration as stop:
+            return stop.value
+        data = await lookup(*lookup_args)
@@ -0,0 +1,92 @@
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.aio.common import get_headers as headers
+from ibmcloud_python_sdk.aio.common import query_wrapper as qw
+from ibmcloud_python_sdk.aio.common import find_resource
+from ibmcloud_python_sdk.utils.common import resource_not_found
+
+
+class ResourceGroup():
+
+    # Names are resolved to the same IDs as the synchronous API
+    resolution_kind = ("ibmcloud_python_sdk.resource.resource_group."
+                       "ResourceGroup")
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
+
+    async def get_resource_groups(self):
+        """Retrieve resource group list
+
+        :return: List of resource groups
+        :rtype: list
+        """
+        try:
+            # Connect to api endpoint for resource_groups
+            path = "/v2/resource_groups"
+
+            # Return data
+            return (await qw("rg", "GET", path, await headers()))["data"]
+
+        except Exception as error:
+            print("Error fetching resource groups. {}".format(error))
+            raise
+
+    async def get_resource_group(self, group):
+        """Retrieve specific resource group by name or by ID
+
+        :param group: Resource group name or ID
+        :type group: str
+        :return: Resource group information
+        :rtype: dict
+        """
+        return await find_resource(self.get_resource_group_by_id,
+                                   self.get_resource_group_by_name, group)
+
+    async def get_resource_group_by_id(self, id):
+        """Retrieve specific resource group by ID
+
+        :param id: Resource group ID
+        :type id: str
+        :return: Resource group information
+        :rtype: dict
+        """
+        try:
+            # Connect to api endpoint for resource_groups
+            path = ("/v2/resource_groups/{}".format(id))
+
+            # Return data
+            return (await qw("rg", "GET", path, await headers()))["data"]
+
+        except Exception as error:
+            print("Error fetching resource group with ID {}. {}".format(
+                id, error))
+            raise
+
+    async def get_resource_group_by_name(self, name):
+        """Retrieve specific resource group by name
+
+        :param name: Resource group name
+        :type name: str
+        :return: Resource group information
+        :rtype: dict
+        """
+        try:
+            # Retrieve resource groups
+            data = await self.get_resource_groups()
+            if "errors" in data:
+                return data
+
+            # Loop over resources until filter match
+            for resource in data['resources']:
+                if resource["name"] == name:
+                    # Return data
+                    return resource
+
+            # Return error if no resource is found
+            return resource_not_found()
+
+        except Exception as error:
+            print("Error fetching resource group with name {}. {}".format(
+                name, error))
+            raise
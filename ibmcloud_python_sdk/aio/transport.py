@@ -0,0 +1,351 @@
+import asyncio
+import ssl
+import time
+import weakref
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import constants
+from ibmcloud_python_sdk.utils.retry import IDEMPOTENT_METHODS
+
+
+class AsyncResponse():
+    """HTTP response returned by the asyncio transport
+
+    Mirrors the attributes of http.client.HTTPResponse used by the SDK.
+    """
+
+    def __init__(self, version, status, reason, headers):
+        self.version = version
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.will_close = (version == "HTTP/1.0" or "close" in
+                           self.getheader("Connection", "").lower())
+
+    def getheader(self, name, default=None):
+        """Retrieve a response header
+
+        :param name: Header name
+        :type name: str
+        :param default: Value returned if the header is missing
+        :type default: str, optional
+        :return: Header value
+        :rtype: str
+        """
+        return self.headers.get(name.lower(), default)
+
+    def getheaders(self):
+        """Retrieve every response header
+
+        :return: List of (header, value) tuples
+        :rtype: list
+        """
+        return list(self.headers.items())
+
+
+class AsyncConnection():
+    """HTTP/1.1 keep-alive connection built on asyncio streams"""
+
+    def __init__(self, host, timeout, ssl_context=None):
+        scheme, separator, address = host.partition("://")
+        if separator:
+            host = address
+            if scheme == "http":
+                ssl_context = False
+        self.host = host
+        self.timeout = timeout
+        self.ssl_context = ssl_context
+        self.reader = None
+        self.writer = None
+
+    @property
+    def connected(self):
+        return self.writer is not None
+
+    def alive(self):
+        """Check if an idle connection can still be used
+
+        :return: Connection state
+        :rtype: bool
+        """
+        if self.writer is None:
+            return False
+
+        return not (self.reader.at_eof()
+                    or self.writer.transport.is_closing())
+
+    async def connect(self):
+        """Open the connection"""
+        host, _, port = self.host.partition(":")
+        secure = self.ssl_context is not False
+        if not port:
+            port = 443 if secure else 80
+
+        self.reader, self.writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                host, int(port),
+                ssl=(self.ssl_context or ssl.create_default_context())
+                if secure else None,
+                server_hostname=host if secure else None),
+            self.timeout)
+
+    def close(self):
+        """Close the connection"""
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method, path, body=None, headers=None):
+        """Send HTTP request and read the whole response
+
+        :param method: HTTP method
+        :type method: str
+        :param path: Path used by within the query
+        :type path: str
+        :param body: Payload send during the query
+        :type body: str, optional
+        :param headers: Headers to send with the query
+        :type headers: dict, optional
+        :return: HTTP response and its body, the response timings attribute
+            holds the duration of each phase
+        :rtype: tuple
+        """
+        timings = {}
+        if self.writer is None:
+            started = time.monotonic()
+            await self.connect()
+            # Includes DNS resolution and TLS handshake
+            timings["connect"] = time.monotonic() - started
+
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        lines = ["{} {} HTTP/1.1".format(method, path),
+                 "Host: {}".format(self.host)]
+        for key, value in (headers or {}).items():
+            lines.append("{}: {}".format(key, value))
+        if body is not None or method in ("POST", "PUT", "PATCH"):
+            lines.append("Content-Length: {}".format(len(body or b"")))
+
+        sent = time.monotonic()
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if body:
+            self.writer.write(body)
+        await self.writer.drain()
+
+        response, data = await asyncio.wait_for(
+            self._read_response(method, sent, timings), self.timeout)
+        response.timings = timings
+
+        return response, data
+
+    async def _read_response(self, method, sent, timings):
+        """Read HTTP response status, headers and body
+
+        :param method: HTTP method of the request
+        :type method: str
+        :param sent: Time the request was sent at
+        :type sent: float
+        :param timings: Phase durations to fill
+        :type timings: dict
+        :return: HTTP response and its body
+        :rtype: tuple
+        """
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Remote end closed connection")
+        received = time.monotonic()
+        timings["ttfb"] = received - sent
+
+        version, status, reason = (status_line.decode("latin-1").rstrip()
+                                   .split(" ", 2) + [""])[:3]
+
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            key = key.strip().lower()
+            if key in headers:
+                headers[key] = "{}, {}".format(headers[key], value.strip())
+            else:
+                headers[key] = value.strip()
+
+        response = AsyncResponse(version, int(status), reason, headers)
+
+        if (method == "HEAD" or response.status in (204, 304)
+                or 100 <= response.status < 200):
+            body = b""
+        elif "chunked" in headers.get("transfer-encoding", "").lower():
+            body = await self._read_chunked()
+        elif "content-length" in headers:
+            body = await self.reader.readexactly(
+                int(headers["content-length"]))
+        else:
+            # Body is delimited by the end of the connection
+            body = await self.reader.read()
+            response.will_close = True
+
+        timings["read"] = time.monotonic() - received
+
+        return response, body
+
+    async def _read_chunked(self):
+        """Read a chunked encoded body
+
+        :return: Body
+        :rtype: bytes
+        """
+        chunks = []
+        while True:
+            size = int((await self.reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                # Skip trailers
+                while (await self.reader.readline()) not in (b"\r\n", b""):
+                    pass
+                break
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readexactly(2)
+
+        return b"".join(chunks)
+
+
+class _LoopState():
+    """Idle connections and concurrency limit bound to one event loop"""
+
+    def __init__(self, concurrency):
+        self.idle = {}
+        self.semaphore = asyncio.Semaphore(concurrency)
+
+
+class AsyncConnectionPool():
+    """Keep-alive connections grouped by host for asyncio
+
+    The number of idle connections kept per host is defined by
+    ``pool_size`` and the number of requests running at the same time by
+    ``aio_concurrency`` in ``sdk.yaml``. Streams are bound to an event loop
+    so every loop gets its own connections. The pool size is read again
+    when sdk.yaml changes, the concurrency limit of a loop is fixed once
+    it sent its first request.
+    """
+
+    def __init__(self, size=None, concurrency=None, ssl_context=None):
+        self.size = size
+        self.concurrency = concurrency
+        self.ssl_context = ssl_context
+        self.loops = weakref.WeakKeyDictionary()
+
+    def _state(self):
+        """Retrieve the state of the running event loop
+
+        :return: Loop state
+        :rtype: _LoopState
+        """
+        loop = asyncio.get_event_loop()
+        state = self.loops.get(loop)
+        if state is None:
+            concurrency = self.concurrency
+            if concurrency is None:
+                config = sdk() or {}
+                concurrency = int(config.get(
+                    "aio_concurrency", constants.AIO_CONCURRENCY))
+            state = _LoopState(concurrency)
+            self.loops[loop] = state
+
+        return state
+
+    def _max_idle(self):
+        """Retrieve the number of idle connections to keep per host
+
+        :return: Pool size
+        :rtype: int
+        """
+        if self.size is not None:
+            return self.size
+
+        config = sdk() or {}
+        return int(config.get("pool_size", constants.POOL_SIZE))
+
+    def _get(self, state, host, timeout):
+        """Retrieve an idle connection or create a new one
+
+        :return: Connection
+        :rtype: AsyncConnection
+        """
+        conns = state.idle.get(host)
+        while conns:
+            conn = conns.pop()
+            if conn.alive():
+                conn.timeout = timeout
+                return conn
+            conn.close()
+
+        return AsyncConnection(host, timeout, self.ssl_context)
+
+    def _release(self, state, host, conn, response):
+        """Return a connection to the pool once its response is read"""
+        conns = state.idle.setdefault(host, [])
+        if response.will_close or len(conns) >= self._max_idle():
+            conn.close()
+        else:
+            conns.append(conn)
+
+    async def request(self, host, method, path, body=None, headers=None,
+                      timeout=constants.HTTP_TIMEOUT):
+        """Execute HTTP request on a pooled connection
+
+        Idempotent queries failing on a reused connection closed by the
+        server are sent again once on a new connection.
+
+        :param host: Host to connect to
+        :type host: str
+        :param method: HTTP method
+        :type method: str
+        :param path: Path used by within the query
+        :type path: str
+        :param body: Payload send during the query
+        :type body: str, optional
+        :param headers: Headers to send with the query
+        :type headers: dict, optional
+        :param timeout: Timeout in seconds
+        :type timeout: int, optional
+        :return: HTTP response and its body
+        :rtype: tuple
+        """
+        state = self._state()
+        async with state.semaphore:
+            conn = self._get(state, host, timeout)
+            # A connection already opened comes from the pool
+            reused = conn.connected
+            try:
+                try:
+                    response, data = await conn.request(method, path, body,
+                                                        headers)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    if not reused or method not in IDEMPOTENT_METHODS:
+                        raise
+                    # The server closed the idle keep-alive connection,
+                    # retry once with a fresh connection. Other queries
+                    # could have been processed and are not sent again
+                    conn.close()
+                    response, data = await conn.request(method, path, body,
+                                                        headers)
+            except BaseException:
+                conn.close()
+                raise
+
+            self._release(state, host, conn, response)
+
+        return response, data
+
+    def clear(self):
+        """Close every idle connection of the running event loop"""
+        state = self._state()
+        for conns in state.idle.values():
+            for conn in conns:
+                conn.close()
+        state.idle = {}
+
+
+pool = AsyncConnectionPool()
@@ -0,0 +1,171 @@
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.aio.common import get_headers as headers
+from ibmcloud_python_sdk.aio.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.aio.common import paginate
+from ibmcloud_python_sdk.aio.common import find_resource
+from ibmcloud_python_sdk.utils.common import iaas_path
+from ibmcloud_python_sdk.utils.common import build_payload
+from ibmcloud_python_sdk.utils.common import resource_not_found
+from ibmcloud_python_sdk.utils.common import resource_deleted
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
+from ibmcloud_python_sdk.vpc.instance import instance_action_args
+
+
+class Instance():
+
+    # Names are resolved to the same IDs as the synchronous API
+    resolution_kind = "ibmcloud_python_sdk.vpc.instance.Instance"
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
+
+    async def _get(self, path):
+        return (await qw("iaas", "GET", path, await headers()))["data"]
+
+    async def get_instances(self):
+        """Retrieve instance list
+
+        :return: List of instances
+        :rtype: list
+        """
+        try:
+            # Connect to api endpoint for instances
+            path = iaas_path(self.cfg, "instances")
+
+            # Return data
+            return await self._get(path)
+
+        except Exception as error:
+            print("Error fetching instances. {}".format(error))
+            raise
+
+    def iter_instances(self, limit=None):
+        """Iterate over instances
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of instances per page
+        :type limit: int, optional
+        :return: Asynchronous generator of instances
+        :rtype: async_generator
+        """
+        path = iaas_path(self.cfg, "instances")
+
+        return paginate(self._get, path, "instances", limit)
+
+    async def get_instance(self, instance):
+        """Retrieve specific instance by name or by ID
+
+        :param instance: Instance name or ID
+        :type instance: str
+        :return: Instance information
+        :rtype: dict
+        """
+        return await find_resource(self.get_instance_by_id,
+                                   self.get_instance_by_name, instance)
+
+    async def get_instance_by_id(self, id):
+        """Retrieve specific instance by ID
+
+        :param id: Instance ID
+        :type id: str
+        :return: Instance information
+        :rtype: dict
+        """
+        try:
+            # Connect to api endpoint for instances
+            path = iaas_path(self.cfg, "instances", id)
+
+            # Return data
+            return await self._get(path)
+
+        except Exception as error:
+            print("Error fetching instance with ID {}. {}".format(id, error))
+            raise
+
+    async def get_instance_by_name(self, name):
+        """Retrieve specific instance by name
+
+        :param name: Instance name
+        :type name: str
+        :return: Instance information
+        :rtype: dict
+        """
+        try:
+            # Loop over instances until filter match
+            async for instance in self.iter_instances():
+                if "errors" in instance:
+                    return instance
+                if instance["name"] == name:
+                    # Return data
+                    return instance
+
+            # Return error if no instance is found
+            return resource_not_found()
+
+        except Exception as error:
+            print("Error fetching instance with name {}. {}".format(
+                name, error))
+            raise
+
+    @invalidate_resolution
+    async def create_instance_action(self, **kwargs):
+        """Create instance action
+
+        :param instance: The instance name or ID
+        :type instance: str
+        :param type: The type of action
+        :type type: str
+        :param force: If set to true, the action will be forced immediately,
+            and all queued actions deleted. Ignored for the start action
+        :type force: bool, optional
+        """
+        args = instance_action_args(**kwargs)
+
+        instance_info = await self.get_instance(args["instance"])
+        if "errors" in instance_info:
+            return instance_info
+
+        payload = build_payload(args)
+        del payload["instance"]
+
+        try:
+            path = iaas_path(self.cfg, "instances", instance_info["id"],
+                             "actions")
+
+            return (await qw("iaas", "POST", path, await headers(),
+                             codec.dumps(payload)))["data"]
+
+        except Exception as error:
+            print("Error creating instance action. {}".format(error))
+            raise
+
+    @invalidate_resolution
+    async def delete_instance(self, instance):
+        """Delete instance
+
+        :param instance: Instance name or ID
+        :type instance: str
+        :return: Delete status
+        :rtype: dict
+        """
+        try:
+            instance_info = await self.get_instance(instance)
+            if "errors" in instance_info:
+                return instance_info
+
+            path = iaas_path(self.cfg, "instances", instance_info["id"])
+
+            data = await qw("iaas", "DELETE", path, await headers())
+
+            if data["response"].status != 204:
+                return data["data"]
+
+            return resource_deleted()
+
+        except Exception as error:
+            print("Error deleting instance {}. {}".format(instance, error))
+            raise
@@ -0,0 +1,184 @@
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
+from ibmcloud_python_sdk.aio.common import get_headers as headers
+from ibmcloud_python_sdk.aio.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.aio.common import paginate
+from ibmcloud_python_sdk.aio.common import find_resource
+from ibmcloud_python_sdk.aio.resource import resource_group
+from ibmcloud_python_sdk.utils.common import iaas_path
+from ibmcloud_python_sdk.utils.common import build_payload
+from ibmcloud_python_sdk.utils.common import resource_not_found
+from ibmcloud_python_sdk.utils.common import resource_deleted
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
+from ibmcloud_python_sdk.vpc.key import key_args
+
+
+class Key():
+
+    # Names are resolved to the same IDs as the synchronous API
+    resolution_kind = "ibmcloud_python_sdk.vpc.key.Key"
+
+    rg = shared(resource_group.ResourceGroup)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
+
+    async def _get(self, path):
+        return (await qw("iaas", "GET", path, await headers()))["data"]
+
+    async def get_keys(self):
+        """Retrieve key list
+
+        :return: List of keys
+        :rtype: list
+        """
+        try:
+            # Connect to api endpoint for keys
+            path = iaas_path(self.cfg, "keys")
+
+            # Return data
+            return await self._get(path)
+
+        except Exception as error:
+            print("Error fetching keys. {}".format(error))
+            raise
+
+    def iter_keys(self, limit=None):
+        """Iterate over keys
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of keys per page
+        :type limit: int, optional
+        :return: Asynchronous generator of keys
+        :rtype: async_generator
+        """
+        path = iaas_path(self.cfg, "keys")
+
+        return paginate(self._get, path, "keys", limit)
+
+    async def get_key(self, key):
+        """Retrieve specific key by name or by ID
+
+        :param key: Key name or ID
+        :type key: str
+        :return: Key information
+        :rtype: dict
+        """
+        return await find_resource(self.get_key_by_id, self.get_key_by_name,
+                                   key)
+
+    async def get_key_by_id(self, id):
+        """Retrieve specific key by ID
+
+        :param id: Key ID
+        :type id: str
+        :return: Key information
+        :rtype: dict
+        """
+        try:
+            # Connect to api endpoint for keys
+            path = iaas_path(self.cfg, "keys", id)
+
+            # Return data
+            return await self._get(path)
+
+        except Exception as error:
+            print("Error fetching key with ID {}. {}".format(id, error))
+            raise
+
+    async def get_key_by_name(self, name):
+        """Retrieve specific key by name
+
+        :param name: Key name
+        :type name: str
+        :return: Key information
+        :rtype: dict
+        """
+        try:
+            # Loop over keys until filter match
+            async for key in self.iter_keys():
+                if "errors" in key:
+                    return key
+                if key["name"] == name:
+                    # Return data
+                    return key
+
+            # Return error if no key is found
+            return resource_not_found()
+
+        except Exception as error:
+            print("Error fetching key with name {}. {}".format(name, error))
+            raise
+
+    @invalidate_resolution
+    async def create_key(self, **kwargs):
+        """Create key
+
+        :param name: The unique user-defined name for this key
+        :type name: str, optional
+        :param resource_group: The resource group to use
+        :type resource_group: str, optional
+        :param public_key: A unique public SSH key to import, encoded in PEM
+            format
+        :type public_key: str
+        :param type: The cryptosystem used by this key
+        :type type: str, optional
+        """
+        # Build dict of argument and assign default value when needed
+        args = key_args(**kwargs)
+
+        # Construct payload
+        payload = build_payload(args)
+        if "resource_group" in payload:
+            rg_info = await self.rg.get_resource_group(
+                args["resource_group"])
+            if "errors" in rg_info:
+                return rg_info
+            payload["resource_group"] = {"id": rg_info["id"]}
+
+        try:
+            # Connect to api endpoint for keys
+            path = iaas_path(self.cfg, "keys")
+
+            # Return data
+            return (await qw("iaas", "POST", path, await headers(),
+                             codec.dumps(payload)))["data"]
+
+        except Exception as error:
+            print("Error creating key. {}".format(error))
+            raise
+
+    @invalidate_resolution
+    async def delete_key(self, key):
+        """Delete key
+
+        :param key: Key name or ID
+        :type key: str
+        :return: Delete status
+        :rtype: dict
+        """
+        try:
+            # Check if key exists
+            key_info = await self.get_key(key)
+            if "errors" in key_info:
+                return key_info
+
+            # Connect to api endpoint for keys
+            path = iaas_path(self.cfg, "keys", key_info["id"])
+
+            data = await qw("iaas", "DELETE", path, await headers())
+
+            # Return data
+            if data["response"].status != 204:
+                return data["data"]
+
+            # Return status
+            return resource_deleted()
+
+        except Exception as error:
+            print("Error deleting key {}. {}".format(key, error))
+            raise
@@ -0,0 +1,140 @@
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.aio.common import get_headers as headers
+from ibmcloud_python_sdk.aio.common import query_wrapper as qw
+from ibmcloud_python_sdk.aio.common import paginate
+from ibmcloud_python_sdk.aio.common import find_resource
+from ibmcloud_python_sdk.utils.common import iaas_path
+from ibmcloud_python_sdk.utils.common import resource_not_found
+from ibmcloud_python_sdk.utils.common import resource_deleted
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
+
+
+class Subnet():
+
+    # Names are resolved to the same IDs as the synchronous API
+    resolution_kind = "ibmcloud_python_sdk.vpc.subnet.Subnet"
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
+
+    async def _get(self, path):
+        return (await qw("iaas", "GET", path, await headers()))["data"]
+
+    async def get_subnets(self):
+        """Retrieve subnet list
+
+        :return: List of subnets
+        :rtype: list
+        """
+        try:
+            # Connect to api endpoint for subnets
+            path = iaas_path(self.cfg, "subnets")
+
+            # Return data
+            return await self._get(path)
+
+        except Exception as error:
+            print("Error fetching subnets. {}".format(error))
+            raise
+
+    def iter_subnets(self, limit=None):
+        """Iterate over subnets
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of subnets per page
+        :type limit: int, optional
+        :return: Asynchronous generator of subnets
+        :rtype: async_generator
+        """
+        path = iaas_path(self.cfg, "subnets")
+
+        return paginate(self._get, path, "subnets", limit)
+
+    async def get_subnet(self, subnet):
+        """Retrieve specific subnet by name or by ID
+
+        :param subnet: Subnet name or ID
+        :type subnet: str
+        :return: Subnet information
+        :rtype: dict
+        """
+        return await find_resource(self.get_subnet_by_id,
+                                   self.get_subnet_by_name, subnet)
+
+    async def get_subnet_by_id(self, id):
+        """Retrieve specific subnet by ID
+
+        :param id: Subnet ID
+        :type id: str
+        :return: Subnet information
+        :rtype: dict
+        """
+        try:
+            # Connect to api endpoint for subnets
+            path = iaas_path(self.cfg, "subnets", id)
+
+            # Return data
+            return await self._get(path)
+
+        except Exception as error:
+            print("Error fetching subnet with ID {}. {}".format(id, error))
+            raise
+
+    async def get_subnet_by_name(self, name):
+        """Retrieve specific subnet by name
+
+        :param name: Subnet name
+        :type name: str
+        :return: Subnet information
+        :rtype: dict
+        """
+        try:
+            # Loop over subnets until filter match
+            async for subnet in self.iter_subnets():
+                if "errors" in subnet:
+                    return subnet
+                if subnet["name"] == name:
+                    # Return data
+                    return subnet
+
+            # Return error if no subnet is found
+            return resource_not_found()
+
+        except Exception as error:
+            print("Error fetching subnet with name {}. {}".format(
+                name, error))
+            raise
+
+    @invalidate_resolution
+    async def delete_subnet(self, subnet):
+        """Delete subnet
+
+        :param subnet: Subnet name or ID
+        :type subnet: str
+        :return: Delete status
+        :rtype: resource_deleted()
+        """
+        # Check if subnet exists and get information
+        subnet_info = await self.get_subnet(subnet)
+        if "errors" in subnet_info:
+            return subnet_info
+
+        try:
+            # Connect to api endpoint for subnets
+            path = iaas_path(self.cfg, "subnets", subnet_info["id"])
+
+            data = await qw("iaas", "DELETE", path, await headers())
+
+            # Return data
+            if data["response"].status != 204:
+                return data["data"]
+
+            # Return status
+            return resource_deleted()
+
+        except Exception as error:
+            print("Error deleting subnet {}. {}".format(subnet, error))
+            raise
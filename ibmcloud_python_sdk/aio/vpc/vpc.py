@@ -0,0 +1,186 @@
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
+from ibmcloud_python_sdk.aio.common import get_headers as headers
+from ibmcloud_python_sdk.aio.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.aio.common import paginate
+from ibmcloud_python_sdk.aio.common import find_resource
+from ibmcloud_python_sdk.aio.resource import resource_group
+from ibmcloud_python_sdk.utils.common import iaas_path
+from ibmcloud_python_sdk.utils.common import build_payload
+from ibmcloud_python_sdk.utils.common import resource_not_found
+from ibmcloud_python_sdk.utils.common import resource_deleted
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
+from ibmcloud_python_sdk.vpc.vpc import vpc_args
+
+
+class Vpc():
+
+    # Names are resolved to the same IDs as the synchronous API
+    resolution_kind = "ibmcloud_python_sdk.vpc.vpc.Vpc"
+
+    rg = shared(resource_group.ResourceGroup)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
+
+    async def _get(self, path):
+        return (await qw("iaas", "GET", path, await headers()))["data"]
+
+    async def get_vpcs(self):
+        """Retrieve VPC list
+
+        :return: List of VPCs
+        :rtype: list
+        """
+        try:
+            # Connect to api endpoint for vpcs
+            path = iaas_path(self.cfg, "vpcs")
+
+            # Return data
+            return await self._get(path)
+
+        except Exception as error:
+            print("Error fetching VPCs. {}".format(error))
+            raise
+
+    def iter_vpcs(self, limit=None):
+        """Iterate over VPCs
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of VPCs per page
+        :type limit: int, optional
+        :return: Asynchronous generator of VPCs
+        :rtype: async_generator
+        """
+        path = iaas_path(self.cfg, "vpcs")
+
+        return paginate(self._get, path, "vpcs", limit)
+
+    async def get_vpc(self, vpc):
+        """Retrieve specific VPC by name or by ID
+
+        :param vpc: VPC name or ID
+        :type vpc: str
+        :return: VPC information
+        :rtype: dict
+        """
+        return await find_resource(self.get_vpc_by_id, self.get_vpc_by_name,
+                                   vpc)
+
+    async def get_vpc_by_id(self, id):
+        """Retrieve specific VPC by ID
+
+        :param id: VPC ID
+        :type id: str
+        :return: VPC information
+        :rtype: dict
+        """
+        try:
+            # Connect to api endpoint for vpcs
+            path = iaas_path(self.cfg, "vpcs", id)
+
+            # Return data
+            return await self._get(path)
+
+        except Exception as error:
+            print("Error fetching VPC with ID {}. {}".format(id, error))
+            raise
+
+    async def get_vpc_by_name(self, name):
+        """Retrieve specific VPC by name
+
+        :param name: VPC name
+        :type name: str
+        :return: VPC information
+        :rtype: dict
+        """
+        try:
+            # Loop over VPCs until filter match
+            async for vpc in self.iter_vpcs():
+                if "errors" in vpc:
+                    return vpc
+                if vpc["name"] == name:
+                    # Return data
+                    return vpc
+
+            # Return error if no VPC is found
+            return resource_not_found()
+
+        except Exception as error:
+            print("Error fetching VPC with name {}. {}".format(name, error))
+            raise
+
+    @invalidate_resolution
+    async def create_vpc(self, **kwargs):
+        """Create VPC (Virtual Private Cloud)
+
+        :param name: The unique user-defined name for this VPC
+        :type name: str, optional
+        :param resource_group: The resource group to use
+        :type resource_group: str, optional
+        :param address_prefix_management: Indicates whether a default address
+            prefix should be automatically created for each zone in this VPC,
+            defaults to `auto`
+        :type address_prefix_management: str, optional
+        :param classic_access: Indicates whether this VPC should be connected
+            to Classic Infrastructure, defaults to `False`
+        :type classic_access: bool, optional
+        """
+        # Build dict of argument and assign default value when needed
+        args = vpc_args(**kwargs)
+
+        # Construct payload
+        payload = build_payload(args)
+        if "resource_group" in payload:
+            rg_info = await self.rg.get_resource_group(
+                args["resource_group"])
+            if "errors" in rg_info:
+                return rg_info
+            payload["resource_group"] = {"id": rg_info["id"]}
+
+        try:
+            # Connect to api endpoint for vpcs
+            path = iaas_path(self.cfg, "vpcs")
+
+            # Return data
+            return (await qw("iaas", "POST", path, await headers(),
+                             codec.dumps(payload)))["data"]
+
+        except Exception as error:
+            print("Error creating VPC. {}".format(error))
+            raise
+
+    @invalidate_resolution
+    async def delete_vpc(self, vpc):
+        """Delete VPC
+
+        :param vpc: VPC name or ID
+        :type vpc: str
+        :return: Delete status
+        :rtype: resource_deleted()
+        """
+        # Check if VPC exists and get information
+        vpc_info = await self.get_vpc(vpc)
+        if "errors" in vpc_info:
+            return vpc_info
+
+        try:
+            # Connect to api endpoint for vpcs
+            path = iaas_path(self.cfg, "vpcs", vpc_info["id"])
+
+            data = await qw("iaas", "DELETE", path, await headers())
+
+            # Return data
+            if data["response"].status != 204:
+                return data["data"]
+
+            # Return status
+            return resource_deleted()
+
+        except Exception as error:
+            print("Error deleting VPC {}. {}".format(vpc, error))
+            raise
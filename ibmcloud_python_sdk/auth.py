@@ -1,11 +1,11 @@
+import threading
+import time
 from ibmcloud_python_sdk.utils import constants
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.utils import common
+from ibmcloud_python_sdk.utils import metrics
 from jwt import decode
 
-cfg = params()
-headers = {}
-
 
 def decode_token():
     """Decode JWT token
@@ -15,7 +15,8 @@ def decode_token():
     """
     try:
         token = get_headers()["Authorization"]
-        return decode(token.split(" ")[1], verify=False)
+        return decode(token.split(" ")[1],
+                      options={"verify_signature": False})
 
     except Exception as error:
         print("Error decoding token. {}".format(error))
@@ -44,8 +45,10 @@ def get_token(url, key):
 
     try:
         # Retrieve data
+        # Requesting a token has no side effect, it is safe to retry
         data = common.query_wrapper("auth", "POST", "/identity/token",
-                                    headers_auth, payload)["data"]
+                                    headers_auth, payload,
+                                    retry=True)["data"]
 
         # Concatenate token type and token value
         return data['token_type'] + ' ' + data['access_token']
@@ -56,18 +59,152 @@ def get_token(url, key):
         raise
 
 
+def token_expiration(token):
+    """Read the expiration time of a JWT IAM token
+
+    :param token: IAM token with its type such as "Bearer xxx"
+    :type token: string
+    :return: Expiration as an epoch timestamp, the default token lifetime
+        is used if the token cannot be decoded
+    :rtype: float
+    """
+    try:
+        jwt = decode(token.split(" ")[1],
+                     options={"verify_signature": False})
+        return float(jwt["exp"])
+
+    except Exception:
+        return time.time() + constants.TOKEN_LIFETIME
+
+
+class _Refresh():
+    """In-flight token refresh shared by every waiting caller"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.error = None
+
+
+class TokenManager():
+    """Cache the IAM token and renew it before it expires
+
+    A token entering the refresh window (``TOKEN_REFRESH_MARGIN`` seconds
+    before expiration) is still returned while a background thread renews
+    it. A token closer than ``TOKEN_EXPIRY_SKEW`` seconds to its expiration
+    is never returned, callers wait for the renewal instead. Only one
+    renewal runs at a time, concurrent callers share its result.
+    """
+
+    def __init__(self):
+        self.token = None
+        self.expires = 0
+        self.lock = threading.Lock()
+        self.refresh = None
+
+    def get(self):
+        """Retrieve a valid IAM token
+
+        :return: IAM token
+        :rtype: string
+        """
+        token, expires = self.token, self.expires
+        now = time.time()
+
+        if token and now < expires - constants.TOKEN_REFRESH_MARGIN:
+            return token
+
+        if token and now < expires - constants.TOKEN_EXPIRY_SKEW:
+            # Still usable, renew it without blocking the caller
+            self._renew(wait=False)
+            return token
+
+        return self._renew(wait=True)
+
+    def usable(self):
+        """Check if the current token can be returned without waiting
+
+        :return: True if get() will not block on a renewal
+        :rtype: bool
+        """
+        return bool(self.token
+                    and time.time() < self.expires
+                    - constants.TOKEN_EXPIRY_SKEW)
+
+    def reset(self):
+        """Forget the current token, next call will request a new one"""
+        with self.lock:
+            self.token = None
+            self.expires = 0
+
+    def _renew(self, wait):
+        """Start or join a token renewal
+
+        :param wait: Wait for the renewal to complete
+        :type wait: bool
+        :return: IAM token
+        :rtype: string
+        """
+        with self.lock:
+            refresh = self.refresh
+            owner = refresh is None
+            if owner:
+                refresh = _Refresh()
+                self.refresh = refresh
+
+        if owner:
+            if not wait:
+                threading.Thread(target=self._fetch, args=(refresh,),
+                                 daemon=True).start()
+                return self.token
+            self._fetch(refresh)
+        elif not wait:
+            return self.token
+        else:
+            refresh.done.wait()
+
+        if refresh.error is not None:
+            raise refresh.error
+
+        return self.token
+
+    def _fetch(self, refresh):
+        """Request a new token from IAM
+
+        :param refresh: Refresh to complete
+        :type refresh: _Refresh
+        """
+        try:
+            token = get_token(constants.AUTH_URL, params()["key"])
+            with self.lock:
+                self.token = token
+                self.expires = token_expiration(token)
+            metrics.TOKEN_REFRESHES.inc("success")
+
+        except Exception as error:
+            refresh.error = error
+            metrics.TOKEN_REFRESHES.inc("error")
+
+        finally:
+            with self.lock:
+                self.refresh = None
+            refresh.done.set()
+
+
+token_manager = TokenManager()
+
+
 def get_headers():
     """Generates the headers used for authenticated HTTP request.
 
+    The IAM token is managed by token_manager and renewed before it
+    expires.
+
     :return: Dict of headers
     :rtype: dict
     """
-    if not headers:
-        headers["Content-Type"] = "application/json"
-        headers["Accept"] = "application/json"
-        headers["User-Agent"] = constants.USER_AGENT
-        headers["Authorization"] = get_token(constants.AUTH_URL, cfg["key"])
-
-        return headers
-
-    return headers
+    return {
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+        "User-Agent": constants.USER_AGENT,
+        "Authorization": token_manager.get(),
+    }
@@ -1,12 +1,13 @@
-import ibm_boto3
 import re
+import time
 
 from ibmcloud_python_sdk.utils.object_regions import endpoints
 from ibmcloud_python_sdk.resource import resource_instance
 from ibmcloud_python_sdk.utils.common import resource_not_found
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
 from ibmcloud_python_sdk.auth import decode_token
-from botocore.client import Config
+from ibmcloud_python_sdk.utils import metrics
+from ibmcloud_python_sdk.utils.lazy import load
 
 
 def _get_endpoint(**kwargs):
@@ -32,6 +33,20 @@ def _get_endpoint(**kwargs):
         return resource_not_found()
 
 
+def _before_call(context, **kwargs):
+    context["ibmcloud_started"] = time.monotonic()
+
+
+def _after_call(http_response, model, context, **kwargs):
+    # Content-Length is used to not consume streamed bodies
+    started = context.get("ibmcloud_started", time.monotonic())
+    metrics.record("cos", model.http["method"], model.name,
+                   time.monotonic() - started,
+                   status=http_response.status_code,
+                   received=int(http_response.headers.get(
+                       "Content-Length") or 0))
+
+
 def cos_client(**kwargs):
     """Create Cloud Object Storage client
 
@@ -44,7 +59,8 @@ def cos_client(**kwargs):
     :return: Cloud Object Storage client
     :rtype: dict
     """
-    cfg = params()
+    session = default_session()
+    cfg = session.cfg
 
     # Build dict of argument and assign default value when needed
     args = {
@@ -53,7 +69,7 @@ def cos_client(**kwargs):
         'service_instance': kwargs.get('service_instance'),
         'account': kwargs.get('account', decode_token()['account']['bss']),
     }
-    ri = resource_instance.ResourceInstance()
+    ri = session.resource(resource_instance.ResourceInstance)
 
     try:
         # Check if endpoint exists
@@ -79,13 +95,19 @@ def cos_client(**kwargs):
                 if re.search(regex, instance['id']):
                     ri_info = instance
 
+        # ibm_boto3 and botocore are imported only when a client is created
+        ibm_boto3 = load("ibm_boto3", "cos")
+        botocore_client = load("botocore.client", "cos")
         client = ibm_boto3.client(
             's3',
             ibm_api_key_id=cfg["key"],
             ibm_service_instance_id=ri_info['id'],
-            config=Config(signature_version='oauth'),
+            config=botocore_client.Config(signature_version='oauth'),
             endpoint_url=endpoint
         )
+        # Record every operation in the metrics
+        client.meta.events.register("before-call", _before_call)
+        client.meta.events.register("after-call", _after_call)
 
         return client
 
@@ -1,7 +1,9 @@
 from ibmcloud_python_sdk.utils import softlayer as sl
 from ibmcloud_python_sdk.utils.common import resource_error
 from ibmcloud_python_sdk.utils.common import check_args
-from SoftLayer import utils as sl_utils
+from ibmcloud_python_sdk.utils.lazy import LazyModule
+
+sl_utils = LazyModule("SoftLayer.utils", "softlayer")
 
 
 class File():
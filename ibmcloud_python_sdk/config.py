@@ -1,13 +1,104 @@
 from ibmcloud_python_sdk.utils import constants
-from os import environ, path
+from os import environ, path, stat
+import threading
 import yaml
 
+# Endpoints which could be overridden in clouds.yaml or by environment
+# variables such as IC_IS_URL, e.g. "http://127.0.0.1:8080" for a local
+# stand-in API
+URL_OPTIONS = ["auth_url", "dns_url", "rg_url", "em_url", "sl_url", "is_url",
+               "pi_url"]
+
+# Environment variables that change the result of params() and sdk()
+PARAMS_ENV_VARS = ["HOME", "IC_CONFIG_FILE", "IC_CONFIG_NAME", "IC_VERSION",
+                   "IC_API_KEY", "IC_REGION", "IC_GENERATION", "SL_USERNAME",
+                   "SL_API_KEY"] + ["IC_" + name.upper()
+                                    for name in URL_OPTIONS]
+SDK_ENV_VARS = ["HOME", "IC_SDK_CONFIG_FILE"]
+
+_cache = {}
+_lock = threading.Lock()
+
+
+def _signature(config_file, env_vars):
+    """Build a signature of the configuration sources
+
+    :param config_file: Configuration file path
+    :type config_file: str
+    :param env_vars: Environment variables to watch
+    :type env_vars: list
+    :return: File modification time, size and environment values
+    :rtype: tuple
+    """
+    try:
+        info = stat(config_file)
+        file_sig = (info.st_mtime_ns, info.st_size)
+    except OSError:
+        file_sig = None
+
+    return (config_file, file_sig) + tuple(environ.get(var)
+                                           for var in env_vars)
+
+
+def _cached(name, config_file, env_vars, loader):
+    """Return configuration from cache or load it
+
+    The cached value is reused as long as the file modification time,
+    its size and the watched environment variables stay the same.
+
+    :param name: Cache entry name
+    :type name: str
+    :param config_file: Configuration file path
+    :type config_file: str
+    :param env_vars: Environment variables to watch
+    :type env_vars: list
+    :param loader: Function loading the configuration
+    :type loader: function
+    :return: Configuration
+    """
+    signature = _signature(config_file, env_vars)
+    with _lock:
+        entry = _cache.get(name)
+        if entry is None or entry[0] != signature:
+            entry = (signature, loader(config_file))
+            _cache[name] = entry
+
+    if isinstance(entry[1], dict):
+        # Callers get their own copy to keep the cached value intact
+        return dict(entry[1])
+    return entry[1]
+
+
+def clear_cache():
+    """Drop cached configuration, next call will read it again"""
+    with _lock:
+        _cache.clear()
+
 
 def params():
+    """Retrieve cloud configuration from clouds.yaml or environment
+
+    The configuration is parsed once and cached until the file or the
+    environment variables change.
+
+    :return: Cloud configuration
+    :rtype: dict
+    """
     creds = "{}/.ibmcloud/clouds.yaml".format(environ.get('HOME'))
     if "IC_CONFIG_FILE" in environ:
         creds = environ.get("IC_CONFIG_FILE")
 
+    return _cached("params", creds, PARAMS_ENV_VARS, _load_params)
+
+
+def _load_params(creds):
+    """Load cloud configuration
+
+    :param creds: clouds.yaml file path
+    :type creds: str
+    :return: Cloud configuration
+    :rtype: dict
+    """
     option = {}
     option["auth_url"] = constants.AUTH_URL
     option["dns_url"] = constants.DNS_URL
@@ -39,8 +130,10 @@ def params():
             option["cis_apikey"] = environ.get("SL_API_KEY")
         option["is_url"] = "{}.{}".format(
             environ.get("IC_REGION"), constants.IS_URL)
+        option["pi_url"] = "{}.{}".format(
+            environ.get("IC_REGION"), constants.PI_URL)
 
-        return option
+        return _override_urls(option, {})
 
     if "default" in config["clouds"]:
         cloud = config["clouds"][config["clouds"]["default"]]
@@ -60,15 +153,54 @@ def params():
     option["is_url"] = "{}.{}".format(cloud["region"], constants.IS_URL)
     option["pi_url"] = "{}.{}".format(cloud["region"], constants.PI_URL)
 
+    return _override_urls(option, cloud)
+
+
+def _override_urls(option, cloud):
+    """Apply the endpoints defined in clouds.yaml or environment
+
+    Environment variables take precedence over clouds.yaml.
+
+    :param option: Cloud configuration
+    :type option: dict
+    :param cloud: Cloud entry from clouds.yaml
+    :type cloud: dict
+    :return: Cloud configuration
+    :rtype: dict
+    """
+    for name in URL_OPTIONS:
+        value = environ.get("IC_" + name.upper()) or cloud.get(name)
+        if value:
+            option[name] = value
+
     return option
 
 
 def sdk():
+    """Retrieve SDK configuration from sdk.yaml
+
+    The configuration is parsed once and cached until the file or the
+    environment variables change.
+
+    :return: SDK configuration or False if not configured
+    :rtype: dict
+    """
     sdk_config = "{}/.ibmcloud/sdk.yaml".format(environ.get('HOME'))
-    config = None
     if "IC_SDK_CONFIG_FILE" in environ:
         sdk_config = environ.get("IC_SDK_CONFIG_FILE")
 
+    return _cached("sdk", sdk_config, SDK_ENV_VARS, _load_sdk)
+
+
+def _load_sdk(sdk_config):
+    """Load SDK configuration
+
+    :param sdk_config: sdk.yaml file path
+    :type sdk_config: str
+    :return: SDK configuration or False if not configured
+    :rtype: dict
+    """
+    config = None
     if path.isfile(sdk_config):
         with open(sdk_config, "r") as config_file:
             try:
@@ -1,7 +1,8 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
 from ibmcloud_python_sdk.resource import resource_instance
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.vpc import vpc
@@ -10,10 +11,12 @@ from ibmcloud_python_sdk.utils.common import check_args
 
 class Dns():
 
-    def __init__(self):
-        self.cfg = params()
-        self.resource_instance = resource_instance.ResourceInstance()
-        self.vpc = vpc.Vpc()
+    resource_instance = shared(resource_instance.ResourceInstance)
+    vpc = shared(vpc.Vpc)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
         # resource_group_id and self.resource_plan_id for free dns instance
         self.resource_group_id = "aef66560191746fe804b9a66874f62b1"
         self.resource_plan_id = "dc1460a6-37bd-4e2b-8180-d0f86ff39baa"
@@ -269,7 +272,7 @@ class Dns():
                             resource_instance_guid)
                         # Return data
                         return qw("dns", "POST", path, headers(),
-                                  json.dumps(payload))["data"]
+                                  codec.dumps(payload))["data"]
 
                     except Exception as error:
                         print("Error creating dns zone. {}".format(error))
@@ -382,7 +385,7 @@ class Dns():
                 resource_instance_guid, zone_id)
 
             return qw("dns", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error adding permitted network. {}".format(error))
@@ -493,7 +496,7 @@ class Dns():
                 resource_instance_guid, zone_id)
 
             return qw("dns", "POST", path, headers(),
-                      json.dumps(args['record']))["data"]
+                      codec.dumps(args['record']))["data"]
 
         except Exception as error:
             print("Error adding resource record. {}".format(error))
@@ -1,8 +1,11 @@
-import SoftLayer
-
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.lazy import LazyModule
+from ibmcloud_python_sdk.utils.softlayer import instrument
+
+# Imported when Dns is instantiated, see the softlayer extra
+SoftLayer = LazyModule("SoftLayer", "softlayer")
 
 
 class Dns():
@@ -11,9 +14,9 @@ class Dns():
 
     def __init__(self):
         self.cfg = params()
-        self.client = SoftLayer.create_client_from_env(
+        self.client = instrument(SoftLayer.create_client_from_env(
             username=self.cfg['cis_username'],
-            api_key=self.cfg['cis_apikey'])
+            api_key=self.cfg['cis_apikey']))
         self.dns = SoftLayer.DNSManager(self.client)
 
     def create_zone(self, zone, serial=None):
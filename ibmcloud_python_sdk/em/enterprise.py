@@ -1,12 +1,13 @@
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
 
 
 class Enterprise():
 
-    def __init__(self):
-        self.cfg = params()
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_enterprises(self):
         """Retrieve enterprise list
@@ -0,0 +1,889 @@
+import argparse
+import ipaddress
+import json
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from itertools import islice
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import jwt
+
+# Account of the tokens and CRNs issued by the emulator
+ACCOUNT = "0123456789abcdef0123456789abcdef"
+REGION = "us-south"
+
+# Default number of resources per page and the largest one accepted
+PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 100
+
+# References between resources: collection -> (field, target collection,
+# on delete). A "restrict" reference prevents the deletion of its target,
+# a "release" one is removed when its target is deleted. Fields ending
+# with [] are lists of references.
+REFERENCES = {
+    "subnets": (("vpc", "vpcs", "restrict"),
+                ("network_acl", "network_acls", "restrict"),
+                ("public_gateway", "public_gateways", "restrict")),
+    "security_groups": (("vpc", "vpcs", "restrict"),),
+    "network_acls": (("vpc", "vpcs", "restrict"),),
+    "public_gateways": (("vpc", "vpcs", "restrict"),
+                        ("floating_ip", "floating_ips", "restrict")),
+    "instances": (("vpc", "vpcs", "restrict"),
+                  ("image", "images", "restrict"),
+                  ("keys[]", "keys", "restrict")),
+    "network_interfaces": (("subnet", "subnets", "restrict"),
+                           ("security_groups[]", "security_groups",
+                            "restrict")),
+    "volume_attachments": (("volume", "volumes", "restrict"),),
+    "floating_ips": (("target", "network_interfaces", "release"),),
+    "load_balancers": (("subnets[]", "subnets", "restrict"),
+                       ("security_groups[]", "security_groups",
+                        "restrict")),
+    "listeners": (("default_pool", "pools", "restrict"),),
+    "vpn_gateways": (("subnet", "subnets", "restrict"),),
+    "connections": (("ike_policy", "ike_policies", "restrict"),
+                    ("ipsec_policy", "ipsec_policies", "restrict")),
+}
+
+# Fields required to create a resource
+REQUIRED = {
+    "subnets": ("vpc",),
+    "security_groups": ("vpc",),
+    "network_acls": ("vpc",),
+    "public_gateways": ("vpc",),
+    "instances": ("primary_network_interface",),
+    "network_interfaces": ("subnet",),
+    "load_balancers": ("subnets",),
+    "vpn_gateways": ("subnet",),
+}
+
+# Lists of a creation payload stored as sub-collections
+CHILDREN = {
+    "instances": ("network_interfaces", "volume_attachments"),
+    "security_groups": ("rules",),
+    "network_acls": ("rules",),
+    "load_balancers": ("listeners", "pools"),
+    "listeners": ("policies",),
+    "policies": ("rules",),
+    "pools": ("members",),
+}
+
+# Fields set on creation
+DEFAULTS = {
+    "instances": {"status": "running"},
+    "network_interfaces": {"status": "available", "type": "secondary"},
+    "load_balancers": {"provisioning_status": "active",
+                       "operating_status": "online"},
+    "listeners": {"provisioning_status": "active"},
+    "pools": {"provisioning_status": "active"},
+    "members": {"provisioning_status": "active", "health": "ok"},
+    "vpn_gateways": {"status": "available"},
+    "connections": {"status": "up"},
+}
+
+# Collections deleted asynchronously by the API
+ASYNC_DELETE = ("images", "vpn_gateways", "connections")
+
+# Stock images available on every emulator
+IMAGES = ("ibm-ubuntu-22-04-minimal-amd64-1",
+          "ibm-centos-stream-9-amd64-1",
+          "ibm-windows-server-2022-full-standard-amd64-1")
+
+
+class ApiError(Exception):
+    """Error answered by the emulator
+
+    :param status: HTTP status
+    :type status: int
+    :param code: Error code such as "not_found"
+    :type code: str
+    :param message: Error message
+    :type message: str
+    """
+
+    def __init__(self, status, code, message):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+    def data(self):
+        return {"errors": [{"code": self.code, "message": self.message}],
+                "trace": str(uuid.uuid4())}
+
+
+def _locate(value, path):
+    """Find the references at a dotted path
+
+    :param value: Resource or part of it
+    :type value: dict
+    :param path: Path such as "vpc", "keys[]" or "subnet.vpc"
+    :type path: str
+    :return: Generator of (container, key) holding a reference
+    :rtype: generator
+    """
+    key, _, rest = path.partition(".")
+    many = key.endswith("[]")
+    if many:
+        key = key[:-2]
+    if not isinstance(value, dict) or value.get(key) is None:
+        return
+
+    container, keys = value, (key,)
+    if many:
+        container = value[key]
+        keys = range(len(container)) if isinstance(container, list) else ()
+
+    for index in keys:
+        if rest:
+            yield from _locate(container[index], rest)
+        elif isinstance(container[index], dict) and \
+                "id" in container[index]:
+            yield container, index
+
+
+def _singular(name):
+    if name.endswith("ies"):
+        return name[:-3] + "y"
+
+    return name[:-1] if name.endswith("s") else name
+
+
+class VpcEmulator():
+    """In-memory emulator of the VPC API
+
+    Resources are kept in memory and served over HTTP, the SDK is pointed
+    at the emulator with the ``is_url`` option of ``clouds.yaml`` or the
+    ``IC_IS_URL`` environment variable. Every ``/v1`` collection and
+    sub-collection is supported, references between resources are checked
+    on creation and a referenced resource could not be deleted. Creating a
+    VPC creates its default security group and network ACL, creating an
+    instance creates its network interfaces.
+
+    IAM tokens (``/identity/token``) and a default resource group
+    (``/v2/resource_groups``) are served as well so ``auth_url`` and
+    ``rg_url`` could target the emulator.
+
+    :param latency: Delay of each response in seconds
+    :type latency: float, optional
+    :param throttle: Ratio of VPC queries answered with a 429
+    :type throttle: float, optional
+    :param rate_limit: VPC queries per second above which a 429 is
+        answered
+    :type rate_limit: float, optional
+    :param retry_after: Retry-After header sent with the 429
+    :type retry_after: int, optional
+    :param seed: Seed of the throttling
+    :type seed: int, optional
+    """
+
+    def __init__(self, latency=0, throttle=0, rate_limit=None,
+                 retry_after=None, seed=None):
+        self.latency = latency
+        self.throttle = throttle
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.url = "http://127.0.0.1"
+        self.server = None
+        self.lock = threading.RLock()
+        self.throttle_lock = threading.Lock()
+        self.tokens = rate_limit or 0
+        self.refilled = time.monotonic()
+        # Number of VPC queries received and answered with a 429
+        self.requests = 0
+        self.throttled = 0
+        self.reset()
+
+    def reset(self):
+        """Remove every resource"""
+        with self.lock:
+            # (parent ID, collection) -> {ID: resource}
+            self.collections = {}
+            # (parent ID, collection) -> {name: ID}
+            self.names = {}
+            # ID -> (resource, collection, parent ID)
+            self.index = {}
+            # ID -> [(target ID, field, on delete)]
+            self.references = {}
+            # Target ID -> {(referrer ID, field, on delete)}
+            self.referrers = {}
+            # Parent ID -> sub-collection names
+            self.subcollections = {}
+            # ID -> IDs deleted with it, such as the defaults of a VPC
+            self.owned = {}
+            self.subnet_ips = {}
+            self.counter = 0
+            self.resource_group = {
+                "id": uuid.uuid4().hex, "name": "default",
+                "account_id": ACCOUNT, "state": "ACTIVE", "default": True,
+            }
+            for image in IMAGES:
+                self.add("images", name=image, visibility="public",
+                         operating_system={"name": image.rsplit("-", 1)[0]})
+
+    def add(self, collection, **fields):
+        """Create a top-level resource, such as an image or a key
+
+        :param collection: Collection name such as "images"
+        :type collection: str
+        :return: Resource
+        :rtype: dict
+        """
+        with self.lock:
+            return self._create(None, collection, fields)
+
+    def start(self, port=0):
+        """Serve the emulator in a background thread
+
+        :param port: Listening port, a free one is used by default
+        :type port: int, optional
+        :return: URL of the emulator, such as "http://127.0.0.1:8080"
+        :rtype: str
+        """
+        self.server = _Server(("127.0.0.1", port), _Handler)
+        self.server.emulator = self
+        self._rebase("http://127.0.0.1:{}".format(
+            self.server.server_address[1]))
+        thread = threading.Thread(target=self.server.serve_forever,
+                                  daemon=True)
+        thread.start()
+
+        return self.url
+
+    def _rebase(self, url):
+        """Change the URL of the emulator in the resource links"""
+        with self.lock:
+            old, self.url = '"{}/v1/'.format(self.url), url
+            new = '"{}/v1/'.format(url)
+            for resource, _, _ in self.index.values():
+                rebased = json.loads(json.dumps(resource).replace(old, new))
+                resource.clear()
+                resource.update(rebased)
+
+    def stop(self):
+        """Stop serving the emulator"""
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def handle(self, method, path, body=None):
+        """Answer a query
+
+        :param method: HTTP method
+        :type method: str
+        :param path: Path with its query string
+        :type path: str
+        :param body: Request body
+        :type body: bytes, optional
+        :return: Status, headers and body
+        :rtype: tuple
+        """
+        if self.latency:
+            time.sleep(self.latency)
+
+        link = urlsplit(path)
+        segments = [unquote(segment) for segment
+                    in link.path.strip("/").split("/")]
+        query = dict(parse_qsl(link.query))
+        headers = {}
+        try:
+            payload = {}
+            if segments[0] == "v1":
+                if self._throttled():
+                    if self.retry_after is not None:
+                        headers["Retry-After"] = str(self.retry_after)
+                    raise ApiError(429, "too_many_requests",
+                                   "Rate limit exceeded")
+                try:
+                    payload = json.loads(body) if body else {}
+                except ValueError:
+                    raise ApiError(400, "bad_request", "Invalid JSON body")
+
+            with self.lock:
+                status, data = self._dispatch(method, segments, query,
+                                              payload)
+                body = json.dumps(data).encode("utf-8") \
+                    if data is not None else b""
+        except ApiError as error:
+            status = error.status
+            body = json.dumps(error.data()).encode("utf-8")
+
+        if body:
+            headers["Content-Type"] = "application/json"
+
+        return status, headers, body
+
+    def _throttled(self):
+        with self.throttle_lock:
+            self.requests += 1
+            throttled = bool(self.throttle) and \
+                self.random.random() < self.throttle
+            if not throttled and self.rate_limit:
+                now = time.monotonic()
+                self.tokens = min(self.rate_limit, self.tokens +
+                                  (now - self.refilled) * self.rate_limit)
+                self.refilled = now
+                throttled = self.tokens < 1
+                if not throttled:
+                    self.tokens -= 1
+            if throttled:
+                self.throttled += 1
+
+        return throttled
+
+    def _dispatch(self, method, segments, query, payload):
+        if segments == ["identity", "token"] and method == "POST":
+            return 200, self._token()
+        if segments[:2] == ["v2", "resource_groups"] and method == "GET":
+            if len(segments) == 2:
+                return 200, {"resources": [self.resource_group]}
+            if segments[2:] == [self.resource_group["id"]]:
+                return 200, self.resource_group
+            raise ApiError(404, "not_found", "Resource group not found")
+        if segments[0] != "v1" or len(segments) < 2:
+            raise ApiError(404, "not_found", "Path not found")
+
+        parent = None
+        segments = segments[1:]
+        while True:
+            name, rest = segments[0], segments[1:]
+            if parent is not None:
+                special = SPECIAL.get((self.index[parent["id"]][1], name))
+                if special is not None:
+                    return special(self, method, parent, name, rest,
+                                   payload)
+
+            if not rest:
+                if method == "GET":
+                    return 200, self._list(parent, name, query)
+                if method == "POST":
+                    return 201, self._create(parent, name, payload)
+                raise ApiError(405, "method_not_allowed",
+                               "Method not allowed")
+
+            resource = self._get(parent, name, rest[0])
+            if len(rest) == 1:
+                if method == "GET":
+                    return 200, resource
+                if method == "PATCH":
+                    return 200, self._update(resource, payload)
+                if method == "DELETE":
+                    self._delete(resource)
+                    return (202 if name in ASYNC_DELETE else 204), None
+                raise ApiError(405, "method_not_allowed",
+                               "Method not allowed")
+
+            parent, segments = resource, rest[1:]
+
+    def _token(self):
+        now = int(time.time())
+        token = jwt.encode({"iat": now, "exp": now + 3600,
+                            "account": {"bss": ACCOUNT}}, "emulator" * 4,
+                           algorithm="HS256")
+        if isinstance(token, bytes):
+            token = token.decode("utf-8")
+
+        return {"access_token": token, "token_type": "Bearer",
+                "expires_in": 3600}
+
+    def _get(self, parent, name, id):
+        parent_id = parent["id"] if parent else None
+        resource = self.collections.get((parent_id, name), {}).get(id)
+        if resource is None:
+            raise ApiError(404, "not_found", "{} {} not found".format(
+                _singular(name).capitalize(), id))
+
+        return resource
+
+    def _list(self, parent, name, query):
+        parent_id = parent["id"] if parent else None
+        collection = self.collections.get((parent_id, name), {})
+        try:
+            limit = min(int(query.get("limit", PAGE_LIMIT)), MAX_PAGE_LIMIT)
+            start = int(query.get("start", 0))
+        except ValueError:
+            raise ApiError(400, "bad_request", "Invalid limit or start")
+
+        href = "{}/{}".format(parent["href"], name) if parent else \
+            "{}/v1/{}".format(self.url, name)
+        data = {name: list(islice(collection.values(), start, start + limit)),
+                "limit": limit, "total_count": len(collection),
+                "first": {"href": "{}?limit={}".format(href, limit)}}
+        if start + limit < len(collection):
+            data["next"] = {"href": "{}?start={}&limit={}".format(
+                href, start + limit, limit)}
+
+        return data
+
+    def _reference(self, id):
+        resource = self.index[id][0]
+        reference = {"id": id, "href": resource["href"]}
+        for key in ("crn", "name", "primary_ipv4_address", "address"):
+            if key in resource:
+                reference[key] = resource[key]
+
+        return reference
+
+    def _resolve(self, name, resource):
+        """Check the references of a resource and expand them
+
+        :return: References as (target ID, field, on delete)
+        :rtype: list
+        """
+        references = []
+        for field, target, on_delete in REFERENCES.get(name, ()):
+            for container, key in list(_locate(resource, field)):
+                id = container[key]["id"]
+                entry = self.index.get(id)
+                if entry is None or entry[1] != target:
+                    raise ApiError(404, "not_found", "{} {} not found".format(
+                        _singular(target).capitalize(), id))
+                container[key] = self._reference(id)
+                references.append((id, field, on_delete))
+
+        return references
+
+    def _link(self, id, references):
+        self.references[id] = references
+        for target, field, on_delete in references:
+            self.referrers.setdefault(target, set()).add(
+                (id, field, on_delete))
+
+    def _unlink(self, id):
+        for target, field, on_delete in self.references.pop(id, ()):
+            self.referrers.get(target, set()).discard(
+                (id, field, on_delete))
+
+    def _check_name(self, key, name, id=None):
+        current = self.names.get(key, {}).get(name)
+        if current is not None and current != id:
+            raise ApiError(409, "validation_unique_failed",
+                           "Name {} is already used".format(name))
+
+    def _create(self, parent, name, payload, owner=None):
+        for field in REQUIRED.get(name, ()):
+            if not payload.get(field):
+                raise ApiError(400, "missing_field",
+                               "Missing required field {}".format(field))
+
+        parent_id = parent["id"] if parent else None
+        key = (parent_id, name)
+        resource = dict(payload)
+        children = [(field, resource.pop(field)) for field
+                    in CHILDREN.get(name, ())
+                    if isinstance(resource.get(field), list)]
+        primary = resource.pop("primary_network_interface", None) \
+            if name == "instances" else None
+
+        self.counter += 1
+        id = "r006-{}".format(uuid.uuid4())
+        resource.setdefault("name", "{}-{}".format(
+            _singular(name).replace("_", "-"), self.counter))
+        self._check_name(key, resource["name"])
+        resource.update(id=id, created_at=datetime.now(
+            timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
+        resource["href"] = "{}/{}/{}".format(parent["href"], name, id) \
+            if parent else "{}/v1/{}/{}".format(self.url, name, id)
+        if parent is None:
+            resource["crn"] = "crn:v1:bluemix:public:is:{}:a/{}::{}:{}".format(
+                REGION, ACCOUNT, _singular(name).replace("_", "-"), id)
+            resource.setdefault("status", "available")
+        for field, value in DEFAULTS.get(name, {}).items():
+            resource.setdefault(field, value)
+
+        prepare = PREPARE.get(name)
+        if prepare is not None:
+            prepare(self, resource, primary)
+        references = self._resolve(name, resource)
+
+        self.collections.setdefault(key, {})[id] = resource
+        self.names.setdefault(key, {})[resource["name"]] = id
+        self.index[id] = (resource, name, parent_id)
+        self._link(id, references)
+        if parent_id is not None:
+            self.subcollections.setdefault(parent_id, set()).add(name)
+        if owner is not None:
+            self.owned.setdefault(owner, []).append(id)
+
+        try:
+            created = CREATED.get(name)
+            if created is not None:
+                created(self, resource, primary)
+            for field, items in children:
+                resource[field] = resource.get(field, []) + [
+                    self._reference(self._create(resource, field, item)["id"])
+                    for item in items]
+        except ApiError:
+            # Children are invalid, the resource is not created
+            self._delete(resource)
+            raise
+
+        return resource
+
+    def _update(self, resource, payload):
+        id = resource["id"]
+        _, name, parent_id = self.index[id]
+        candidate = dict(resource)
+        candidate.update((field, value) for field, value in payload.items()
+                         if field not in ("id", "href", "crn", "created_at"))
+        if candidate["name"] != resource["name"]:
+            self._check_name((parent_id, name), candidate["name"], id)
+        references = self._resolve(name, candidate)
+
+        names = self.names.setdefault((parent_id, name), {})
+        names.pop(resource["name"], None)
+        names[candidate["name"]] = id
+        self._unlink(id)
+        self._link(id, references)
+        resource.clear()
+        resource.update(candidate)
+
+        return resource
+
+    def _descendants(self, id):
+        ids = [id]
+        for name in self.subcollections.get(id, ()):
+            for child in list(self.collections.get((id, name), {})):
+                ids.extend(self._descendants(child))
+        for owned in self.owned.get(id, ()):
+            if owned in self.index:
+                ids.extend(self._descendants(owned))
+
+        return ids
+
+    def _delete(self, resource):
+        doomed = self._descendants(resource["id"])
+        removed = set(doomed)
+        released = []
+        for id in doomed:
+            for referrer, field, on_delete in self.referrers.get(id, ()):
+                if referrer in removed:
+                    continue
+                if on_delete == "restrict":
+                    raise ApiError(409, "conflict", "{} {} is used by {} {}"
+                                   .format(_singular(self.index[id][1]), id,
+                                           _singular(self.index[referrer][1]),
+                                           referrer))
+                released.append((referrer, id, field))
+
+        for referrer, id, field in released:
+            self._release(referrer, id, field)
+        for id in reversed(doomed):
+            item, name, parent_id = self.index.pop(id)
+            del self.collections[(parent_id, name)][id]
+            self.names[(parent_id, name)].pop(item["name"], None)
+            self._unlink(id)
+            self.referrers.pop(id, None)
+            self.subcollections.pop(id, None)
+            self.owned.pop(id, None)
+            self.subnet_ips.pop(id, None)
+
+    def _release(self, referrer, id, field):
+        resource = self.index[referrer][0]
+        for container, key in list(_locate(resource, field)):
+            if container[key]["id"] == id:
+                if isinstance(container, list):
+                    container.remove(container[key])
+                else:
+                    del container[key]
+        self.references[referrer] = [
+            reference for reference in self.references[referrer]
+            if reference[:2] != (id, field)]
+        self.referrers[id] = set(
+            entry for entry in self.referrers.get(id, ())
+            if entry[:2] != (referrer, field))
+
+    # Side effects of the creation of some resources
+
+    def _prepare_subnet(self, subnet, primary):
+        if "ipv4_cidr_block" not in subnet:
+            subnet["ipv4_cidr_block"] = "10.{}.{}.0/24".format(
+                self.counter >> 8 & 255, self.counter & 255)
+        network = ipaddress.ip_network(subnet["ipv4_cidr_block"],
+                                       strict=False)
+        subnet["total_ipv4_address_count"] = network.num_addresses
+        subnet["available_ipv4_address_count"] = network.num_addresses - 5
+        if "network_acl" not in subnet:
+            vpc = self.index.get(subnet["vpc"].get("id"))
+            if vpc is not None and "default_network_acl" in vpc[0]:
+                subnet["network_acl"] = {
+                    "id": vpc[0]["default_network_acl"]["id"]}
+
+    def _prepare_instance(self, instance, primary):
+        subnet = self.index.get((primary.get("subnet") or {}).get("id"))
+        if "vpc" not in instance and subnet is not None:
+            instance["vpc"] = {"id": subnet[0]["vpc"]["id"]}
+
+    def _prepare_interface(self, interface, primary):
+        subnet = self.index.get(interface["subnet"].get("id"))
+        if subnet is None or subnet[1] != "subnets":
+            return
+        if "security_groups" not in interface:
+            vpc = self.index[subnet[0]["vpc"]["id"]][0]
+            interface["security_groups"] = [
+                {"id": vpc["default_security_group"]["id"]}]
+        if "primary_ipv4_address" not in interface:
+            network = ipaddress.ip_network(subnet[0]["ipv4_cidr_block"],
+                                           strict=False)
+            used = self.subnet_ips.get(subnet[0]["id"], 0)
+            if used >= network.num_addresses - 5:
+                raise ApiError(409, "subnet_full", "No address left in "
+                               "subnet {}".format(subnet[0]["id"]))
+            self.subnet_ips[subnet[0]["id"]] = used + 1
+            subnet[0]["available_ipv4_address_count"] -= 1
+            interface["primary_ipv4_address"] = str(network[4 + used])
+
+    def _prepare_floating_ip(self, fip, primary):
+        fip.setdefault("address", "169.48.{}.{}".format(
+            self.counter >> 8 & 255, self.counter & 255))
+        fip["zone"] = fip.get("zone") or {"name": REGION + "-1"}
+
+    def _created_vpc(self, vpc, primary):
+        for field, collection in (("default_security_group",
+                                   "security_groups"),
+                                  ("default_network_acl", "network_acls")):
+            default = self._create(None, collection, {
+                "name": "{}-{}".format(vpc["name"], field.replace("_", "-")),
+                "vpc": {"id": vpc["id"]}}, owner=vpc["id"])
+            vpc[field] = self._reference(default["id"])
+
+    def _created_instance(self, instance, primary):
+        primary = dict(primary)
+        primary.setdefault("name", "eth0")
+        primary["type"] = "primary"
+        interface = self._create(instance, "network_interfaces", primary)
+        instance["primary_network_interface"] = self._reference(
+            interface["id"])
+        instance["primary_network_interface"]["subnet"] = interface["subnet"]
+        instance["network_interfaces"] = [
+            instance["primary_network_interface"]]
+
+    # Endpoints other than collections
+
+    def _attachment(self, method, parent, name, rest, payload):
+        """VPC defaults, subnet public gateway and network ACL"""
+        if rest:
+            raise ApiError(404, "not_found", "Path not found")
+        if method == "GET":
+            if name not in parent:
+                raise ApiError(404, "not_found", "No {} attached".format(
+                    name.replace("_", " ")))
+            return 200, self.index[parent[name]["id"]][0]
+        if method == "PUT" and not name.startswith("default_"):
+            self._update(parent, {name: {"id": payload.get("id")}})
+            return 201, self.index[parent[name]["id"]][0]
+        if method == "DELETE" and name == "public_gateway":
+            if name not in parent:
+                raise ApiError(404, "not_found", "No public gateway "
+                               "attached")
+            self._release(parent["id"], parent[name]["id"], name)
+            return 204, None
+
+        raise ApiError(405, "method_not_allowed", "Method not allowed")
+
+    def _floating_ips(self, method, parent, name, rest, payload):
+        """Floating IPs bound to an instance network interface"""
+        bound = [self.index[referrer][0] for referrer, field, _
+                 in self.referrers.get(parent["id"], ())
+                 if field == "target"]
+        if not rest:
+            if method != "GET":
+                raise ApiError(405, "method_not_allowed",
+                               "Method not allowed")
+            return 200, {"floating_ips": bound}
+
+        fip = self._get(None, "floating_ips", rest[0])
+        if method == "GET":
+            if fip not in bound:
+                raise ApiError(404, "not_found", "Floating IP not bound")
+            return 200, fip
+        if method == "PUT":
+            return 201, self._update(fip, {"target": {"id": parent["id"]}})
+        if method == "DELETE":
+            if fip not in bound:
+                raise ApiError(404, "not_found", "Floating IP not bound")
+            self._release(fip["id"], parent["id"], "target")
+            return 204, None
+
+        raise ApiError(405, "method_not_allowed", "Method not allowed")
+
+    def _targets(self, method, parent, name, rest, payload):
+        """Network interfaces and load balancers of a security group"""
+        targets = [self.index[referrer][0] for referrer, field, _
+                   in self.referrers.get(parent["id"], ())
+                   if field == "security_groups[]"]
+        if not rest:
+            if method != "GET":
+                raise ApiError(405, "method_not_allowed",
+                               "Method not allowed")
+            return 200, {"targets": [self._reference(target["id"])
+                                     for target in targets]}
+
+        entry = self.index.get(rest[0])
+        if entry is None or entry[1] not in ("network_interfaces",
+                                             "load_balancers"):
+            raise ApiError(404, "not_found", "Target {} not found".format(
+                rest[0]))
+        target = entry[0]
+        groups = [group for group in target.get("security_groups", [])
+                  if group["id"] != parent["id"]]
+        if method == "GET":
+            if target not in targets:
+                raise ApiError(404, "not_found", "Target not attached")
+            return 200, self._reference(target["id"])
+        if method == "PUT":
+            self._update(target, {"security_groups": groups + [
+                {"id": parent["id"]}]})
+            return 201, self._reference(target["id"])
+        if method == "DELETE":
+            if target not in targets:
+                raise ApiError(404, "not_found", "Target not attached")
+            self._update(target, {"security_groups": groups})
+            return 204, None
+
+        raise ApiError(405, "method_not_allowed", "Method not allowed")
+
+    def _cidrs(self, method, parent, name, rest, payload):
+        """Local and peer CIDRs of a VPN connection"""
+        cidrs = parent.setdefault(name, [])
+        if not rest:
+            if method != "GET":
+                raise ApiError(405, "method_not_allowed",
+                               "Method not allowed")
+            return 200, {name: cidrs}
+
+        cidr = "/".join(rest)
+        if method == "GET":
+            if cidr not in cidrs:
+                raise ApiError(404, "not_found", "CIDR {} not found".format(
+                    cidr))
+        elif method == "PUT":
+            if cidr not in cidrs:
+                cidrs.append(cidr)
+        elif method == "DELETE":
+            if cidr not in cidrs:
+                raise ApiError(404, "not_found", "CIDR {} not found".format(
+                    cidr))
+            cidrs.remove(cidr)
+        else:
+            raise ApiError(405, "method_not_allowed", "Method not allowed")
+
+        return 204, None
+
+    def _actions(self, method, parent, name, rest, payload):
+        """Instance start, stop and reboot"""
+        states = {"start": "running", "stop": "stopped", "reboot": "running"}
+        if method != "POST" or rest or payload.get("type") not in states:
+            raise ApiError(400, "bad_request", "Invalid instance action")
+
+        parent["status"] = states[payload["type"]]
+        return 201, {"id": "r006-{}".format(uuid.uuid4()),
+                     "type": payload["type"], "status": "completed",
+                     "force": bool(payload.get("force"))}
+
+    def _initialization(self, method, parent, name, rest, payload):
+        return 200, {"keys": parent.get("keys", []), "user_accounts": []}
+
+    def _statistics(self, method, parent, name, rest, payload):
+        return 200, {"active_connections": 0, "connection_rate": 0,
+                     "data_processed_this_month": 0, "throughput": 0}
+
+
+PREPARE = {
+    "subnets": VpcEmulator._prepare_subnet,
+    "instances": VpcEmulator._prepare_instance,
+    "network_interfaces": VpcEmulator._prepare_interface,
+    "floating_ips": VpcEmulator._prepare_floating_ip,
+}
+
+CREATED = {
+    "vpcs": VpcEmulator._created_vpc,
+    "instances": VpcEmulator._created_instance,
+}
+
+# (collection, path segment) -> endpoints other than sub-collections
+SPECIAL = {
+    ("vpcs", "default_security_group"): VpcEmulator._attachment,
+    ("vpcs", "default_network_acl"): VpcEmulator._attachment,
+    ("subnets", "public_gateway"): VpcEmulator._attachment,
+    ("subnets", "network_acl"): VpcEmulator._attachment,
+    ("network_interfaces", "floating_ips"): VpcEmulator._floating_ips,
+    ("security_groups", "targets"): VpcEmulator._targets,
+    ("connections", "local_cidrs"): VpcEmulator._cidrs,
+    ("connections", "peer_cidrs"): VpcEmulator._cidrs,
+    ("instances", "actions"): VpcEmulator._actions,
+    ("instances", "initialization"): VpcEmulator._initialization,
+    ("load_balancers", "statistics"): VpcEmulator._statistics,
+}
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, without TCP_NODELAY the
+    # delayed ACK of the client adds 40ms to small responses
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _answer(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        status, headers, body = self.server.emulator.handle(
+            self.command, self.path, body)
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _answer
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="In-memory emulator of the VPC API")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0,
+                        help="delay of each response in milliseconds")
+    parser.add_argument("--throttle", type=float, default=0,
+                        help="ratio of queries answered with a 429")
+    parser.add_argument("--rate-limit", type=float,
+                        help="queries per second above which a 429 is "
+                             "answered")
+    parser.add_argument("--retry-after", type=int,
+                        help="Retry-After header sent with the 429")
+    args = parser.parse_args()
+
+    emulator = VpcEmulator(args.latency / 1000, args.throttle,
+                           args.rate_limit, args.retry_after)
+    print("Serving VPC API on {}".format(emulator.start(args.port)),
+          flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        emulator.stop()
+
+
+if __name__ == "__main__":
+    main()
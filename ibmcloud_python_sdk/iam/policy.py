@@ -1,17 +1,19 @@
-import json
-
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.resource import resource_instance
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
 from ibmcloud_python_sdk.utils.common import resource_deleted
 
 
 class Policy():
 
-    def __init__(self):
-        self.cfg = params()
-        self.ri = resource_instance.ResourceInstance()
+    ri = shared(resource_instance.ResourceInstance)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_policies(self, account):
         """Retrieve policy list per account
@@ -199,7 +201,7 @@ class Policy():
 
             # Return data
             return qw("auth", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating policy. {}".format(error))
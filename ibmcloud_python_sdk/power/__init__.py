@@ -1,12 +1,10 @@
 import re
 from ibmcloud_python_sdk.utils import constants
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
 from ibmcloud_python_sdk.auth import decode_token
 from ibmcloud_python_sdk.resource import resource_instance
-from ibmcloud_python_sdk.auth import get_token
+from ibmcloud_python_sdk.auth import token_manager
 
-cfg = params()
-ri = resource_instance.ResourceInstance()
 power_headers = {}
 
 
@@ -24,19 +22,24 @@ def get_power_headers(**kwargs):
     """
     # Build dict of argument and assign default value when needed
     args = {
-        'region': kwargs.get('region', cfg["region"]),
-        'account': kwargs.get('account', decode_token()['account']['bss']),
+        'region': kwargs.get('region'),
+        'account': kwargs.get('account'),
         'instance': kwargs.get('instance'),
     }
 
     ri_info = None
     if not power_headers:
+        ri = default_session().resource(resource_instance.ResourceInstance)
         if args['instance']:
             ri_info = ri.get_resource_instance(args['instance'])
         else:
+            # Defaults are only needed to look for the CRN, the token is
+            # not decoded on every call
+            region = args['region'] or default_session().cfg["region"]
+            account = args['account'] or decode_token()['account']['bss']
             # Automatically detect if power-iaas service exists.
             regex = "crn:v1:bluemix:public:power-iaas:{}:a/{}".format(
-                args['region'], args['account'])
+                region, account)
             data = ri.get_resource_instances()
             for instance in data['resources']:
                 if re.search(regex, instance['id']):
@@ -45,15 +48,14 @@ def get_power_headers(**kwargs):
         # Return empty headers if resource instance doesn't exist which will
         # result to a 401.
         if not ri_info:
-            return power_headers
+            return {}
 
         power_headers["Content-Type"] = "application/json"
         power_headers["Accept"] = "application/json"
         power_headers["User-Agent"] = constants.USER_AGENT
-        power_headers["Authorization"] = get_token(
-            constants.AUTH_URL, cfg["key"])
         power_headers['CRN'] = ri_info
 
-        return power_headers
-
-    return power_headers
+    # The CRN is resolved once, the IAM token is renewed when required
+    headers = dict(power_headers)
+    headers["Authorization"] = token_manager.get()
+    return headers
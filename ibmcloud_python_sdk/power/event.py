@@ -1,4 +1,5 @@
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
 from ibmcloud_python_sdk.power import get_power_headers as headers
 from ibmcloud_python_sdk.power import instance
@@ -6,9 +7,11 @@ from ibmcloud_python_sdk.power import instance
 
 class Event():
 
-    def __init__(self):
-        self.cfg = params()
-        self.instance = instance.Instance()
+    instance = shared(instance.Instance)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_events(self, instance, time):
         """Retrieve event list from a timestamp for a specific cloud instance
@@ -1,18 +1,23 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 from ibmcloud_python_sdk.power import get_power_headers as headers
 from ibmcloud_python_sdk.power import instance
 
 
 class Image():
 
-    def __init__(self):
-        self.cfg = params()
-        self.instance = instance.Instance()
+    instance = shared(instance.Instance)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_images(self):
         """Retrieve image list
@@ -38,18 +43,8 @@ class Image():
         :return: Image information
         :rtype: dict
         """
-        by_name = self.get_image_by_name(image)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_image_by_id(image)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_image_by_id, self.get_image_by_name,
+                             image, id_key="imageID")
 
     def get_image_by_id(self, id):
         """Retrieve specific image by ID
@@ -129,18 +124,9 @@ class Image():
         :return: Image information
         :rtype: dict
         """
-        by_name = self.get_instance_image_by_name(image)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_instance_image_by_id(image)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_instance_image_by_id,
+                             self.get_instance_image_by_name, instance, image,
+                             id_key="imageID")
 
     def get_instance_image_by_id(self, instance, id):
         """Retrieve specific image by ID for a cloud instance
@@ -203,6 +189,7 @@ class Image():
             print("Error fetching image with name {} for cloud instance {}."
                   "{}".format(name, instance, error))
 
+    @invalidate_resolution
     def create_instance_image(self, **kwargs):
         """Create image for a cloud instance
 
@@ -267,7 +254,7 @@ class Image():
 
             # Return data
             return qw("power", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating image for cloud instance {}. {}".format(
@@ -328,12 +315,13 @@ class Image():
 
             # Return data
             return qw("power", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error exporting image {} for cloud instance {}. {}".format(
                 args['image'], args['instance'], error))
 
+    @invalidate_resolution
     def delete_instance_image(self, instance, image):
         """Delete cloud instance image
 
@@ -1,13 +1,15 @@
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
 from ibmcloud_python_sdk.power import get_power_headers as headers
 from ibmcloud_python_sdk.utils.common import resource_deleted
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 
 
 class Instance():
 
-    def __init__(self):
-        self.cfg = params()
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_instance(self, instance):
         """Retrieve information about cloud instance
@@ -28,6 +30,7 @@ class Instance():
             print("Error fetching cloud instance {}. {}".format(
                 instance, error))
 
+    @invalidate_resolution
     def delete_instance(self, instance):
         """Delete cloud instance
 
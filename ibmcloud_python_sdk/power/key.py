@@ -1,15 +1,17 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
 from ibmcloud_python_sdk.power import get_power_headers as headers
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 
 
 class Key():
 
-    def __init__(self):
-        self.cfg = params()
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_keys(self, tenant):
         """Retrieve keys for a specific tenant
@@ -51,6 +53,7 @@ class Key():
             print("Error fetching key {} for tenant {}. {}".format(
                 key, tenant, error))
 
+    @invalidate_resolution
     def create_key(self, **kwargs):
         """Create key
 
@@ -88,11 +91,12 @@ class Key():
 
             # Return data
             return qw("power", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating key. {}".format(error))
 
+    @invalidate_resolution
     def delete_key(self, tenant, key):
         """Delete key
 
@@ -1,18 +1,23 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
 from ibmcloud_python_sdk.power import get_power_headers as headers
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.power import instance
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 
 
 class Network():
 
-    def __init__(self):
-        self.cfg = params()
-        self.instance = instance.Instance()
+    instance = shared(instance.Instance)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_networks(self, instance):
         """Retrieve network list from cloud instance
@@ -49,18 +54,9 @@ class Network():
         :return: Network information
         :rtype: dict
         """
-        by_name = self.get_pvm_by_name(instance, network)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_pvm_by_id(instance, network)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_network_by_id,
+                             self.get_network_by_name, instance, network,
+                             id_key="networkID")
 
     def get_network_by_id(self, instance, id):
         """Retrieve specific network by ID
@@ -191,6 +187,7 @@ class Network():
             print("Error fetching port with ID {} from network {} for cloud"
                   " instance {}. {}".format(id, network, instance, error))
 
+    @invalidate_resolution
     def create_network(self, **kwargs):
         """Create network
 
@@ -248,12 +245,13 @@ class Network():
 
             # Return data
             return qw("power", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating network for cloud instance {}. {}".format(
                 args['instance'], error))
 
+    @invalidate_resolution
     def create_port(self, **kwargs):
         """Create network
 
@@ -305,12 +303,13 @@ class Network():
 
             # Return data
             return qw("power", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating port in network {} for cloud instance {}."
                   " {}".format(args['network'], args['instance'], error))
 
+    @invalidate_resolution
     def delete_network(self, instance, network):
         """Delete network from cloud instance
 
@@ -347,6 +346,7 @@ class Network():
             print("Error deleting network {} from cloud instance {}."
                   " {}".format(network, instance, error))
 
+    @invalidate_resolution
     def delete_port(self, instance, network, port):
         """Delete port from network
 
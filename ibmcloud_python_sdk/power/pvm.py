@@ -1,18 +1,23 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
 from ibmcloud_python_sdk.power import get_power_headers as headers
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.power import instance
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 
 
 class Pvm():
 
-    def __init__(self):
-        self.cfg = params()
-        self.instance = instance.Instance()
+    instance = shared(instance.Instance)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_pvms(self, instance):
         """Retrieve Power Virtual Instance list for specific cloud instance
@@ -49,18 +54,9 @@ class Pvm():
         :return: PVM information
         :rtype: dict
         """
-        by_name = self.get_pvm_by_name(instance, pvm)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_pvm_by_id(instance, pvm)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_pvm_by_id, self.get_pvm_by_name,
+                             instance, pvm, id_key="pvmInstanceID",
+                             name_key="serverName")
 
     def get_pvm_by_id(self, instance, id):
         """Retrieve specific Power Virtual Instance by ID
@@ -168,18 +164,10 @@ class Pvm():
         :return: PVM network information
         :rtype: dict
         """
-        by_name = self.get_pvm_network_by_name(instance, pvm, network)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_pvm_network_by_id(instance, pvm, network)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_pvm_network_by_id,
+                             self.get_pvm_network_by_name, instance, pvm,
+                             network, id_key="networkID",
+                             name_key="networkName")
 
     def get_pvm_network_by_id(self, instance, pvm, id):
         """Retrieve specific network from Power Virtual Instance by ID
@@ -307,7 +295,7 @@ class Pvm():
 
             # Return data
             return qw("power", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error performing action {} on Power Virtual Machine {} for"
@@ -315,6 +303,7 @@ class Pvm():
                                                   args['network'],
                                                   args['instance'], error))
 
+    @invalidate_resolution
     def delete_pvm(self, instance, pvm):
         """Delete Power Virtual Instance
 
@@ -352,6 +341,7 @@ class Pvm():
             print("Error deleting Power Virtual Instance {} from cloud"
                   " instance {}. {}".format(pvm, instance, error))
 
+    @invalidate_resolution
     def delete_pvm_network(self, instance, pvm, network):
         """Delete Power Virtual Instance network
 
@@ -1,16 +1,21 @@
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
 from ibmcloud_python_sdk.power import get_power_headers as headers
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import resource_not_found
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 from ibmcloud_python_sdk.power import instance
 
 
 class Sanpshot():
 
-    def __init__(self):
-        self.cfg = params()
-        self.instance = instance.Instance()
+    instance = shared(instance.Instance)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_snapshots(self, instance):
         """Retrieve snapshot list for a specific cloud instance
@@ -41,18 +46,9 @@ class Sanpshot():
         :return: Snapshot information
         :rtype: dict
         """
-        by_name = self.get_snapshot_by_name(instance, snapshot)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_snapshot_by_id(instance, snapshot)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_snapshot_by_id,
+                             self.get_snapshot_by_name, instance, snapshot,
+                             id_key="snapshotID")
 
     def get_snapshot_by_id(self, instance, id):
         """Retrieve specific snapshot by ID
@@ -105,6 +101,7 @@ class Sanpshot():
             print("Error fetching snapshot with name {} for cloud instance {}."
                   " {}".format(name, instance, error))
 
+    @invalidate_resolution
     def delete_snapshot(self, instance, snapshot):
         """Delete cloud instance
 
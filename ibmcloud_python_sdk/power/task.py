@@ -1,13 +1,15 @@
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
 from ibmcloud_python_sdk.utils.common import resource_deleted
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 from ibmcloud_python_sdk.power import get_power_headers as headers
 
 
 class Task():
 
-    def __init__(self):
-        self.cfg = params()
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_task(self, task):
         """Retrieve specific task
@@ -27,6 +29,7 @@ class Task():
         except Exception as error:
             print("Error fetching task {}. {}".format(task, error))
 
+    @invalidate_resolution
     def delete_task(self, task):
         """Delete task
 
@@ -1,6 +1,7 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
 from ibmcloud_python_sdk.power import get_power_headers as headers
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
@@ -8,14 +9,18 @@ from ibmcloud_python_sdk.utils.common import resource_created
 from ibmcloud_python_sdk.power import instance
 from ibmcloud_python_sdk.power import pvm
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 
 
 class Volume():
 
-    def __init__(self):
-        self.cfg = params()
-        self.instance = instance.Instance()
-        self.pvm = pvm.Pvm()
+    instance = shared(instance.Instance)
+    pvm = shared(pvm.Pvm)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_volumes(self, instance):
         """Retrieve volume list from cloud instance
@@ -52,18 +57,8 @@ class Volume():
         :return: Volume information
         :rtype: dict
         """
-        by_name = self.get_volume_by_name(instance, volume)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_volume_by_id(instance, volume)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_volume_by_id, self.get_volume_by_name,
+                             instance, volume, id_key="volumeID")
 
     def get_volume_by_id(self, instance, id):
         """Retrieve specific volume by ID
@@ -171,18 +166,9 @@ class Volume():
         :return: PVM volume information
         :rtype: dict
         """
-        by_name = self.get_pvm_volume_by_name(instance, pvm, volume)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_pvm_volume_by_id(instance, pvm, volume)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_pvm_volume_by_id,
+                             self.get_pvm_volume_by_name, instance, pvm,
+                             volume, id_key="volumeID")
 
     def get_pvm_volume_by_id(self, instance, pvm, id):
         """Retrieve specific volume from Power Virtual Instance by ID
@@ -263,6 +249,7 @@ class Volume():
                   " Instance {} for cloud instance {}. {}".format(
                       name, pvm, instance, error))
 
+    @invalidate_resolution
     def create_volume(self, **kwargs):
         """Create volume
 
@@ -320,7 +307,7 @@ class Volume():
 
             # Return data
             return qw("power", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating volume for cloud instance {}. {}".format(
@@ -380,7 +367,7 @@ class Volume():
 
             # Return data
             return qw("power", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating clone from volume(s) {} for cloud instance"
@@ -562,6 +549,7 @@ class Volume():
                   " {} for cloud instance {}. {}".format(
                       args["volume"], args['pvm'], args['instance'], error))
 
+    @invalidate_resolution
     def delete_volume(self, instance, volume):
         """Delete volume from cloud instance
 
@@ -1,16 +1,19 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 
 
 class ResourceBinding():
 
-    def __init__(self):
-        self.cfg = params()
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_resource_bindings(self):
         """Retrieve resource binding list
@@ -37,18 +40,8 @@ class ResourceBinding():
         :return: Resource binding information
         :rtype: dict
         """
-        by_name = self.get_resource_binding_by_name(binding)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_resource_binding_by_id(binding)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_resource_binding_by_id,
+                             self.get_resource_binding_by_name, binding)
 
     def get_resource_binding_by_id(self, id):
         """Retrieve specific resource binding by ID
@@ -98,6 +91,7 @@ class ResourceBinding():
                 name, error))
             raise
 
+    @invalidate_resolution
     def create_binding(self, **kwargs):
         """Create resource binding
 
@@ -138,12 +132,13 @@ class ResourceBinding():
 
             # Return data
             return qw("rg", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error create resource binding. {}".format(error))
             raise
 
+    @invalidate_resolution
     def delete_binding(self, binding):
         """Delete resource binding
 
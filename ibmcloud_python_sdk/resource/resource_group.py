@@ -1,17 +1,20 @@
-import json
 import re
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 
 
 class ResourceGroup():
 
-    def __init__(self):
-        self.cfg = params()
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_resource_groups(self):
         """Retrieve resource group list
@@ -59,18 +62,8 @@ class ResourceGroup():
         :return: Resource group information
         :rtype: dict
         """
-        by_name = self.get_resource_group_by_name(group)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_resource_group_by_id(group)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_resource_group_by_id,
+                             self.get_resource_group_by_name, group)
 
     def get_resource_group_by_id(self, id):
         """Retrieve specific resource group by ID
@@ -165,20 +158,8 @@ class ResourceGroup():
         :return: Quota definition
         :rtype: dict
         """
-        by_name = self.get_quota_definition_by_name(quota)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                # regex = "Can not find quota definition with id"
-                # if re.search(regex, key_name["code"]):
-                if key_name["code"] == "not_found":
-                    by_id = self.get_quota_definition_by_id(quota)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_quota_definition_by_id,
+                             self.get_quota_definition_by_name, quota)
 
 
 
@@ -230,6 +211,7 @@ class ResourceGroup():
                 name, error))
             raise
 
+    @invalidate_resolution
     def create_group(self, **kwargs):
         """Create resource group
 
@@ -259,12 +241,13 @@ class ResourceGroup():
 
             # Return data
             return qw("rg", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error create resource group. {}".format(error))
             raise
 
+    @invalidate_resolution
     def delete_group(self, group):
         """Delete resource group
 
@@ -1,20 +1,26 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.resource import resource_group
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 from urllib.parse import quote
 
 
 class ResourceInstance():
 
-    def __init__(self):
-        self.cfg = params()
-        self.rg = resource_group.ResourceGroup()
+    rg = shared(resource_group.ResourceGroup)
 
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
+
+    @invalidate_resolution
     def create_resource_instance(self, **kwargs):
         """Create resource instance
 
@@ -82,7 +88,7 @@ class ResourceInstance():
             path = ("/v2/resource_instances")
 
             return qw("rg", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating resource instance. {}".format(error))
@@ -116,19 +122,9 @@ class ResourceInstance():
         :return: Resource instance information
         :rtype: dict
         """
-        by_name = self.get_resource_instance_by_name(resource_instance)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_guid = self.get_resource_instance_by_guid(
-                        resource_instance)
-                    if "errors" in by_guid:
-                        return by_guid
-                    return by_guid
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_resource_instance_by_guid,
+                             self.get_resource_instance_by_name,
+                             resource_instance)
 
     def get_resource_instance_by_guid(self, guid):
         """Retrieve specific resoure instance by GUID
@@ -178,6 +174,7 @@ class ResourceInstance():
                 name, error))
             raise
 
+    @invalidate_resolution
     def delete_resource_instance(self, instance):
         """Delete a resource instance
 
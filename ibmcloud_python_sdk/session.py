@@ -0,0 +1,132 @@
+import threading
+from ibmcloud_python_sdk.config import params
+
+_lock = threading.Lock()
+# Session used by resource classes instantiated without one
+_default = None
+
+
+class Session():
+    """Objects shared by the resource classes
+
+    Resource objects are created on first access then shared, e.g. every
+    class needing a ResourceGroup uses the same one, and the configuration
+    is read once per session. A session doesn't isolate credentials or
+    regions: queries use the configuration read from clouds.yaml or
+    environment, and the token manager, the connection pool and the
+    caches are process-wide, exposed for convenience.
+    """
+
+    def __init__(self):
+        self._cfg = None
+        self._lock = threading.RLock()
+        self._resources = {}
+
+    @property
+    def cfg(self):
+        """Cloud configuration of the session
+
+        :rtype: dict
+        """
+        if self._cfg is None:
+            with self._lock:
+                if self._cfg is None:
+                    self._cfg = params()
+
+        return self._cfg
+
+    @property
+    def token_manager(self):
+        """IAM token manager
+
+        :rtype: TokenManager
+        """
+        from ibmcloud_python_sdk.auth import token_manager
+        return token_manager
+
+    @property
+    def pool(self):
+        """HTTP connection pool
+
+        :rtype: ConnectionPool
+        """
+        from ibmcloud_python_sdk.utils.pool import pool
+        return pool
+
+    @property
+    def cache(self):
+        """In-process cache in front of memcached
+
+        :rtype: LocalCache
+        """
+        from ibmcloud_python_sdk.utils.cache import local_cache
+        return local_cache
+
+    def resource(self, cls):
+        """Retrieve the object of a resource class bound to the session
+
+        The object is created on first call and shared afterwards.
+
+        :param cls: Resource class such as Vpc or Instance
+        :type cls: class
+        :return: Resource object
+        """
+        obj = self._resources.get(cls)
+        if obj is None:
+            with self._lock:
+                obj = self._resources.get(cls)
+                if obj is None:
+                    obj = cls(session=self)
+                    self._resources[cls] = obj
+
+        return obj
+
+
+class shared():
+    """Resource attribute created on first access from the session
+
+    Used as class attribute of resource classes, such as
+    ``rg = shared(resource_group.ResourceGroup)``.
+
+    :param cls: Resource class
+    :type cls: class
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+
+        value = obj.session.resource(self.cls)
+        # Next accesses are plain attribute lookups
+        obj.__dict__[self.name] = value
+        return value
+
+
+def default_session():
+    """Retrieve the session used when none is provided
+
+    A new session is created when the configuration changes.
+
+    :return: Default session
+    :rtype: Session
+    """
+    global _default
+
+    cfg = params()
+    session = _default
+    if session is None or session.cfg != cfg:
+        with _lock:
+            if _default is None or _default.cfg != cfg:
+                _default = Session()
+                # Configuration already read, not read again by the session
+                _default._cfg = cfg
+            session = _default
+
+    return session
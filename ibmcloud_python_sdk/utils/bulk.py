@@ -0,0 +1,115 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import constants
+from ibmcloud_python_sdk.utils.common import resource_error
+
+
+class RateLimiter():
+    """Spread calls evenly to stay under a number of calls per second
+
+    The limiter is shared by every worker of a bulk run.
+    """
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.lock = threading.Lock()
+        self.next = time.monotonic()
+
+    def wait(self):
+        """Block until the next call is allowed"""
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next - now
+            self.next = max(now, self.next) + self.interval
+
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _settings(max_workers, rate_limit):
+    """Retrieve workers and rate limit from arguments or sdk.yaml
+
+    :return: Number of workers and calls per second
+    :rtype: tuple
+    """
+    config = sdk() or {}
+    if max_workers is None:
+        max_workers = int(config.get("bulk_workers",
+                                     constants.BULK_WORKERS))
+    if rate_limit is None:
+        rate_limit = config.get("bulk_rate_limit")
+
+    return max_workers, rate_limit
+
+
+def _call(func, item, limiter):
+    """Call a function with an item and turn exceptions into errors
+
+    :param func: Function to call
+    :type func: function
+    :param item: Argument of the call, a tuple is passed as positional
+        arguments and a dict as keyword arguments
+    :return: Result of the call
+    :rtype: dict
+    """
+    if limiter is not None:
+        limiter.wait()
+
+    try:
+        if isinstance(item, tuple):
+            return func(*item)
+        if isinstance(item, dict):
+            return func(**item)
+        return func(item)
+
+    except Exception as error:
+        return resource_error("exception", str(error))
+
+
+def run(func, items, max_workers=None, rate_limit=None):
+    """Run the same SDK call for many items in a bounded thread pool
+
+    Calls are independent from each other, a failing call doesn't stop the
+    others. Its exception is returned as an error in place of the result.
+
+    :param func: Function or method to call, such as
+        Instance().delete_instance
+    :type func: function
+    :param items: Arguments of each call, a tuple is passed as positional
+        arguments and a dict as keyword arguments
+    :type items: list
+    :param max_workers: Number of calls running at the same time, defaults
+        to ``bulk_workers`` in ``sdk.yaml``
+    :type max_workers: int, optional
+    :param rate_limit: Maximum number of calls started per second,
+        defaults to ``bulk_rate_limit`` in ``sdk.yaml`` (no limit if not
+        defined)
+    :type rate_limit: float, optional
+    :return: Results in the same order as items
+    :rtype: list
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    max_workers, rate_limit = _settings(max_workers, rate_limit)
+    limiter = RateLimiter(rate_limit) if rate_limit else None
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as ex:
+        return list(ex.map(lambda item: _call(func, item, limiter), items))
+
+
+def errors(items, results):
+    """Retrieve the items whose call returned an error
+
+    :param items: Arguments given to run()
+    :type items: list
+    :param results: Results returned by run()
+    :type results: list
+    :return: List of (item, error) tuples
+    :rtype: list
+    """
+    return [(item, result) for item, result in zip(items, results)
+            if isinstance(result, dict) and "errors" in result]
@@ -1,35 +1,84 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from pymemcache.client import base
 from pymemcache.client import hash
 from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import constants
 
 
-config = sdk()
+# Methods modifying resources, they invalidate the cached collection
+MUTATING_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+# Prefix of cache entries storing a response with its ETag
+ENVELOPE = b"ICE1\n"
+
+# Longest key accepted by memcached
+MAX_KEY_LENGTH = 250
+
+_lock = threading.Lock()
+# Memcached client shared by the whole process and the nodes it targets
+_client = None
+_nodes = None
+
+
+def _configured_nodes():
+    """Retrieve memcached nodes from sdk.yaml
+
+    :return: Tuple of (host, port) or None if memcached is not configured
+    :rtype: tuple
+    """
+    config = sdk()
+    if config and config.get("memcached"):
+        return tuple((node.split(":")[0], int(node.split(":")[1]))
+                     for node in config.get("memcached"))
+
+    return None
 
 
 def client():
-    """Create and configure memcached client
+    """Retrieve the memcached client
+
+    The client is created once and shared by every thread, connections
+    are pooled. It is rebuilt only if the nodes in sdk.yaml change.
 
-    :return: memcached client
-    :rtype: map
+    :return: memcached client or False if memcached is not configured
+    :rtype: pymemcache.client.base.PooledClient
     """
-    if config:
-        # Check if memcached is configured in sdk.yaml file
-        if config.get("memcached") and len(config.get("memcached")) > 0:
-            cache = []
-            for node in config.get("memcached"):
-                cache.append([node.split(":")[0], node.split(":")[1]])
+    global _client, _nodes
+
+    nodes = _configured_nodes()
+    if not nodes:
+        return False
+
+    if _client is not None and nodes == _nodes:
+        return _client
 
-            if len(config.get("memcached")) > 1:
-                nodes = map(lambda x: (x[0], int(x[1])), cache)
+    with _lock:
+        if _client is None or nodes != _nodes:
+            if _client is not None:
+                _client.close()
 
-                return hash.HashClient(nodes)
+            # Check if several memcached nodes are configured in sdk.yaml
+            if len(nodes) > 1:
+                _client = hash.HashClient(nodes, use_pooling=True)
+            else:
+                _client = base.PooledClient(nodes[0])
+            _nodes = nodes
 
-            node = config.get("memcached")[0]
-            node = (node.split(":")[0], int(node.split(":")[1]))
+        return _client
 
-            return base.Client(node)
 
-    return False
+def reset():
+    """Close the memcached client, the next call will create a new one"""
+    global _client, _nodes
+
+    with _lock:
+        if _client is not None:
+            _client.close()
+        _client = None
+        _nodes = None
 
 
 def get_item(item_key):
@@ -43,14 +92,332 @@ def get_item(item_key):
     return client().get(item_key)
 
 
-def set_item(item_key, item_value):
+def set_item(item_key, item_value, expire=None):
     """Store object into memcached
 
     :param item_key: Item key to store
     :type item_key: str
     :param item_value: Item value to store
     :type item_value: str
+    :param expire: Lifetime in seconds, defaults to cache_ttl
+    :type expire: int, optional
     """
+    config = sdk()
     if config:
-        # Set expire to 60 secondes if not defined in sdk.yaml
-        client().set(item_key, item_value, expire=config.get("cache_ttl", 60))
+        if expire is None:
+            # Set expire to 60 secondes if not defined in sdk.yaml
+            expire = config.get("cache_ttl", constants.CACHE_TTL)
+        client().set(item_key, item_value, expire=expire)
+
+
+def ttl(path):
+    """Retrieve the lifetime of a cached response
+
+    ``cache_ttls`` in ``sdk.yaml`` maps path prefixes to lifetimes, the
+    longest matching prefix wins. ``cache_ttl`` is used otherwise.
+
+    :param path: Path used by within the query
+    :type path: str
+    :return: Lifetime in seconds
+    :rtype: int
+    """
+    config = sdk() or {}
+    path = path.split("?", 1)[0]
+    match = None
+    for prefix, value in (config.get("cache_ttls") or {}).items():
+        prefix = prefix.rstrip("/")
+        if path == prefix or path.startswith(prefix + "/"):
+            if match is None or len(prefix) > len(match[0]):
+                match = (prefix, value)
+
+    if match is not None:
+        return int(match[1])
+
+    return int(config.get("cache_ttl", constants.CACHE_TTL))
+
+
+class Entry():
+    """Cached response with its freshness and ETag
+
+    :param body: Response body
+    :type body: bytes or memoryview
+    :param etag: ETag returned with the response
+    :type etag: str
+    :param fresh_until: Epoch time until the response is fresh, None if
+        it is fresh as long as it is cached
+    :type fresh_until: float
+    :param item: Packed entry as stored in the cache
+    :type item: bytes
+    """
+
+    def __init__(self, body, etag, fresh_until, item):
+        self.body = body
+        self.etag = etag
+        self.fresh_until = fresh_until
+        self.item = item
+
+    def fresh(self):
+        """Check if the response could be used without revalidation
+
+        :rtype: bool
+        """
+        return self.fresh_until is None or time.time() < self.fresh_until
+
+    def retention(self):
+        """Retrieve how long the entry should be kept in the cache
+
+        Responses with an ETag are kept ``cache_stale_ttl`` seconds after
+        they expire so they could be revalidated.
+
+        :return: Lifetime in seconds
+        :rtype: int
+        """
+        if self.fresh_until is None:
+            return 0
+
+        expire = max(0, int(self.fresh_until - time.time()))
+        if self.etag:
+            config = sdk() or {}
+            expire += int(config.get("cache_stale_ttl",
+                                     constants.CACHE_STALE_TTL))
+
+        return expire
+
+
+def pack(body, etag, expire):
+    """Build a cache entry from a response
+
+    :param body: Response body
+    :type body: bytes
+    :param etag: ETag returned with the response
+    :type etag: str
+    :param expire: Number of seconds the response is fresh
+    :type expire: int
+    :return: Cache entry
+    :rtype: Entry
+    """
+    fresh_until = time.time() + expire
+    header = "{:.3f}\n{}\n".format(fresh_until, etag or "")
+    item = ENVELOPE + header.encode("latin-1") + bytes(body)
+
+    return Entry(body, etag, fresh_until, item)
+
+
+def unpack(item):
+    """Read a cache entry
+
+    :param item: Item retrieved from the cache
+    :type item: bytes
+    :return: Cache entry or None if the item is missing
+    :rtype: Entry
+    """
+    if item is None:
+        return None
+    if not item.startswith(ENVELOPE):
+        # Plain body stored by a previous version
+        return Entry(item, None, None, item)
+
+    view = memoryview(item)
+    offset = len(ENVELOPE)
+    end = item.index(b"\n", offset)
+    fresh_until = float(item[offset:end])
+    offset, end = end + 1, item.index(b"\n", end + 1)
+    etag = item[offset:end].decode("latin-1") or None
+
+    # Body is not copied, the JSON codec decodes memoryview directly
+    return Entry(view[end + 1:], etag, fresh_until, item)
+
+
+class LocalCache():
+    """Bounded in-process LRU cache in front of memcached
+
+    The number of entries and their total size are limited by
+    ``local_cache`` in ``sdk.yaml``, the cache is disabled if not
+    configured. Entries are keyed by account, connection type and path.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.size = 0
+
+    def limits(self):
+        """Retrieve the cache limits
+
+        :return: Maximum number of entries and total size in bytes or None
+            if the cache is disabled
+        :rtype: tuple
+        """
+        config = (sdk() or {}).get("local_cache")
+        if not config:
+            return None
+
+        return (int(config.get("max_entries",
+                               constants.LOCAL_CACHE_ENTRIES)),
+                int(config.get("max_size", constants.LOCAL_CACHE_SIZE)))
+
+    def _remove(self, key):
+        entry = self.entries.pop(key)
+        self.size -= len(entry[1])
+
+    def get(self, key):
+        """Retrieve a cached body
+
+        :param key: Tuple of account, connection type and path
+        :type key: tuple
+        :return: Cached body or None if missing or expired
+        :rtype: bytes
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                self._remove(key)
+                return None
+
+            self.entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, expire):
+        """Cache a body, least recently used entries are evicted
+
+        :param key: Tuple of account, connection type and path
+        :type key: tuple
+        :param value: Body to cache
+        :type value: bytes
+        :param expire: Lifetime in seconds
+        :type expire: int
+        """
+        limits = self.limits()
+        if limits is None or expire <= 0 or len(value) > limits[1]:
+            return
+
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (time.monotonic() + expire, value)
+            self.size += len(value)
+
+            while len(self.entries) > limits[0] or self.size > limits[1]:
+                self._remove(next(iter(self.entries)))
+
+    def invalidate(self, account, conn_type, path):
+        """Evict every entry of the collection of a path
+
+        :param account: Account ID of the token
+        :type account: str
+        :param conn_type: Connection type such as "iaas" or "rg"
+        :type conn_type: str
+        :param path: Path of the mutating query
+        :type path: str
+        """
+        prefix = collection(path)
+        with self.lock:
+            for key in [key for key in self.entries
+                        if key[:2] == (account, conn_type)
+                        and collection(key[2]) == prefix]:
+                self._remove(key)
+
+    def clear(self):
+        """Evict every entry"""
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+
+def collection(path):
+    """Retrieve the collection prefix of a path
+
+    Such as "/v1/subnets" for "/v1/subnets/<id>/network_acl?version=..."
+    or "/pcloud/v1/cloud-instances/<id>/pvm-instances" for Power paths.
+
+    :param path: Path used by within the query
+    :type path: str
+    :return: Collection prefix
+    :rtype: str
+    """
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    depth = 5 if segments[0] == "pcloud" else 2
+
+    return "/" + "/".join(segments[:depth])
+
+
+def _key(key):
+    """Make a key valid for memcached
+
+    :param key: Key to check
+    :type key: str
+    :return: Key or its SHA1 digest if it is too long
+    :rtype: str
+    """
+    if len(key) > MAX_KEY_LENGTH:
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    return key
+
+
+def _generation_key(account, conn_type, path):
+    return _key("gen:{}:{}:{}".format(account, conn_type, collection(path)))
+
+
+def _new_generation(mc, gen_key):
+    """Initialize a missing generation counter
+
+    The counter starts from the current time so a counter evicted from
+    memcached never goes back to a generation already used.
+
+    :return: Generation
+    :rtype: int
+    """
+    generation = int(time.time() * 1000)
+    if not mc.add(gen_key, str(generation), noreply=False):
+        # Another client initialized the counter meanwhile
+        value = mc.get(gen_key)
+        if value is not None:
+            return int(value)
+
+    return generation
+
+
+def item_key(mc, account, conn_type, path):
+    """Build the key of a cached GET response
+
+    The key includes the generation of the collection so every item of a
+    collection is evicted at once when the collection is modified.
+
+    :param mc: memcached client
+    :param account: Account ID of the token
+    :type account: str
+    :param conn_type: Connection type such as "iaas" or "rg"
+    :type conn_type: str
+    :param path: Path used by within the query
+    :type path: str
+    :return: Cache key
+    :rtype: str
+    """
+    gen_key = _generation_key(account, conn_type, path)
+    value = mc.get(gen_key)
+    generation = int(value) if value is not None else \
+        _new_generation(mc, gen_key)
+
+    return _key("{}:{}:{}:{}".format(account, conn_type, generation, path))
+
+
+def invalidate(mc, account, conn_type, path):
+    """Evict the cached collection and items of a modified resource
+
+    :param mc: memcached client
+    :param account: Account ID of the token
+    :type account: str
+    :param conn_type: Connection type such as "iaas" or "rg"
+    :type conn_type: str
+    :param path: Path of the mutating query
+    :type path: str
+    """
+    gen_key = _generation_key(account, conn_type, path)
+    if mc.incr(gen_key, 1) is None:
+        _new_generation(mc, gen_key)
+
+
+local_cache = LocalCache()
@@ -0,0 +1,41 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data):
+    """Decode JSON data
+
+    Bytes are decoded directly without being copied into a string first,
+    orjson is used when installed.
+
+    :param data: JSON document
+    :type data: bytes, bytearray, memoryview or str
+    :return: Decoded document
+    :rtype: dict
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+
+    return json.loads(data)
+
+
+def dumps(obj):
+    """Encode an object to JSON
+
+    :param obj: Object to encode such as a request payload
+    :type obj: dict
+    :return: UTF-8 encoded JSON document
+    :rtype: bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+
+    return json.dumps(obj, separators=(",", ":"),
+                      ensure_ascii=False).encode("utf-8")
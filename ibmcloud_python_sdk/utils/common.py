@@ -1,9 +1,75 @@
 import base64
+import functools
 import http.client
-import json
+import logging
+import re
+import time
 from jwt import decode
+from urllib.parse import parse_qsl, urlencode, urlsplit
 from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.config import sdk
 from ibmcloud_python_sdk.utils import cache
+from ibmcloud_python_sdk.utils import cassette
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.utils import metrics
+from ibmcloud_python_sdk.utils.compression import ACCEPT_ENCODING
+from ibmcloud_python_sdk.utils.compression import read_body
+from ibmcloud_python_sdk.utils.hooks import Call
+from ibmcloud_python_sdk.utils.hooks import hooks
+from ibmcloud_python_sdk.utils.pool import pool
+from ibmcloud_python_sdk.utils.resolution import resolution_cache
+from ibmcloud_python_sdk.utils.retry import IDEMPOTENT_METHODS
+from ibmcloud_python_sdk.utils.retry import RETRY_ERRORS
+from ibmcloud_python_sdk.utils.retry import RetryPolicy
+from ibmcloud_python_sdk.utils.singleflight import SingleFlight
+
+# Configuration key holding the host for each connection type
+HOSTS = {
+    "iaas": "is_url",
+    "rg": "rg_url",
+    "auth": "auth_url",
+    "dns": "dns_url",
+    "em": "em_url",
+    "sl": "sl_url",
+    "power": "pi_url",
+}
+
+# IBM Cloud identifiers: CRN, VPC ID such as "r006-<uuid>", GUID and
+# 32 characters long ID such as resource group or account IDs
+ID_REGEXP = re.compile(
+    r"^(crn:v1:.+"
+    r"|([a-z0-9]{4}-)?[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}"
+    r"-[0-9a-f]{12}"
+    r"|[0-9a-f]{32})$")
+
+# Identical GETs running at the same time
+flights = SingleFlight()
+
+logger = logging.getLogger(__name__)
+
+# Errors raised when a pooled keep-alive socket has been closed by the server
+STALE_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                ConnectionResetError, BrokenPipeError)
+
+
+@functools.lru_cache(maxsize=16)
+def _account_prefix(token):
+    """Decode a JWT token and encode its BSS ID to base64
+
+    The result only depends on the token so it is computed once per token.
+
+    :param token: JWT token without its type
+    :type token: str
+    :return: BSS ID encoded to base64
+    :rtype: str
+    """
+    jwt = decode(token, options={"verify_signature": False})
+
+    # Encode BSS ID to base64
+    encoded = base64.b64encode(jwt["account"]["bss"].encode("utf-8"))
+
+    # Returns base64 string
+    return encoded.decode()
 
 
 def _account_id(headers):
@@ -14,21 +80,124 @@ def _account_id(headers):
     :return: BSS ID encoded to base64
     :rtype: str
     """
-    auth = headers.get("Authorization")
+    auth = headers.get("Authorization") if headers else None
     if auth:
-        # Split the Bearer token and decode the JWT
-        jwt = decode(auth.split(" ")[1], verify=False)
+        # Split the Bearer token
+        return _account_prefix(auth.split(" ")[1])
+
+
+def basic_auth(cfg):
+    """Build SoftLayer basic authorization header value
+
+    :param cfg: Configuration from params()
+    :type cfg: dict
+    :return: Authorization header value
+    :rtype: str
+    """
+    header = base64.encodebytes(
+        ('%s:%s' % (cfg["cis_username"], cfg["cis_apikey"]))
+        .encode('utf8')).decode('utf8').replace('\n', '')
+
+    return "Basic {}".format(header)
+
+
+def _send(conn, method, path, payload=None, headers=None):
+    """Send HTTP query and read the whole response
+
+    :param conn: Connection to use
+    :type conn: http.client.HTTPSConnection
+    :param method: HTTP method
+    :type method: str
+    :param path: Path used by within the query
+    :type path: str
+    :param payload: Payload send during the query
+    :type payload: str, optional
+    :param headers: Headers to send with the query
+    :type headers: dict, optional
+    :return: HTTP response and its body, the response timings attribute
+        holds the duration of each phase
+    :rtype: tuple
+    """
+    # Negotiate compression without altering the caller headers
+    headers = dict(headers or {})
+    headers.setdefault("Accept-Encoding", ACCEPT_ENCODING)
+
+    # Filled by the connection if a new socket is opened
+    timings = {}
+    conn.timings = timings
+    started = time.monotonic()
+    conn.request(method, path, payload, headers)
+
+    # Get and read response data, decompressed while being read
+    res = conn.getresponse()
+    received = time.monotonic()
+    data = read_body(res)
+
+    # Time to first byte excludes the connection setup
+    timings["ttfb"] = (received - started - timings.get("connect", 0)
+                       - timings.get("tls", 0))
+    timings["read"] = time.monotonic() - received
+    res.timings = timings
 
-        # Encode BSS ID to base64
-        encoded = base64.b64encode(jwt["account"]["bss"].encode("utf-8"))
+    return res, data
 
-        # Returns base64 string
-        return encoded.decode()
 
+def _request(host, timeout, method, path, payload=None, headers=None):
+    """Send HTTP query on a pooled connection
 
-def query_wrapper(conn_type, method, path, headers=None, payload=None):
+    An idempotent query failing because the server closed the pooled
+    keep-alive socket is sent once again on a new connection.
+
+    :param host: Host to connect to
+    :type host: str
+    :param timeout: Socket timeout in seconds
+    :type timeout: int
+    :param method: HTTP method
+    :type method: str
+    :param path: Path used by within the query
+    :type path: str
+    :param payload: Payload send during the query
+    :type payload: str, optional
+    :param headers: Headers to send with the query
+    :type headers: dict, optional
+    :return: HTTP response and its body
+    :rtype: tuple
+    """
+    conn = pool.get(host, timeout)
+    # A connection with an open socket comes from the pool
+    reused = conn.sock is not None
+    try:
+        try:
+            res, data = _send(conn, method, path, payload, headers)
+        except STALE_ERRORS:
+            if not reused or method not in IDEMPOTENT_METHODS:
+                # The query could have reached the server, a POST is only
+                # sent again by the retry policy of query_wrapper
+                raise
+            # The server closed the idle keep-alive socket, retry once
+            # with a fresh connection
+            conn.close()
+            res, data = _send(conn, method, path, payload, headers)
+    except Exception:
+        conn.close()
+        raise
+
+    pool.release(host, conn, res)
+
+    return res, data
+
+
+def query_wrapper(conn_type, method, path, headers=None, payload=None,
+                  retry=None):
     """Execute HTTP query and return JSON response
 
+    Idempotent queries failing with a connection error or a throttling
+    status are sent again according to the retry policy from sdk.yaml.
+    Queries are recorded to or replayed from the cassette in use, if any.
+    Identical GETs running at the same time share one query and its
+    result, which must not be modified by the caller. The hooks
+    registered in utils.hooks run for every call.
+
     :param conn_type: Define which URL should be used for the connection
         such as "iaas", "auth", "cis", or "rg" (resource group)
     :type conn_type: str
@@ -42,59 +211,488 @@ def query_wrapper(conn_type, method, path, headers=None, payload=None):
     :type headers: dict, optional
     :param payload: JSON payload send during the query
     :type payload: dict, optional
+    :param retry: Force retries on (True) for a POST safe to send again or
+        off (False), the HTTP method decides if not defined
+    :type retry: bool, optional
     :return: JSON response
     :rtype: dict
     """
     cfg = params()
-    timeout = cfg["http_timeout"]
 
-    if conn_type == "iaas":
-        conn = http.client.HTTPSConnection(cfg["is_url"], timeout=timeout)
-    elif conn_type == "rg":
-        conn = http.client.HTTPSConnection(cfg["rg_url"], timeout=timeout)
-    elif conn_type == "auth":
-        conn = http.client.HTTPSConnection(cfg["auth_url"], timeout=timeout)
-    elif conn_type == "dns":
-        conn = http.client.HTTPSConnection(cfg["dns_url"], timeout=timeout)
-    elif conn_type == "em":
-        conn = http.client.HTTPSConnection(cfg["em_url"], timeout=timeout)
-    elif conn_type == "sl":
+    if conn_type == "sl":
         if headers and cfg["cis_username"] and cfg["cis_apikey"]:
-            header = base64.encodebytes(
-                ('%s:%s' % (cfg["cis_username"], cfg["cis_apikey"]))
-                .encode('utf8')).decode('utf8').replace('\n', '')
-            headers["Authorization"] = "Basic {}".format(header)
-        conn = http.client.HTTPSConnection(cfg["sl_url"], timeout=timeout)
-    elif conn_type == "power":
-        conn = http.client.HTTPSConnection(cfg["pi_url"], timeout=timeout)
-
-    if cache.client():
-        if method == "GET" and conn_type != "auth":
-            obj = "{}{}".format(_account_id(headers), path)
-            item = cache.get_item(obj)
-            if item is not None:
-                return {"data": json.loads(item.decode("utf-8"))}
+            headers["Authorization"] = basic_auth(cfg)
+
+    call = Call(conn_type, method, path, dict(headers or {}), payload)
+    hooks.run("before_request", call)
+    try:
+        if method == "GET":
+            # Identical GETs running at the same time share one query, the
+            # Authorization header is part of the key so in-flight queries
+            # are only shared by the same token. Cached responses are keyed
+            # by account and shared between its tokens
+            auth = call.headers.get("Authorization")
+            result, sent = flights.do((conn_type, auth, path), lambda: (
+                _query(cfg, call, payload, retry), call))
+            call.update(sent)
+        else:
+            result = _query(cfg, call, payload, retry)
+    except Exception as error:
+        call.finish(error)
+        hooks.run("on_error", call)
+        raise
+
+    call.finish()
+    hooks.run("after_response", call)
+
+    return result
+
+
+def _query(cfg, call, payload, retry):
+    """Execute HTTP query through the cache and the retry policy
+
+    :param cfg: Configuration from params()
+    :type cfg: dict
+    :param call: Query, filled with its outcome
+    :type call: Call
+    :return: JSON response
+    :rtype: dict
+    """
+    conn_type, method, path = call.conn_type, call.method, call.path
+    headers = call.headers
+    timeout = cfg["http_timeout"]
+    host = cfg[HOSTS[conn_type]]
+
+    key = None
+    local_key = None
+    stale = None
+    cached = conn_type not in ("auth", "sl")
+    mc = cache.client() if cached else False
+    local = cached and cache.local_cache.limits() is not None
+    if mc or local:
+        account = _account_id(headers)
+        if method == "GET":
+            # In-process cache first, then memcached
+            local_key = (account, conn_type, path)
+            entry = cache.unpack(cache.local_cache.get(local_key))
+            if local:
+                metrics.record_cache("local", entry)
+            if entry and entry.fresh():
+                call.cache = "local"
+                call.response_bytes = len(entry.body)
+                return _result(call, entry.body)
+            stale = entry
+
+            if mc:
+                key = cache.item_key(mc, account, conn_type, path)
+                entry = cache.unpack(mc.get(key))
+                metrics.record_cache("memcached", entry)
+                if entry and entry.fresh():
+                    cache.local_cache.set(local_key, entry.item,
+                                          entry.retention())
+                    call.cache = "memcached"
+                    call.response_bytes = len(entry.body)
+                    return _result(call, entry.body)
+                stale = entry or stale
+
+            if stale and stale.etag:
+                # Revalidate the expired response
+                headers = dict(headers or {})
+                headers["If-None-Match"] = stale.etag
+
+    tape = cassette.current()
+    policy = RetryPolicy()
+    retry = policy.allowed(method, retry)
+    started = time.monotonic()
+    attempt = 0
+    while True:
+        attempt += 1
+        call.attempts = attempt
+        try:
+            if tape is not None and tape.mode == "replay":
+                res, data = tape.play(conn_type, method, path, payload)
             else:
-                pass
-
-    conn.request(method, path, payload, headers)
-
-    # Get and read response data
-    res = conn.getresponse()
-    data = res.read()
+                res, data = _request(host, timeout, method, path, payload,
+                                     headers)
+                if tape is not None:
+                    tape.record(conn_type, method, path, payload, res, data)
+        except RETRY_ERRORS:
+            delay = policy.schedule(attempt, started) if retry else None
+            if delay is None:
+                raise
+            _wait(call, delay)
+            continue
+
+        # Phases of every attempt add up
+        for phase, duration in getattr(res, "timings", {}).items():
+            call.timings[phase] = call.timings.get(phase, 0) + duration
+
+        if retry and policy.retryable(res):
+            delay = policy.schedule(attempt, started, res)
+            if delay is not None:
+                _wait(call, delay)
+                continue
+
+        break
+
+    call.response = res
+    call.response_bytes = len(data)
+
+    if (mc or local) and method in cache.MUTATING_METHODS:
+        evict(call, mc)
+
+    if stale is not None and stale.etag:
+        metrics.CACHE.inc("etag", "hit" if res.status == 304 else "miss")
+
+    etag = None
+    if res.status == 304 and stale is not None:
+        # The cached response is still valid, reuse its body
+        data = stale.body
+        etag = stale.etag
+        call.cache = "revalidated"
 
     if not data:
         # Return empty data and HTTP response this is mostly
         # due to DELETE request which doesn't return any data
-        return {"data": None, "response": res}
+        return _result(call, None, res)
     else:
-        if cache.client():
-            obj = "{}{}".format(_account_id(headers), path)
+        # A lifetime of 0 disables the cache for the path, even for the
+        # responses with an ETag which would be kept for revalidation
+        expire = cache.ttl(path) if local_key is not None else 0
+        if expire > 0 and (res.status < 300 or etag):
             # Store item into caching system
-            cache.set_item(obj, data)
+            entry = cache.pack(data, etag or res.getheader("ETag"), expire)
+            cache.local_cache.set(local_key, entry.item, entry.retention())
+            if key is not None and entry.retention() > 0:
+                cache.set_item(key, entry.item, entry.retention())
 
         # Return data and HTTP response
-        return {"data": json.loads(data), "response": res}
+        return _result(call, data, res)
+
+
+def evict(call, mc=None):
+    """Evict the cached collection and items modified by a query
+
+    Used by the synchronous and asyncio APIs once a POST, PUT, PATCH or
+    DELETE query got a response, so no cached response of the modified
+    resources is served afterwards.
+
+    :param call: Mutating query
+    :type call: Call
+    :param mc: memcached client, retrieved if not defined
+    :type mc: pymemcache.client.base.PooledClient, optional
+    """
+    if (call.method not in cache.MUTATING_METHODS
+            or call.conn_type in ("auth", "sl")):
+        return
+
+    if mc is None:
+        mc = cache.client()
+    if not mc and cache.local_cache.limits() is None:
+        return
+
+    account = _account_id(call.headers)
+    cache.local_cache.invalidate(account, call.conn_type, call.path)
+    if mc:
+        cache.invalidate(mc, account, call.conn_type, call.path)
+
+
+def _wait(call, delay):
+    """Sleep before sending a query again
+
+    :param call: Query
+    :type call: Call
+    :param delay: Number of seconds to wait
+    :type delay: float
+    """
+    call.timings["retry_wait"] = call.timings.get("retry_wait", 0) + delay
+    time.sleep(delay)
+
+
+def _result(call, body, response=None):
+    """Decode a response body and build the result of query_wrapper
+
+    :param call: Query
+    :type call: Call
+    :param body: Response body
+    :type body: bytes
+    :param response: HTTP response, None if served from the cache
+    :type response: http.client.HTTPResponse
+    :return: Data, HTTP response and timings of the query
+    :rtype: dict
+    """
+    started = time.monotonic()
+    data = codec.loads(body) if body else None
+    call.timings["decode"] = time.monotonic() - started
+
+    result = {"data": data, "timings": call.timings}
+    if response is not None:
+        result["response"] = response
+
+    return result
+
+
+def _log_call(call):
+    """Log a query and the duration of its phases at debug level
+
+    :param call: Query
+    :type call: Call
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s %s %s: %s %s", call.conn_type, call.method,
+                     call.path, call.error or call.status or call.cache,
+                     " ".join("{}={:.1f}ms".format(phase, duration * 1000)
+                              for phase, duration in call.timings.items()))
+
+
+def next_page(path, data):
+    """Build the path of the next page of a paginated collection
+
+    The query parameters of the current path missing from the next link
+    (such as version and generation) are carried over.
+
+    :param path: Path of the current page
+    :type path: str
+    :param data: JSON response of the current page
+    :type data: dict
+    :return: Path of the next page or None if this is the last page
+    :rtype: str
+    """
+    href = (data.get("next") or {}).get("href")
+    if not href:
+        return None
+
+    link = urlsplit(href)
+    query = parse_qsl(link.query)
+    known = set(key for key, _ in query)
+    for key, value in parse_qsl(urlsplit(path).query):
+        if key not in known:
+            query.append((key, value))
+
+    return "{}?{}".format(link.path, urlencode(query))
+
+
+def first_page(path, limit=None):
+    """Build the path of the first page of a paginated collection
+
+    :param path: Path of the collection including its query parameters
+    :type path: str
+    :param limit: Number of resources per page, defaults to page_limit
+        from sdk.yaml or to the API default
+    :type limit: int, optional
+    :return: Path of the first page
+    :rtype: str
+    """
+    if limit is None:
+        config = sdk()
+        if config:
+            limit = config.get("page_limit")
+
+    if limit:
+        separator = "&" if "?" in path else "?"
+        path = "{}{}limit={}".format(path, separator, limit)
+
+    return path
+
+
+def read_page(path, data, key):
+    """Extract the resources of a page and the path of the next one
+
+    :param path: Path of the page
+    :type path: str
+    :param data: JSON response of the page
+    :type data: dict
+    :param key: Name of the resources list in the JSON response
+    :type key: str
+    :return: Resources, or the error returned by the API, and the path of
+        the next page or None if this is the last page
+    :rtype: tuple
+    """
+    if "errors" in data:
+        return [data], None
+
+    return data.get(key, []), next_page(path, data)
+
+
+def paginate(query, path, key, limit=None):
+    """Iterate over every resource of a paginated collection
+
+    Pages are requested one at a time by following the next link, resources
+    are yielded as soon as their page is received. If the API returns an
+    error, the error is yielded and the iteration stops.
+
+    :param query: Function retrieving the JSON data of a path
+    :type query: function
+    :param path: Path of the collection including its query parameters
+    :type path: str
+    :param key: Name of the resources list in the JSON response such as
+        "instances" or "subnets"
+    :type key: str
+    :param limit: Number of resources per page, defaults to page_limit
+        from sdk.yaml or to the API default
+    :type limit: int, optional
+    :return: Generator of resources
+    :rtype: generator
+    """
+    path = first_page(path, limit)
+    while path:
+        resources, path = read_page(path, query(path), key)
+        for resource in resources:
+            yield resource
+
+
+def is_id(value):
+    """Check if a value looks like an IBM Cloud ID or CRN
+
+    :param value: Value to check
+    :type value: str
+    :return: True if the value looks like an ID
+    :rtype: bool
+    """
+    return isinstance(value, str) and ID_REGEXP.match(value) is not None
+
+
+def is_not_found(data):
+    """Check if a response is a not found error
+
+    :param data: JSON response
+    :type data: dict
+    :return: True if the resource was not found
+    :rtype: bool
+    """
+    if not isinstance(data, dict) or "errors" not in data:
+        return False
+
+    errors = data["errors"]
+    if isinstance(errors, dict):
+        errors = [errors]
+
+    for error in errors:
+        return isinstance(error, dict) and error.get("code") == "not_found"
+
+    return False
+
+
+def resolve(by_id, by_name, args, fallback=None, id_key="id",
+            name_key="name"):
+    """Steps of a lookup by ID or by name
+
+    Generator shared by the synchronous and asyncio find_resource: it
+    yields the lookup to run with its arguments, receives its result and
+    returns the resource information.
+
+    :param by_id: Function retrieving the resource by ID
+    :type by_id: function
+    :param by_name: Function retrieving the resource by name
+    :type by_name: function
+    :param args: Arguments passed to the lookup functions, the last one
+        being the resource name or ID
+    :type args: tuple
+    :param fallback: Function used if the resource is still not found
+    :type fallback: function, optional
+    :param id_key: Name of the ID in the resource information
+    :type id_key: str, optional
+    :param name_key: Name of the name in the resource information, used
+        to detect a renamed resource
+    :type name_key: str, optional
+    :return: Generator of lookups and their arguments
+    :rtype: generator
+    """
+    key = None
+    lookups = [by_name, by_id]
+    if is_id(args[-1]):
+        lookups = [by_id, by_name]
+    else:
+        key = resolution_cache.key(by_id, args)
+        id = resolution_cache.get(key)
+        if id is not None:
+            data = yield by_id, args[:-1] + (id,)
+            # Error bodies, such as the Power ones without "errors", hold
+            # neither the ID nor the name
+            if (isinstance(data, dict) and data.get(id_key) == id
+                    and data.get(name_key) == args[-1]):
+                return data
+            # The resource has been deleted or renamed
+            resolution_cache.discard(key)
+
+    if fallback is not None:
+        lookups.append(fallback)
+
+    for lookup in lookups:
+        data = yield lookup, args
+        if not is_not_found(data):
+            break
+
+    if (lookup is by_name and key is not None and isinstance(data, dict)
+            and "errors" not in data and data.get(id_key)):
+        resolution_cache.set(key, data[id_key])
+
+    return data
+
+
+def find_resource(by_id, by_name, *args, fallback=None, id_key="id",
+                  name_key="name"):
+    """Retrieve a resource by ID or by name
+
+    If the resource looks like an ID or a CRN it is retrieved directly by ID
+    and the name lookup is only used if nothing is found, this avoids
+    listing the whole collection. Otherwise the name lookup comes first and
+    the ID lookup is used if nothing is found.
+
+    Names resolved by the name lookup are kept in the process-wide
+    resolution cache, next lookups of the same name only retrieve the
+    resource by ID.
+
+    :param by_id: Function retrieving the resource by ID
+    :type by_id: function
+    :param by_name: Function retrieving the resource by name
+    :type by_name: function
+    :param args: Arguments passed to the lookup functions, the last one
+        being the resource name or ID
+    :param fallback: Function used if the resource is still not found
+    :type fallback: function, optional
+    :param id_key: Name of the ID in the resource information
+    :type id_key: str, optional
+    :param name_key: Name of the name in the resource information, used
+        to detect a renamed resource
+    :type name_key: str, optional
+    :return: Resource information
+    :rtype: dict
+    """
+    steps = resolve(by_id, by_name, args, fallback, id_key, name_key)
+    data = None
+    while True:
+        try:
+            lookup, lookup_args = steps.send(data)
+        except StopIteration as stop:
+            return stop.value
+        data = lookup(*lookup_args)
+
+
+def iaas_path(cfg, *segments):
+    """Build the path of a VPC API query
+
+    :param cfg: Configuration holding the API version and generation
+    :type cfg: dict
+    :param segments: Collections and IDs such as "instances", an instance
+        ID and "actions"
+    :type segments: str
+    :return: Path with its version and generation parameters
+    :rtype: str
+    """
+    return "/v1/{}?version={}&generation={}".format(
+        "/".join(segments), cfg["version"], cfg["generation"])
+
+
+def build_payload(args):
+    """Build the JSON payload of a query from its arguments
+
+    :param args: Arguments with their default values
+    :type args: dict
+    :return: Payload without the arguments set to None
+    :rtype: dict
+    """
+    return {key: value for key, value in args.items() if value is not None}
 
 
 def check_args(arguments, **kwargs):
@@ -184,3 +782,7 @@ def resource_error(code, message):
     if code == 404:
         code = "not_found"
     return {"errors": {"code": code, "message": message}}
+
+
+hooks.register("after_response", _log_call)
+hooks.register("on_error", _log_call)
@@ -0,0 +1,104 @@
+import zlib
+
+# Encodings negotiated with the APIs
+ACCEPT_ENCODING = "gzip, deflate"
+
+# Size of the chunks read from a compressed response
+CHUNK_SIZE = 65536
+
+
+class Decompressor():
+    """Incremental decoder for gzip and deflate encoded bodies
+
+    Some servers send raw deflate streams without the zlib header, the
+    decoder switches to raw mode if the first chunk cannot be decoded.
+    """
+
+    def __init__(self, encoding):
+        self.encoding = encoding
+        # Accept both gzip and zlib headers
+        self.decoder = zlib.decompressobj(zlib.MAX_WBITS | 32)
+        self.started = False
+
+    def decompress(self, chunk):
+        """Decode a chunk of the body
+
+        :param chunk: Compressed data
+        :type chunk: bytes
+        :return: Decompressed data
+        :rtype: bytes
+        """
+        if not self.started and self.encoding == "deflate":
+            self.started = True
+            try:
+                return self.decoder.decompress(chunk)
+            except zlib.error:
+                self.decoder = zlib.decompressobj(-zlib.MAX_WBITS)
+
+        self.started = True
+        return self.decoder.decompress(chunk)
+
+    def flush(self):
+        """Retrieve the data left in the decoder
+
+        :return: Decompressed data
+        :rtype: bytes
+        """
+        return self.decoder.flush()
+
+
+def decompressor(encoding):
+    """Build a decoder for a Content-Encoding header
+
+    :param encoding: Value of the Content-Encoding header
+    :type encoding: str
+    :return: Decoder or None if the body is not compressed
+    :rtype: Decompressor
+    """
+    encoding = (encoding or "").strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return Decompressor("gzip")
+    if encoding == "deflate":
+        return Decompressor("deflate")
+
+    return None
+
+
+def read_body(response):
+    """Read a response body and decompress it on the fly
+
+    :param response: HTTP response
+    :type response: http.client.HTTPResponse
+    :return: Decompressed body
+    :rtype: bytes
+    """
+    decoder = decompressor(response.getheader("Content-Encoding"))
+    if decoder is None:
+        return response.read()
+
+    chunks = []
+    while True:
+        chunk = response.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        chunks.append(decoder.decompress(chunk))
+    chunks.append(decoder.flush())
+
+    return b"".join(chunks)
+
+
+def decompress(encoding, body):
+    """Decompress a body already read
+
+    :param encoding: Value of the Content-Encoding header
+    :type encoding: str
+    :param body: Body to decompress
+    :type body: bytes
+    :return: Decompressed body
+    :rtype: bytes
+    """
+    decoder = decompressor(encoding)
+    if decoder is None or not body:
+        return body
+
+    return decoder.decompress(body) + decoder.flush()
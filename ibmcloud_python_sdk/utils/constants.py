@@ -10,4 +10,20 @@ SL_URL = "api.softlayer.com"
 PI_URL = "power-iaas.cloud.ibm.com"
 COS_DOMAIN = "cloud-object-storage.appdomain.cloud"
 HTTP_TIMEOUT = 60
+POOL_SIZE = 10
+TOKEN_LIFETIME = 3600
+TOKEN_REFRESH_MARGIN = 300
+TOKEN_EXPIRY_SKEW = 60
+RESOLUTION_TTL = 300
+AIO_CONCURRENCY = 64
+BULK_WORKERS = 10
+RETRY_ATTEMPTS = 4
+RETRY_BACKOFF = 0.5
+RETRY_MAX_BACKOFF = 30
+RETRY_TIMEOUT = 120
+RETRY_STATUSES = [429, 502, 503, 504]
+CACHE_TTL = 60
+LOCAL_CACHE_ENTRIES = 1000
+LOCAL_CACHE_SIZE = 50 * 1024 * 1024
+CACHE_STALE_TTL = 3600
 USER_AGENT = "IBM Cloud Python SDK"
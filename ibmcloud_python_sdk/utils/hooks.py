@@ -0,0 +1,142 @@
+import threading
+import time
+
+# Events run by query_wrapper for every query
+EVENTS = ("before_request", "after_response", "on_error")
+
+
+class Call():
+    """Query seen by the hooks
+
+    :param conn_type: Connection type such as "iaas" or "rg"
+    :type conn_type: str
+    :param method: HTTP method
+    :type method: str
+    :param path: Path used by within the query
+    :type path: str
+    :param headers: Headers sent with the query, hooks could add headers
+        such as tracing ones in before_request
+    :type headers: dict
+    :param payload: Payload sent during the query
+    :type payload: str or bytes
+    """
+
+    def __init__(self, conn_type, method, path, headers=None, payload=None):
+        self.conn_type = conn_type
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.request_bytes = len(payload) if payload else 0
+        # Filled once the query is done
+        self.status = None
+        self.response = None
+        self.response_bytes = 0
+        self.attempts = 0
+        # Cache serving the response: "local", "memcached" or "revalidated"
+        self.cache = None
+        self.error = None
+        # Durations in seconds, "total" covers the whole query
+        self.timings = {}
+        self.started = time.monotonic()
+        self._template = None
+
+    @property
+    def template(self):
+        """Path without its query string and with IDs replaced by {id}
+
+        Such as "/v1/instances/{id}/network_interfaces", suitable to
+        group queries in metrics or traces.
+
+        :rtype: str
+        """
+        if self._template is None:
+            from ibmcloud_python_sdk.utils.common import is_id
+            segments = self.path.split("?", 1)[0].split("/")
+            self._template = "/".join("{id}" if is_id(segment) else segment
+                                      for segment in segments)
+
+        return self._template
+
+    def update(self, other):
+        """Copy the outcome of another call sharing the same query
+
+        :param other: Call which sent the query
+        :type other: Call
+        """
+        if other is not self:
+            for name in ("status", "response", "response_bytes", "attempts",
+                         "cache"):
+                setattr(self, name, getattr(other, name))
+            self.timings.update((name, value) for name, value
+                                in other.timings.items() if name != "total")
+
+    def finish(self, error=None):
+        """Record the end of the query
+
+        :param error: Exception raised by the query
+        :type error: Exception, optional
+        """
+        self.error = error
+        if self.response is not None:
+            self.status = self.response.status
+        self.timings["total"] = time.monotonic() - self.started
+
+
+class Hooks():
+    """Functions called around every query
+
+    Each function receives the Call of the query. ``before_request`` runs
+    before the query, ``after_response`` once a response is returned,
+    from the API or the cache, and ``on_error`` when the query raises an
+    exception. Exceptions raised by hooks are not caught.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.handlers = {event: () for event in EVENTS}
+
+    def register(self, event, func):
+        """Add a function to an event
+
+        :param event: Event name such as "after_response"
+        :type event: str
+        :param func: Function receiving the Call
+        :type func: function
+        :return: The function
+        :rtype: function
+        """
+        if event not in EVENTS:
+            raise ValueError("Unknown hook event {}".format(event))
+
+        with self.lock:
+            # Replaced rather than modified so running hooks need no lock
+            self.handlers[event] = self.handlers[event] + (func,)
+
+        return func
+
+    def unregister(self, event, func):
+        """Remove a function from an event
+
+        :param event: Event name such as "after_response"
+        :type event: str
+        :param func: Function to remove
+        :type func: function
+        """
+        with self.lock:
+            self.handlers[event] = tuple(
+                handler for handler in self.handlers[event]
+                if handler is not func)
+
+    def run(self, event, call):
+        """Call the functions of an event
+
+        :param event: Event name such as "after_response"
+        :type event: str
+        :param call: Query
+        :type call: Call
+        """
+        for func in self.handlers[event]:
+            func(call)
+
+
+hooks = Hooks()
@@ -0,0 +1,50 @@
+import importlib
+import threading
+
+
+class LazyModule():
+    """Module imported on first attribute access
+
+    Optional dependencies such as SoftLayer are heavy, they are imported
+    only when a feature using them is called.
+
+    :param name: Module name
+    :type name: str
+    :param extra: Extra installing the module
+    :type extra: str
+    """
+
+    def __init__(self, name, extra):
+        self._name = name
+        self._extra = extra
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = load(self._name, self._extra)
+
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+
+def load(name, extra):
+    """Import an optional dependency
+
+    :param name: Module name
+    :type name: str
+    :param extra: Extra installing the module
+    :type extra: str
+    :return: Imported module
+    :rtype: module
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError as error:
+        print("Error importing {}, install it with `pip install "
+              "ibmcloud-python-sdk[{}]`. {}".format(name, extra, error))
+        raise
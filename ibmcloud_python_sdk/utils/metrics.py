@@ -0,0 +1,276 @@
+import threading
+from ibmcloud_python_sdk.utils.hooks import hooks
+
+# Upper bounds of the latency histogram buckets in seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+def _escape(value):
+    return (str(value).replace("\\", "\\\\").replace("\"", "\\\"")
+            .replace("\n", "\\n"))
+
+
+def _labels(names, values, extra=None):
+    """Format a label set such as {conn_type="iaas",method="GET"}
+
+    :rtype: str
+    """
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+
+    return "{" + ",".join("{}=\"{}\"".format(name, _escape(value))
+                          for name, value in pairs) + "}"
+
+
+class Counter():
+    """Monotonic counter with labels
+
+    :param name: Metric name
+    :type name: str
+    :param description: Help text
+    :type description: str
+    :param labels: Label names
+    :type labels: tuple
+    """
+
+    type = "counter"
+
+    def __init__(self, name, description, labels=()):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.lock = threading.Lock()
+        self.values = {}
+
+    def inc(self, *labels, amount=1):
+        """Increment the counter of a label set
+
+        :param labels: Label values, in the order of the label names
+        :param amount: Increment
+        :type amount: int, optional
+        """
+        with self.lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def value(self, *labels):
+        """Retrieve the counter of a label set
+
+        :rtype: int
+        """
+        return self.values.get(labels, 0)
+
+    def samples(self):
+        with self.lock:
+            values = sorted(self.values.items())
+
+        for labels, value in values:
+            yield self.name + _labels(self.labels, labels), value
+
+    def reset(self):
+        with self.lock:
+            self.values = {}
+
+
+class Histogram(Counter):
+    """Distribution of observed values with labels
+
+    :param name: Metric name
+    :type name: str
+    :param description: Help text
+    :type description: str
+    :param labels: Label names
+    :type labels: tuple
+    :param buckets: Upper bounds of the buckets
+    :type buckets: tuple, optional
+    """
+
+    type = "histogram"
+
+    def __init__(self, name, description, labels=(), buckets=BUCKETS):
+        super().__init__(name, description, labels)
+        self.buckets = buckets
+
+    def observe(self, *labels, value):
+        """Record a value
+
+        :param labels: Label values, in the order of the label names
+        :param value: Observed value
+        :type value: float
+        """
+        with self.lock:
+            entry = self.values.get(labels)
+            if entry is None:
+                # Count per bucket, sum and count
+                entry = [[0] * len(self.buckets), 0.0, 0]
+                self.values[labels] = entry
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][index] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    def value(self, *labels):
+        """Retrieve the number of observations of a label set
+
+        :rtype: int
+        """
+        entry = self.values.get(labels)
+        return entry[2] if entry else 0
+
+    def samples(self):
+        with self.lock:
+            values = sorted((labels, (list(entry[0]), entry[1], entry[2]))
+                            for labels, entry in self.values.items())
+
+        for labels, (counts, total, count) in values:
+            cumulative = 0
+            for bound, bucket in zip(self.buckets, counts):
+                cumulative += bucket
+                yield self.name + "_bucket" + _labels(
+                    self.labels, labels, ("le", bound)), cumulative
+            yield self.name + "_bucket" + _labels(
+                self.labels, labels, ("le", "+Inf")), count
+            yield self.name + "_sum" + _labels(self.labels, labels), total
+            yield self.name + "_count" + _labels(self.labels, labels), count
+
+
+class Registry():
+    """Set of metrics rendered together"""
+
+    def __init__(self):
+        self.metrics = []
+
+    def counter(self, name, description, labels=()):
+        metric = Counter(name, description, labels)
+        self.metrics.append(metric)
+        return metric
+
+    def histogram(self, name, description, labels=(), buckets=BUCKETS):
+        metric = Histogram(name, description, labels, buckets)
+        self.metrics.append(metric)
+        return metric
+
+    def render(self):
+        """Render the metrics in Prometheus text exposition format
+
+        :rtype: str
+        """
+        lines = []
+        for metric in self.metrics:
+            lines.append("# HELP {} {}".format(metric.name,
+                                               metric.description))
+            lines.append("# TYPE {} {}".format(metric.name, metric.type))
+            for sample, value in metric.samples():
+                lines.append("{} {}".format(sample, value))
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """Set every metric back to zero"""
+        for metric in self.metrics:
+            metric.reset()
+
+
+registry = Registry()
+
+REQUESTS = registry.counter(
+    "ibmcloud_sdk_requests_total",
+    "Queries by connection type, method, path template and status, "
+    "status is \"cache\" for responses served from the cache",
+    ("conn_type", "method", "path", "status"))
+ERRORS = registry.counter(
+    "ibmcloud_sdk_request_errors_total",
+    "Queries which raised an exception",
+    ("conn_type", "method", "path", "error"))
+DURATION = registry.histogram(
+    "ibmcloud_sdk_request_duration_seconds",
+    "Query duration including retries",
+    ("conn_type", "method", "path"))
+SENT = registry.counter(
+    "ibmcloud_sdk_request_bytes_total",
+    "Bytes sent in request bodies", ("conn_type",))
+RECEIVED = registry.counter(
+    "ibmcloud_sdk_response_bytes_total",
+    "Bytes received in response bodies", ("conn_type",))
+CACHE = registry.counter(
+    "ibmcloud_sdk_cache_lookups_total",
+    "Cache lookups by tier and result: hit, stale or miss",
+    ("tier", "result"))
+TOKEN_REFRESHES = registry.counter(
+    "ibmcloud_sdk_token_refreshes_total",
+    "IAM token requests by result", ("result",))
+
+
+def record(conn_type, method, path, duration, status=None, error=None,
+           sent=0, received=0):
+    """Record a query
+
+    :param conn_type: Connection type such as "iaas", "softlayer" or "cos"
+    :type conn_type: str
+    :param method: HTTP or API method
+    :type method: str
+    :param path: Path template or API operation
+    :type path: str
+    :param duration: Duration in seconds
+    :type duration: float
+    :param status: Response status
+    :type status: str or int, optional
+    :param error: Exception raised by the query
+    :type error: Exception, optional
+    :param sent: Bytes sent
+    :type sent: int, optional
+    :param received: Bytes received
+    :type received: int, optional
+    """
+    if error is not None:
+        ERRORS.inc(conn_type, method, path, type(error).__name__)
+    else:
+        REQUESTS.inc(conn_type, method, path, str(status))
+    DURATION.observe(conn_type, method, path, value=duration)
+    if sent:
+        SENT.inc(conn_type, amount=sent)
+    if received:
+        RECEIVED.inc(conn_type, amount=received)
+
+
+def record_cache(tier, entry):
+    """Record a cache lookup
+
+    :param tier: Cache tier such as "local" or "memcached"
+    :type tier: str
+    :param entry: Entry found in the cache
+    :type entry: Entry
+    """
+    if entry is None:
+        result = "miss"
+    elif entry.fresh():
+        result = "hit"
+    else:
+        result = "stale"
+    CACHE.inc(tier, result)
+
+
+def _record_call(call):
+    status = call.status
+    if status is None and call.cache is not None:
+        status = "cache"
+    record(call.conn_type, call.method, call.template,
+           call.timings.get("total", 0), status=status, error=call.error,
+           sent=call.request_bytes, received=call.response_bytes)
+
+
+def snapshot():
+    """Retrieve every metric in Prometheus text exposition format
+
+    :return: Metrics
+    :rtype: str
+    """
+    return registry.render()
+
+
+hooks.register("after_response", _record_call)
+hooks.register("on_error", _record_call)
@@ -0,0 +1,195 @@
+import http.client
+import select
+import socket
+import threading
+import time
+from collections import deque
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import constants
+
+
+def _is_alive(conn):
+    """Check if an idle connection can still be used
+
+    An idle keep-alive socket should never be readable, if it is then the
+    server either closed it or sent unexpected data.
+
+    :param conn: Connection to check
+    :type conn: http.client.HTTPSConnection
+    :return: Connection state
+    :rtype: bool
+    """
+    if conn.sock is None:
+        # http.client will open a new socket on the next request
+        return True
+
+    try:
+        readable, _, _ = select.select([conn.sock], [], [], 0)
+    except (OSError, ValueError):
+        return False
+
+    return not readable
+
+
+class _TimedConnection():
+    """Connection recording how long it takes to connect
+
+    ``timings`` holds the duration of the DNS resolution and TCP connection
+    ("connect") in seconds. It is reset by the caller before each request,
+    so it stays empty when an open socket is reused.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.timings = {}
+        self._create_connection = self._timed_create_connection
+
+    def _timed_create_connection(self, *args, **kwargs):
+        started = time.monotonic()
+        sock = socket.create_connection(*args, **kwargs)
+        self.timings["connect"] = time.monotonic() - started
+        return sock
+
+
+class PlainConnection(_TimedConnection, http.client.HTTPConnection):
+    """HTTP connection for hosts defined as http://host:port
+
+    Used to reach local stand-in APIs such as the benchmarks server.
+    """
+
+
+class Connection(_TimedConnection, http.client.HTTPSConnection):
+    """HTTPS connection recording the TLS handshake duration as "tls"
+    """
+
+    def connect(self):
+        started = time.monotonic()
+        super().connect()
+        self.timings["tls"] = (time.monotonic() - started
+                               - self.timings.get("connect", 0))
+
+
+def connection(host, timeout):
+    """Create a connection to a host
+
+    :param host: Host such as "iam.cloud.ibm.com", HTTPS is used unless
+        the host starts with "http://"
+    :type host: str
+    :param timeout: Socket timeout in seconds
+    :type timeout: int
+    :return: HTTP or HTTPS connection
+    :rtype: Connection
+    """
+    scheme, separator, address = host.partition("://")
+    if not separator:
+        return Connection(host, timeout=timeout)
+    if scheme == "http":
+        return PlainConnection(address, timeout=timeout)
+
+    return Connection(address, timeout=timeout)
+
+
+class ConnectionPool():
+    """Keep-alive HTTPS connections grouped by host
+
+    Connections are handed out to one caller at a time and returned to the
+    pool once the response has been fully read. The number of idle
+    connections kept per host is defined by ``pool_size`` in ``sdk.yaml``.
+    """
+
+    def __init__(self, size=None):
+        self.size = size
+        self.lock = threading.Lock()
+        self.idle = {}
+
+    def _max_idle(self):
+        """Retrieve the number of idle connections to keep per host
+
+        Unless given to the pool, the size is read from sdk.yaml every time
+        so a changed ``pool_size`` applies to the next released connections.
+
+        :return: Pool size
+        :rtype: int
+        """
+        if self.size is not None:
+            return self.size
+
+        config = sdk() or {}
+        if config.get("pool_size") is not None:
+            return int(config["pool_size"])
+
+        return constants.POOL_SIZE
+
+    def get(self, host, timeout):
+        """Retrieve a connection for a host
+
+        Idle connections are reused first, dead ones are closed and
+        discarded. A new connection is created if none is available.
+
+        :param host: Host to connect to
+        :type host: str
+        :param timeout: Socket timeout in seconds
+        :type timeout: int
+        :return: HTTPS connection
+        :rtype: Connection
+        """
+        with self.lock:
+            conns = self.idle.get(host)
+            while conns:
+                conn = conns.pop()
+                if _is_alive(conn):
+                    conn.timeout = timeout
+                    if conn.sock is not None:
+                        conn.sock.settimeout(timeout)
+                    return conn
+                conn.close()
+
+        return connection(host, timeout)
+
+    def put(self, host, conn):
+        """Return a connection to the pool
+
+        The connection is closed if the pool for this host is full.
+
+        :param host: Host the connection is bound to
+        :type host: str
+        :param conn: Connection to release
+        :type conn: http.client.HTTPSConnection
+        """
+        size = self._max_idle()
+        with self.lock:
+            conns = self.idle.setdefault(host, deque())
+            if len(conns) < size:
+                conns.append(conn)
+                return
+
+        conn.close()
+
+    def release(self, host, conn, response):
+        """Release a connection once its response has been read
+
+        :param host: Host the connection is bound to
+        :type host: str
+        :param conn: Connection to release
+        :type conn: http.client.HTTPSConnection
+        :param response: Fully read HTTP response
+        :type response: http.client.HTTPResponse
+        """
+        response.close()
+        if response.will_close:
+            conn.close()
+        else:
+            self.put(host, conn)
+
+    def clear(self):
+        """Close every idle connection"""
+        with self.lock:
+            idle = self.idle
+            self.idle = {}
+
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+pool = ConnectionPool()
@@ -0,0 +1,158 @@
+import asyncio
+import functools
+import threading
+import time
+from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import constants
+
+
+def kind(cls):
+    """Name grouping the cached names of a resource class
+
+    The module and qualified name of the class, such as
+    "ibmcloud_python_sdk.vpc.subnet.Subnet", unless the class sets a
+    ``resolution_kind`` attribute to share the names of another class.
+
+    :param cls: Resource class
+    :type cls: type
+    :return: Kind of the class
+    :rtype: str
+    """
+    return (getattr(cls, "resolution_kind", None)
+            or "{}.{}".format(cls.__module__, cls.__qualname__))
+
+
+class ResolutionCache():
+    """Process-wide cache of resource names resolved to IDs
+
+    Entries are grouped by the class owning the lookup (see kind()) so a
+    create or a delete can drop every name of that kind.
+    The lifetime of an entry is defined by ``resolution_ttl`` in
+    ``sdk.yaml``, ``0`` disables the cache.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    def ttl(self):
+        """Retrieve entries lifetime in seconds
+
+        :return: Time to live
+        :rtype: int
+        """
+        config = sdk()
+        if config and config.get("resolution_ttl") is not None:
+            return config.get("resolution_ttl")
+
+        return constants.RESOLUTION_TTL
+
+    def key(self, lookup, args):
+        """Build the cache key of a lookup
+
+        :param lookup: Bound method retrieving the resource by ID
+        :type lookup: method
+        :param args: Arguments of the lookup, the last one being the name
+        :type args: tuple
+        :return: Cache key
+        :rtype: tuple
+        """
+        owner = getattr(lookup, "__self__", None)
+        cfg = params()
+
+        return (kind(type(owner)) if owner is not None else None,
+                lookup.__name__, cfg.get("region"), cfg.get("key"),
+                args)
+
+    def get(self, key):
+        """Retrieve the ID cached for a key
+
+        :param key: Cache key
+        :type key: tuple
+        :return: Resource ID or None if not cached or expired
+        :rtype: str
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] < time.monotonic():
+                del self.entries[key]
+                return None
+
+            return entry[0]
+
+    def set(self, key, id):
+        """Cache the ID of a resource
+
+        :param key: Cache key
+        :type key: tuple
+        :param id: Resource ID
+        :type id: str
+        """
+        ttl = self.ttl()
+        if not ttl:
+            return
+
+        with self.lock:
+            self.entries[key] = (id, time.monotonic() + ttl)
+
+    def discard(self, key):
+        """Remove a key from the cache
+
+        :param key: Cache key
+        :type key: tuple
+        """
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def invalidate(self, kind=None):
+        """Remove every entry of a kind
+
+        :param kind: Kind of a class such as
+            "ibmcloud_python_sdk.vpc.subnet.Subnet", every entry is removed
+            if not defined
+        :type kind: str, optional
+        """
+        with self.lock:
+            if kind is None:
+                self.entries.clear()
+                return
+
+            for key in [key for key in self.entries if key[0] == kind]:
+                del self.entries[key]
+
+
+resolution_cache = ResolutionCache()
+
+
+def invalidate_resolution(func):
+    """Decorate a create or delete method to invalidate cached names
+
+    Every name cached for the class of the method is dropped once the
+    method returns.
+
+    :param func: Method or coroutine creating or deleting a resource
+    :type func: function
+    :return: Decorated method
+    :rtype: function
+    """
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                resolution_cache.invalidate(kind(type(self)))
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            resolution_cache.invalidate(kind(type(self)))
+
+    return wrapper
@@ -0,0 +1,132 @@
+import email.utils
+import http.client
+import random
+import time
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import constants
+
+# Methods that could be sent again without side effect
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+# Errors raised when the connection failed before a response was received
+RETRY_ERRORS = (OSError, http.client.HTTPException)
+
+
+def retry_after(response):
+    """Read the Retry-After header of a response
+
+    :param response: HTTP response
+    :type response: http.client.HTTPResponse
+    :return: Delay in seconds or None if the header is missing or invalid
+    :rtype: float
+    """
+    value = response.getheader("Retry-After") if response else None
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    # Retry-After could also be an HTTP date
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date is None:
+        return None
+
+    return max(0.0, date.timestamp() - time.time())
+
+
+class RetryPolicy():
+    """Decide whether a failed query should be sent again and when
+
+    Retries use exponential backoff with full jitter so concurrent clients
+    don't retry in lockstep. A Retry-After header sent by the API takes
+    precedence. The policy is configured by the ``retry`` section of
+    ``sdk.yaml``.
+    """
+
+    def __init__(self, attempts=None, backoff=None, max_backoff=None,
+                 timeout=None, statuses=None):
+        config = (sdk() or {}).get("retry") or {}
+        self.attempts = int(attempts if attempts is not None else
+                            config.get("attempts", constants.RETRY_ATTEMPTS))
+        self.backoff = float(backoff if backoff is not None else
+                             config.get("backoff", constants.RETRY_BACKOFF))
+        self.max_backoff = float(
+            max_backoff if max_backoff is not None else
+            config.get("max_backoff", constants.RETRY_MAX_BACKOFF))
+        self.timeout = float(timeout if timeout is not None else
+                             config.get("timeout", constants.RETRY_TIMEOUT))
+        self.statuses = tuple(statuses if statuses is not None else
+                              config.get("statuses",
+                                         constants.RETRY_STATUSES))
+
+    def allowed(self, method, retry=None):
+        """Check if a query could be retried
+
+        :param method: HTTP method
+        :type method: str
+        :param retry: Force retries on (True) or off (False), the HTTP
+            method decides if not defined
+        :type retry: bool, optional
+        :return: Whether the query could be retried
+        :rtype: bool
+        """
+        if self.attempts <= 1:
+            return False
+        if retry is not None:
+            return retry
+
+        return method in IDEMPOTENT_METHODS
+
+    def retryable(self, response):
+        """Check if a response status is worth a retry
+
+        :param response: HTTP response
+        :type response: http.client.HTTPResponse
+        :return: Whether the query should be sent again
+        :rtype: bool
+        """
+        return response.status in self.statuses
+
+    def delay(self, attempt, response=None):
+        """Compute the delay before the next attempt
+
+        :param attempt: Number of attempts already made
+        :type attempt: int
+        :param response: Last HTTP response if any
+        :type response: http.client.HTTPResponse, optional
+        :return: Delay in seconds
+        :rtype: float
+        """
+        after = retry_after(response)
+        if after is not None:
+            return min(after, self.max_backoff)
+
+        return random.uniform(0, min(self.max_backoff,
+                                     self.backoff * 2 ** (attempt - 1)))
+
+    def schedule(self, attempt, started, response=None):
+        """Compute the delay before the next attempt within the limits
+
+        :param attempt: Number of attempts already made
+        :type attempt: int
+        :param started: Monotonic time of the first attempt
+        :type started: float
+        :param response: Last HTTP response if any
+        :type response: http.client.HTTPResponse, optional
+        :return: Delay in seconds or None if no attempt is left
+        :rtype: float
+        """
+        if attempt >= self.attempts:
+            return None
+
+        delay = self.delay(attempt, response)
+        if time.monotonic() + delay - started > self.timeout:
+            return None
+
+        return delay
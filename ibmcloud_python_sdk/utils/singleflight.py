@@ -0,0 +1,57 @@
+import threading
+
+
+class _Call():
+    """In-flight call shared by every waiting caller"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight():
+    """Coalesce identical calls running at the same time
+
+    The first caller of a key runs the function, callers arriving with the
+    same key while it runs wait for it and get the same result or
+    exception.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+
+    def do(self, key, func):
+        """Run a function once for every concurrent caller of a key
+
+        :param key: Key identifying identical calls
+        :type key: tuple
+        :param func: Function to run
+        :type func: function
+        :return: Result of the function
+        """
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self.calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.done.set()
+
+        return call.result
@@ -1,6 +1,52 @@
-import SoftLayer
+import time
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.utils import constants
+from ibmcloud_python_sdk.utils import metrics
+from ibmcloud_python_sdk.utils.lazy import LazyModule
+
+# Imported on first use, see the softlayer extra
+SoftLayer = LazyModule("SoftLayer", "softlayer")
+
+
+class MetricsTransport():
+    """SoftLayer transport recording every API call in the metrics
+
+    Calls are recorded with the "softlayer" connection type, the API
+    method as method and the service as path.
+
+    :param transport: Transport sending the calls
+    """
+
+    def __init__(self, transport):
+        self.transport = transport
+
+    def __call__(self, request):
+        started = time.monotonic()
+        try:
+            result = self.transport(request)
+        except Exception as error:
+            metrics.record("softlayer", request.method, request.service,
+                           time.monotonic() - started, error=error)
+            raise
+
+        metrics.record("softlayer", request.method, request.service,
+                       time.monotonic() - started, status=200)
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self.transport, name)
+
+
+def instrument(client):
+    """Record the calls of a SoftLayer client in the metrics
+
+    :param client: SoftLayer client
+    :return: The client
+    """
+    if not isinstance(client.transport, MetricsTransport):
+        client.transport = MetricsTransport(client.transport)
+
+    return client
 
 
 def client():
@@ -10,6 +56,8 @@ def client():
     """
     cfg = params()
     endpoint_url = "https://{}/rest/v3.1/".format(constants.SL_URL)
+    # Resolved before the try to import SoftLayer only once on error
+    softlayer_error = SoftLayer.SoftLayerError
     try:
         client = SoftLayer.create_client_from_env(
             username=cfg['cis_username'],
@@ -17,8 +65,8 @@ def client():
             endpoint_url=endpoint_url,
         )
 
-        return client
+        return instrument(client)
 
-    except SoftLayer.SoftLayerError as error:
+    except softlayer_error as error:
         print("Error creating SoftLayer client. {}".format(error))
         raise
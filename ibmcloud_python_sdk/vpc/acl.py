@@ -1,20 +1,26 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.utils.common import paginate
 from ibmcloud_python_sdk.vpc import vpc
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 from ibmcloud_python_sdk.resource import resource_group
 
 
 class Acl():
 
-    def __init__(self):
-        self.cfg = params()
-        self.vpc = vpc.Vpc()
-        self.rg = resource_group.ResourceGroup()
+    vpc = shared(vpc.Vpc)
+    rg = shared(resource_group.ResourceGroup)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_network_acls(self):
         """Retrieve network ACL list
@@ -34,6 +40,24 @@ class Acl():
             print("Error fetching network ACLs. {}".format(error))
             raise
 
+    def iter_network_acls(self, limit=None):
+        """Iterate over network ACLs
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of network ACLs per page
+        :type limit: int, optional
+        :return: Generator of network ACLs
+        :rtype: generator
+        """
+        path = ("/v1/network_acls?version={}&generation={}".format(
+            self.cfg["version"], self.cfg["generation"]))
+
+        return paginate(
+            lambda page: qw("iaas", "GET", page, headers())["data"],
+            path, "network_acls", limit)
+
     def get_network_acl(self, acl):
         """Retrieve specific network ACL
 
@@ -42,18 +66,8 @@ class Acl():
         :return: Network ACL information
         :rtype: dict
         """
-        by_name = self.get_network_acl_by_name(acl)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_network_acl_by_id(acl)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_network_acl_by_id,
+                             self.get_network_acl_by_name, acl)
 
     def get_network_acl_by_id(self, id):
         """Retrieve specific network ACL by ID
@@ -85,13 +99,10 @@ class Acl():
         :rtype: dict
         """
         try:
-            # Retrieve network ACLs
-            data = self.get_network_acls()
-            if "errors" in data:
-                return data
-
             # Loop over network ACLs until filter match
-            for acl in data['network_acls']:
+            for acl in self.iter_network_acls():
+                if "errors" in acl:
+                    return acl
                 if acl["name"] == name:
                     # Return data
                     return acl
@@ -112,18 +123,8 @@ class Acl():
         :return: Network ACL rules list
         :rtype: list
         """
-        by_name = self.get_network_acl_rules_by_name(acl)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_network_acl_rules_by_id(acl)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_network_acl_rules_by_id,
+                             self.get_network_acl_rules_by_name, acl)
 
     def get_network_acl_rules_by_id(self, id):
         """Retrieve rules for a specific network ACL by ID
@@ -193,18 +194,8 @@ class Acl():
         if "errors" in acl_info:
             return acl_info
 
-        by_name = self.get_network_acl_rule_by_name(acl, rule)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_network_acl_rule_by_id(acl, rule)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_network_acl_rule_by_id,
+                             self.get_network_acl_rule_by_name, acl, rule)
 
     def get_network_acl_rule_by_id(self, acl, id):
         """Retrieve specific rule for a specific network ACL by ID
@@ -273,6 +264,7 @@ class Acl():
                   "with ID {}. {}".format(name, acl_info["id"], error))
             raise
 
+    @invalidate_resolution
     def create_network_acl(self, **kwargs):
         """Create network ACL
 
@@ -333,12 +325,13 @@ class Acl():
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating network ACL. {}".format(error))
             raise
 
+    @invalidate_resolution
     def create_network_acl_rule(self, **kwargs):
         """Create network ACL rule
 
@@ -398,12 +391,13 @@ class Acl():
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating network ACL rule. {}".format(error))
             raise
 
+    @invalidate_resolution
     def delete_network_acl(self, acl):
         """Delete network ACL
 
@@ -435,6 +429,7 @@ class Acl():
             print("Error deleting network ACL with {}. {}".format(acl, error))
             raise
 
+    @invalidate_resolution
     def delete_network_acl_rule(self, acl, rule):
         """Delete network ACL rule
 
@@ -1,7 +1,9 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.utils.common import paginate
 from ibmcloud_python_sdk.vpc import vpc
 from ibmcloud_python_sdk.vpc import image
 from ibmcloud_python_sdk.vpc import subnet
@@ -13,20 +15,24 @@ from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.resource import resource_group
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 
 
 class Baremetal():
 
-    def __init__(self):
-        self.cfg = params()
-        self.vpc = vpc.Vpc()
-        self.image = image.Image()
-        self.subnet = subnet.Subnet()
-        self.security = security.Security()
-        self.fip = floating_ip.Fip()
-        self.volume = volume.Volume()
-        self.keyring = keyring.Key()
-        self.rg = resource_group.ResourceGroup()
+    vpc = shared(vpc.Vpc)
+    image = shared(image.Image)
+    subnet = shared(subnet.Subnet)
+    security = shared(security.Security)
+    fip = shared(floating_ip.Fip)
+    volume = shared(volume.Volume)
+    keyring = shared(keyring.Key)
+    rg = shared(resource_group.ResourceGroup)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_servers(self):
         """Retrieve bare metal server list
@@ -44,6 +50,24 @@ class Baremetal():
             print("Error fetching bare metal server. {}".format(error))
             raise
 
+    def iter_servers(self, limit=None):
+        """Iterate over bare metal servers
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of bare metal servers per page
+        :type limit: int, optional
+        :return: Generator of bare metal servers
+        :rtype: generator
+        """
+        path = ("/v1/bare_metal_servers?version={}&generation={}".format(
+            self.cfg["version"], self.cfg["generation"]))
+
+        return paginate(
+            lambda page: qw("iaas", "GET", page, headers())["data"],
+            path, "bare_metal_servers", limit)
+
     def get_server(self, bare_metal_server):
         """Retrieve specific bare metal server
 
@@ -52,18 +76,8 @@ class Baremetal():
         :return: Bare metal server information
         :rtype: dict
         """
-        by_name = self.get_server_by_name(bare_metal_server)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_server_by_id(bare_metal_server)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_server_by_id, self.get_server_by_name,
+                             bare_metal_server)
 
     def get_server_by_id(self, id):
         """Retrieve specific bare metal server by ID
@@ -95,11 +109,9 @@ class Baremetal():
         :rtype: dict
         """
         try:
-            data = self.get_servers()
-            if "errors" in data:
-                return data
-
-            for instance in data["bare_metal_servers"]:
+            for instance in self.iter_servers():
+                if "errors" in instance:
+                    return instance
                 if instance["name"] == name:
                     return instance
 
@@ -118,20 +130,9 @@ class Baremetal():
         :return: Bare metal server configuration information
         :rtype: dict
         """
-        by_name = self.get_server_configuration_by_name(
-            bare_metal_server)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_server_configuration_by_id(
-                        bare_metal_server)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_server_configuration_by_id,
+                             self.get_server_configuration_by_name,
+                             bare_metal_server)
 
     def get_server_configuration_by_id(self, id):
         """Retrieve initial configuration for a specific instance by ID
@@ -187,20 +188,9 @@ class Baremetal():
         :return: List of bare metal server's interfaces
         :rtype: list
         """
-        by_name = self.get_server_interfaces_by_name(
-            bare_metal_server)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_server_interfaces_by_id(
-                        bare_metal_server)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_server_interfaces_by_id,
+                             self.get_server_interfaces_by_name,
+                             bare_metal_server)
 
     def get_server_interfaces_by_id(self, id):
         """Retrieve network interfaces for a specific bare metal server by ID
@@ -259,21 +249,9 @@ class Baremetal():
         :return: Bare mental server's interface information
         :rtype: dict
         """
-        by_name = self.get_server_interface_by_name(
-            bare_metal_server, interface)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_server_interface_by_id(
-                        bare_metal_server,
-                        interface)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_server_interface_by_id,
+                             self.get_server_interface_by_name,
+                             bare_metal_server, interface)
 
     def get_server_interface_by_id(self, bare_metal_server, id):
         """Retrieve specific network interface for a specific bare metal server by ID
@@ -534,6 +512,7 @@ class Baremetal():
                 profile, error))
             raise
 
+    @invalidate_resolution
     def create_bare_metal_server(self, **kwargs):
         """Create BMS
 
@@ -704,12 +683,13 @@ class Baremetal():
                 self.cfg["version"], self.cfg["generation"]))
 
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating bare metal server. {}".format(error))
             raise
 
+    @invalidate_resolution
     def create_bare_metal_server_action(self, **kwargs):
         """Create bare metal server action
 
@@ -751,12 +731,13 @@ class Baremetal():
                                             self.cfg["generation"]))
 
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating bare metal server action. {}".format(error))
             raise
 
+    @invalidate_resolution
     def create_bare_metal_server_interface(self, **kwargs):
         """Create bare metal server interface
 
@@ -810,7 +791,7 @@ class Baremetal():
                                             self.cfg["generation"]))
 
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating bare metal server interface. {}".format(
@@ -921,12 +902,13 @@ class Baremetal():
                                             self.cfg["generation"]))
 
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating volume attachment. {}".format(error))
             raise
 
+    @invalidate_resolution
     def delete_bare_metal_server(self, bare_metal_server):
         """Delete bare metal server
 
@@ -958,6 +940,7 @@ class Baremetal():
                 bare_metal_server, error))
             raise
 
+    @invalidate_resolution
     def delete_bare_metal_server_interface(self, bare_metal_server, interface):
         """Delete interface from bare metal server
 
@@ -1,17 +1,23 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.utils.common import paginate
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 from ibmcloud_python_sdk.resource import resource_group
 
 
 class Fip():
 
-    def __init__(self):
-        self.cfg = params()
-        self.rg = resource_group.ResourceGroup()
+    rg = shared(resource_group.ResourceGroup)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_floating_ips(self):
         """Retrieve floating IP list
@@ -31,6 +37,24 @@ class Fip():
             print("Error fetching floating IPs. {}".format(error))
             raise
 
+    def iter_floating_ips(self, limit=None):
+        """Iterate over floating IPs
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of floating IPs per page
+        :type limit: int, optional
+        :return: Generator of floating IPs
+        :rtype: generator
+        """
+        path = ("/v1/floating_ips?version={}&generation={}".format(
+            self.cfg["version"], self.cfg["generation"]))
+
+        return paginate(
+            lambda page: qw("iaas", "GET", page, headers())["data"],
+            path, "floating_ips", limit)
+
     def get_floating_ip(self, fip):
         """Retrieve specific floating IP
 
@@ -39,27 +63,9 @@ class Fip():
         :return: Floating IP information
         :rtype: dict
         """
-        by_name = self.get_floating_ip_by_name(fip)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_floating_ip_by_id(fip)
-                    if "errors" in by_id:
-                        for key_id in by_id["errors"]:
-                            if key_id["code"] == "not_found":
-                                by_addr = self.get_floating_ip_by_address(fip)
-                                if "errors" in by_addr:
-                                    return by_addr
-                                else:
-                                    return by_addr
-                            else:
-                                return by_id
-                    else:
-                        return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_floating_ip_by_id,
+                             self.get_floating_ip_by_name, fip,
+                             fallback=self.get_floating_ip_by_address)
 
     def get_floating_ip_by_id(self, id):
         """Retrieve specific floating IP by ID
@@ -91,13 +97,10 @@ class Fip():
         :rtype: dict
         """
         try:
-            # Retrieve floating IPs
-            data = self.get_floating_ips()
-            if "errors" in data:
-                return data
-
             # Loop over instances until filter match
-            for fip in data["floating_ips"]:
+            for fip in self.iter_floating_ips():
+                if "errors" in fip:
+                    return fip
                 if fip["name"] == name:
                     # Return data
                     return fip
@@ -139,6 +142,7 @@ class Fip():
             raise
 
     # Reserve floating IP
+    @invalidate_resolution
     def reserve_floating_ip(self, **kwargs):
         """Create floating IP
 
@@ -183,12 +187,13 @@ class Fip():
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error reserving floating. {}".format(error))
             raise
 
+    @invalidate_resolution
     def release_floating_ip(self, fip):
         """Release floating IP
 
@@ -1,22 +1,28 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.utils.common import paginate
 from ibmcloud_python_sdk.vpc import vpc
 from ibmcloud_python_sdk.vpc import floating_ip
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 from ibmcloud_python_sdk.resource import resource_group
 
 
 class Gateway():
 
-    def __init__(self):
-        self.cfg = params()
-        self.vpc = vpc.Vpc()
-        self.fip = floating_ip.Fip()
-        self.rg = resource_group.ResourceGroup()
+    vpc = shared(vpc.Vpc)
+    fip = shared(floating_ip.Fip)
+    rg = shared(resource_group.ResourceGroup)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_public_gateways(self):
         """Retrieve public gateways list
@@ -36,6 +42,24 @@ class Gateway():
             print("Error fetching public gateways. {}".format(error))
             raise
 
+    def iter_public_gateways(self, limit=None):
+        """Iterate over public gateways
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of public gateways per page
+        :type limit: int, optional
+        :return: Generator of public gateways
+        :rtype: generator
+        """
+        path = ("/v1/public_gateways?version={}&generation={}".format(
+            self.cfg["version"], self.cfg["generation"]))
+
+        return paginate(
+            lambda page: qw("iaas", "GET", page, headers())["data"],
+            path, "public_gateways", limit)
+
     def get_public_gateway(self, gateway):
         """Retrieve specific public gateway
 
@@ -44,18 +68,8 @@ class Gateway():
         :return: Public gateway information
         :rtype: dict
         """
-        by_name = self.get_public_gateway_by_name(gateway)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_public_gateway_by_id(gateway)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_public_gateway_by_id,
+                             self.get_public_gateway_by_name, gateway)
 
     def get_public_gateway_by_id(self, id):
         """Retrieve specific public gateway by ID
@@ -87,13 +101,10 @@ class Gateway():
         :rtype: dict
         """
         try:
-            # Retrieve public gateways
-            data = self.get_public_gateways()
-            if "errors" in data:
-                return data
-
             # Loop over gateways until filter match
-            for gateway in data["public_gateways"]:
+            for gateway in self.iter_public_gateways():
+                if "errors" in gateway:
+                    return gateway
                 if gateway["name"] == name:
                     # Return data
                     return gateway
@@ -106,6 +117,7 @@ class Gateway():
                 name, error))
             raise
 
+    @invalidate_resolution
     def create_public_gateway(self, **kwargs):
         """Create public gateway
 
@@ -164,12 +176,13 @@ class Gateway():
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating public gateway. {}".format(error))
             raise
 
+    @invalidate_resolution
     def delete_public_gateway(self, gateway):
         """Delete public gateway
 
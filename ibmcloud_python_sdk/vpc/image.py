@@ -1,20 +1,26 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.utils.common import paginate
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 from ibmcloud_python_sdk.resource import resource_group
 from ibmcloud_python_sdk.vpc import volume
 
 
 class Image():
 
-    def __init__(self):
-        self.cfg = params()
-        self.rg = resource_group.ResourceGroup()
-        self.volume = volume.Volume()
+    rg = shared(resource_group.ResourceGroup)
+    volume = shared(volume.Volume)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_operating_systems(self):
         """Retrieve operating system list
@@ -73,6 +79,24 @@ class Image():
             print("Error fetching images. {}".format(error))
             raise
 
+    def iter_images(self, limit=None):
+        """Iterate over images
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of images per page
+        :type limit: int, optional
+        :return: Generator of images
+        :rtype: generator
+        """
+        path = ("/v1/images?version={}&generation={}".format(
+            self.cfg["version"], self.cfg["generation"]))
+
+        return paginate(
+            lambda page: qw("iaas", "GET", page, headers())["data"],
+            path, "images", limit)
+
     def get_image(self, image):
         """Retrieve specific image
 
@@ -81,18 +105,8 @@ class Image():
         :return: Image information
         :rtype: dict
         """
-        by_name = self.get_image_by_name(image)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_image_by_id(image)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_image_by_id, self.get_image_by_name,
+                             image)
 
     def get_image_by_id(self, id):
         """Retrieve specific image by ID
@@ -123,13 +137,10 @@ class Image():
         :rtype: dict
         """
         try:
-            # Retrieve images
-            data = self.get_images()
-            if "errors" in data:
-                return data
-
             # Loop over images until filter match
-            for image in data["images"]:
+            for image in self.iter_images():
+                if "errors" in image:
+                    return image
                 if image["name"] == name:
                     # Return data
                     return image
@@ -141,6 +152,7 @@ class Image():
             print("Error fetching image with name {}. {}".format(name, error))
             raise
 
+    @invalidate_resolution
     def create_image(self, **kwargs):
         """Create image
 
@@ -201,12 +213,13 @@ class Image():
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating image. {}".format(error))
             raise
 
+    @invalidate_resolution
     def delete_image(self, image):
         """Delete image
 
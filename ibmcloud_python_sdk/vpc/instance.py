@@ -1,30 +1,54 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.utils.common import paginate
+from ibmcloud_python_sdk.utils import bulk
 from ibmcloud_python_sdk.vpc import vpc
 from ibmcloud_python_sdk.vpc import image
 from ibmcloud_python_sdk.vpc import subnet
 from ibmcloud_python_sdk.vpc import floating_ip
 from ibmcloud_python_sdk.vpc import volume
 from ibmcloud_python_sdk.vpc import key as keyring
+from ibmcloud_python_sdk.utils.common import iaas_path
+from ibmcloud_python_sdk.utils.common import build_payload
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.resource import resource_group
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
+
+
+def instance_action_args(**kwargs):
+    """Build the arguments of an instance action
+
+    :return: Arguments of create_instance_action(), None when not set
+    :rtype: dict
+    """
+    check_args(["instance", "type"], **kwargs)
+
+    return {
+        'instance': kwargs.get('instance'),
+        'force': kwargs.get('force'),
+        'type': kwargs.get('type'),
+    }
 
 
 class Instance():
 
-    def __init__(self):
-        self.cfg = params()
-        self.vpc = vpc.Vpc()
-        self.image = image.Image()
-        self.subnet = subnet.Subnet()
-        self.fip = floating_ip.Fip()
-        self.volume = volume.Volume()
-        self.keyring = keyring.Key()
-        self.rg = resource_group.ResourceGroup()
+    vpc = shared(vpc.Vpc)
+    image = shared(image.Image)
+    subnet = shared(subnet.Subnet)
+    fip = shared(floating_ip.Fip)
+    volume = shared(volume.Volume)
+    keyring = shared(keyring.Key)
+    rg = shared(resource_group.ResourceGroup)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_instances(self):
         """Retrieve instances list
@@ -33,8 +57,7 @@ class Instance():
         :rtype: list
         """
         try:
-            path = ("/v1/instances?version={}&generation={}".format(
-                self.cfg["version"], self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances")
 
             return qw("iaas", "GET", path, headers())["data"]
 
@@ -42,6 +65,23 @@ class Instance():
             print("Error fetching instances. {}".format(error))
             raise
 
+    def iter_instances(self, limit=None):
+        """Iterate over instances
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of instances per page
+        :type limit: int, optional
+        :return: Generator of instances
+        :rtype: generator
+        """
+        path = iaas_path(self.cfg, "instances")
+
+        return paginate(
+            lambda page: qw("iaas", "GET", page, headers())["data"],
+            path, "instances", limit)
+
     def get_instance(self, instance):
         """Retrieve specific instance
 
@@ -50,18 +90,8 @@ class Instance():
         :return: Instance information
         :rtype: dict
         """
-        by_name = self.get_instance_by_name(instance)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_instance_by_id(instance)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_instance_by_id,
+                             self.get_instance_by_name, instance)
 
     def get_instance_by_id(self, id):
         """Retrieve specific instance by ID
@@ -72,8 +102,7 @@ class Instance():
         :rtype: dict
         """
         try:
-            path = ("/v1/instances/{}?version={}&generation={}".format(
-                id, self.cfg["version"], self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances", id)
 
             return qw("iaas", "GET", path, headers())["data"]
 
@@ -90,11 +119,9 @@ class Instance():
         :rtype: dict
         """
         try:
-            data = self.get_instances()
-            if "errors" in data:
-                return data
-
-            for instance in data["instances"]:
+            for instance in self.iter_instances():
+                if "errors" in instance:
+                    return instance
                 if instance["name"] == name:
                     return instance
 
@@ -105,6 +132,18 @@ class Instance():
                 name, error))
             raise
 
+    def get_instances_by_ids(self, ids, max_workers=None):
+        """Retrieve many instances by ID in parallel
+
+        :param ids: List of instance IDs
+        :type ids: list
+        :param max_workers: Number of requests running at the same time
+        :type max_workers: int, optional
+        :return: Instances information in the same order as IDs
+        :rtype: list
+        """
+        return bulk.run(self.get_instance_by_id, ids, max_workers)
+
     def get_instance_configuration(self, instance):
         """Retrieve initial configuration for a specific instance
 
@@ -113,18 +152,8 @@ class Instance():
         :return: Instance configuration information
         :rtype: dict
         """
-        by_name = self.get_instance_configuration_by_name(instance)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_instance_configuration_by_id(instance)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_instance_configuration_by_id,
+                             self.get_instance_configuration_by_name, instance)
 
     def get_instance_configuration_by_id(self, id):
         """Retrieve initial configuration for a specific instance by ID
@@ -135,9 +164,7 @@ class Instance():
         :rtype: dict
         """
         try:
-            path = ("/v1/instances/{}/initialization?version={}"
-                    "&generation={}".format(id, self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances", id, "initialization")
 
             return qw("iaas", "GET", path, headers())["data"]
 
@@ -159,10 +186,8 @@ class Instance():
             if "errors" in instance_info:
                 return instance_info
 
-            path = ("/v1/instances/{}/initialization?version={}"
-                    "&generation={}".format(instance_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances", instance_info["id"],
+                             "initialization")
 
             return qw("iaas", "GET", path, headers())["data"]
 
@@ -179,18 +204,8 @@ class Instance():
         :return: List of instance's interfaces
         :rtype: list
         """
-        by_name = self.get_instance_interfaces_by_name(instance)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_instance_interfaces_by_id(instance)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_instance_interfaces_by_id,
+                             self.get_instance_interfaces_by_name, instance)
 
     def get_instance_interfaces_by_id(self, id):
         """Retrieve network interfaces for a specific instance by ID
@@ -201,9 +216,7 @@ class Instance():
         :rtype: list
         """
         try:
-            path = ("/v1/instances/{}/network_interfaces?version={}"
-                    "&generation={}".format(id, self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances", id, "network_interfaces")
 
             return qw("iaas", "GET", path, headers())["data"]
 
@@ -225,10 +238,8 @@ class Instance():
             return instance_info
 
         try:
-            path = ("/v1/instances/{}/network_interfaces?version={}"
-                    "&generation={}".format(instance_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances", instance_info["id"],
+                             "network_interfaces")
 
             return qw("iaas", "GET", path, headers())["data"]
 
@@ -247,19 +258,9 @@ class Instance():
         :return: Instance's interface information
         :rtype: dict
         """
-        by_name = self.get_instance_interface_by_name(instance, interface)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_instance_interface_by_id(instance,
-                                                              interface)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_instance_interface_by_id,
+                             self.get_instance_interface_by_name, instance,
+                             interface)
 
     def get_instance_interface_by_id(self, instance, id):
         """Retrieve specific network interface for a specific instance by ID
@@ -276,10 +277,8 @@ class Instance():
             return instance_info
 
         try:
-            path = ("/v1/instances/{}/network_interfaces/{}?version={}"
-                    "&generation={}".format(instance_info["id"], id,
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances", instance_info["id"],
+                             "network_interfaces", id)
 
             return qw("iaas", "GET", path, headers())["data"]
 
@@ -339,11 +338,9 @@ class Instance():
             return interface_into
 
         try:
-            path = ("/v1/instances/{}/network_interfaces/{}/floating_ips"
-                    "?version={}&generation={}".format(instance_info["id"],
-                                                       interface_into["id"],
-                                                       self.cfg["version"],
-                                                       self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances", instance_info["id"],
+                             "network_interfaces", interface_into["id"],
+                             "floating_ips")
 
             return qw("iaas", "GET", path, headers())["data"]
 
@@ -389,12 +386,9 @@ class Instance():
                 ):
                     fip_info = fip["id"]
 
-            path = ("/v1/instances/{}/network_interfaces/{}/floating_ips/{}"
-                    "?version={}&generation={}".format(instance_info["id"],
-                                                       interface_into["id"],
-                                                       fip_info,
-                                                       self.cfg["version"],
-                                                       self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances", instance_info["id"],
+                             "network_interfaces", interface_into["id"],
+                             "floating_ips", fip_info)
 
             return qw("iaas", "GET", path, headers())["data"]
 
@@ -417,10 +411,8 @@ class Instance():
             return instance_info
 
         try:
-            path = ("/v1/instances/{}/volume_attachments"
-                    "?version={}&generation={}".format(instance_info["id"],
-                                                       self.cfg["version"],
-                                                       self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances", instance_info["id"],
+                             "volume_attachments")
 
             return qw("iaas", "GET", path, headers())["data"]
 
@@ -453,11 +445,8 @@ class Instance():
                 if vol["name"] == attachment or vol["id"] == attachment:
                     volume_info = vol["id"]
 
-            path = ("/v1/instances/{}/volume_attachments/{}"
-                    "?version={}&generation={}".format(instance_info["id"],
-                                                       volume_info,
-                                                       self.cfg["version"],
-                                                       self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances", instance_info["id"],
+                             "volume_attachments", volume_info)
 
             return qw("iaas", "GET", path, headers())["data"]
 
@@ -473,8 +462,7 @@ class Instance():
         :rtype: list
         """
         try:
-            path = ("/v1/instance/profiles?version={}&generation={}".format(
-                self.cfg["version"], self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instance/profiles")
 
             return qw("iaas", "GET", path, headers())["data"]
 
@@ -491,9 +479,7 @@ class Instance():
         :rtype: dict
         """
         try:
-            path = ("/v1/instance/profiles/{}?version={}"
-                    "&generation={}".format(profile, self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instance/profiles", profile)
 
             return qw("iaas", "GET", path, headers())["data"]
 
@@ -502,6 +488,7 @@ class Instance():
                 profile, error))
             raise
 
+    @invalidate_resolution
     def create_instance(self, **kwargs):
         """Create VSI
 
@@ -703,16 +690,16 @@ class Instance():
                     payload[key] = value
 
         try:
-            path = ("/v1/instances?version={}&generation={}".format(
-                self.cfg["version"], self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances")
 
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating instance. {}".format(error))
             raise
 
+    @invalidate_resolution
     def create_instance_action(self, **kwargs):
         """Create instance action
 
@@ -724,37 +711,27 @@ class Instance():
             and all queued actions deleted. Ignored for the start action
         :type force: bool, optional
         """
-        args = ["instance", "type"]
-        check_args(args, **kwargs)
-
-        args = {
-            'instance': kwargs.get('instance'),
-            'force': kwargs.get('force'),
-            'type': kwargs.get('type'),
-        }
+        args = instance_action_args(**kwargs)
 
         instance_info = self.get_instance(args["instance"])
         if "errors" in instance_info:
             return instance_info
 
-        payload = {}
-        for key, value in args.items():
-            if key != "instance" and value is not None:
-                payload[key] = value
+        payload = build_payload(args)
+        del payload["instance"]
 
         try:
-            path = ("/v1/instances/{}/actions?version={}"
-                    "&generation={}".format(instance_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances", instance_info["id"],
+                             "actions")
 
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating instance action. {}".format(error))
             raise
 
+    @invalidate_resolution
     def create_instance_interface(self, **kwargs):
         """Create instance interface
 
@@ -801,13 +778,11 @@ class Instance():
                     payload[key] = value
 
         try:
-            path = ("/v1/instances/{}/network_interfaces?version={}"
-                    "&generation={}".format(instance_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances", instance_info["id"],
+                             "network_interfaces")
 
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating instance interface. {}".format(error))
@@ -846,12 +821,9 @@ class Instance():
             return fip_info
 
         try:
-            path = ("/v1/instances/{}/network_interfaces/{}/floating_ips/{}"
-                    "?version={}&generation={}".format(instance_info["id"],
-                                                       interface_info["id"],
-                                                       fip_info["id"],
-                                                       self.cfg["version"],
-                                                       self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances", instance_info["id"],
+                             "network_interfaces", interface_info["id"],
+                             "floating_ips", fip_info["id"])
 
             return qw("iaas", "PUT", path, headers(), None)["data"]
 
@@ -903,18 +875,17 @@ class Instance():
                     payload[key] = value
 
         try:
-            path = ("/v1/instances/{}/volume_attachments?version={}"
-                    "&generation={}".format(instance_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances", instance_info["id"],
+                             "volume_attachments")
 
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating volume attachment. {}".format(error))
             raise
 
+    @invalidate_resolution
     def delete_instance(self, instance):
         """Delete instance
 
@@ -928,9 +899,7 @@ class Instance():
             if "errors" in instance_info:
                 return instance_info
 
-            path = ("/v1/instances/{}?version={}&generation={}".format(
-                instance_info["id"], self.cfg["version"],
-                self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances", instance_info["id"])
 
             data = qw("iaas", "DELETE", path, headers())
 
@@ -943,6 +912,19 @@ class Instance():
             print("Error deleting instance {}. {}".format(instance, error))
             raise
 
+    def delete_instances(self, instances, max_workers=None):
+        """Delete many instances in parallel
+
+        :param instances: List of instance names or IDs
+        :type instances: list
+        :param max_workers: Number of requests running at the same time
+        :type max_workers: int, optional
+        :return: Delete status of each instance in the same order
+        :rtype: list
+        """
+        return bulk.run(self.delete_instance, instances, max_workers)
+
+    @invalidate_resolution
     def delete_instance_interface(self, instance, interface):
         """Delete interface from instance
 
@@ -962,11 +944,8 @@ class Instance():
             if "errors" in interface_info:
                 return interface_info
 
-            path = ("/v1/instances/{}/network_interfaces/{}?version={}"
-                    "&generation={}".format(instance_info["id"],
-                                            interface_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances", instance_info["id"],
+                             "network_interfaces", interface_info["id"])
 
             data = qw("iaas", "DELETE", path, headers())
 
@@ -1002,12 +981,9 @@ class Instance():
             if "errors" in fip_info:
                 return fip_info
 
-            path = ("/v1/instances/{}/network_interfaces/{}/floating_ips/{}"
-                    "?version={}&generation={}".format(instance_info["id"],
-                                                       interface_info["id"],
-                                                       fip_info["id"],
-                                                       self.cfg["version"],
-                                                       self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances", instance_info["id"],
+                             "network_interfaces", interface_info["id"],
+                             "floating_ips", fip_info["id"])
 
             data = qw("iaas", "DELETE", path, headers())
 
@@ -1040,11 +1016,8 @@ class Instance():
             if "errors" in attachment_info:
                 return attachment_info
 
-            path = ("/v1/instances/{}/volume_attachments/{}"
-                    "?version={}&generation={}".format(instance_info["id"],
-                                                       attachment_info["id"],
-                                                       self.cfg["version"],
-                                                       self.cfg["generation"]))
+            path = iaas_path(self.cfg, "instances", instance_info["id"],
+                             "volume_attachments", attachment_info["id"])
 
             data = qw("iaas", "DELETE", path, headers())
 
@@ -1,18 +1,42 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.utils.common import paginate
+from ibmcloud_python_sdk.utils.common import iaas_path
+from ibmcloud_python_sdk.utils.common import build_payload
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 from ibmcloud_python_sdk.resource import resource_group
 
 
+def key_args(**kwargs):
+    """Build the arguments of a key creation with their default values
+
+    :return: Arguments of create_key(), None when not set
+    :rtype: dict
+    """
+    check_args(["public_key"], **kwargs)
+
+    return {
+        'name': kwargs.get('name'),
+        'public_key': kwargs.get('public_key'),
+        'resource_group': kwargs.get('resource_group'),
+        'type': kwargs.get('type', 'rsa'),
+    }
+
+
 class Key():
 
-    def __init__(self):
-        self.cfg = params()
-        self.rg = resource_group.ResourceGroup()
+    rg = shared(resource_group.ResourceGroup)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_keys(self):
         """Retrieve key list
@@ -22,8 +46,7 @@ class Key():
         """
         try:
             # Connect to api endpoint for keys
-            path = ("/v1/keys?version={}&generation={}".format(
-                self.cfg["version"], self.cfg["generation"]))
+            path = iaas_path(self.cfg, "keys")
 
             # Return data
             return qw("iaas", "GET", path, headers())["data"]
@@ -32,6 +55,23 @@ class Key():
             print("Error fetching keys. {}".format(error))
             raise
 
+    def iter_keys(self, limit=None):
+        """Iterate over keys
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of keys per page
+        :type limit: int, optional
+        :return: Generator of keys
+        :rtype: generator
+        """
+        path = iaas_path(self.cfg, "keys")
+
+        return paginate(
+            lambda page: qw("iaas", "GET", page, headers())["data"],
+            path, "keys", limit)
+
     def get_key(self, key):
         """Retrieve specific key
 
@@ -40,18 +80,7 @@ class Key():
         :return: Key information
         :rtype: dict
         """
-        by_name = self.get_key_by_name(key)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_key_by_id(key)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_key_by_id, self.get_key_by_name, key)
 
     def get_key_by_id(self, id):
         """Retrieve specific key by ID
@@ -63,8 +92,7 @@ class Key():
         """
         try:
             # Connect to api endpoint for keys
-            path = ("/v1/keys/{}?version={}&generation={}".format(
-                id, self.cfg["version"], self.cfg["generation"]))
+            path = iaas_path(self.cfg, "keys", id)
 
             # Return data
             return qw("iaas", "GET", path, headers())["data"]
@@ -82,13 +110,10 @@ class Key():
         :rtype: dict
         """
         try:
-            # Retrieve keys
-            data = self.get_keys()
-            if "errors" in data:
-                return data
-
             # Loop over keys until filter match
-            for key in data["keys"]:
+            for key in self.iter_keys():
+                if "errors" in key:
+                    return key
                 if key["name"] == name:
                     # Return data
                     return key
@@ -100,6 +125,7 @@ class Key():
             print("Error fetching key with name {}. {}".format(name, error))
             raise
 
+    @invalidate_resolution
     def create_key(self, **kwargs):
         """Create key
 
@@ -113,43 +139,30 @@ class Key():
         :param type: The cryptosystem used by this key
         :type type: str, optional
         """
-        args = ["public_key"]
-        check_args(args, **kwargs)
-
         # Build dict of argument and assign default value when needed
-        args = {
-            'name': kwargs.get('name'),
-            'public_key': kwargs.get('public_key'),
-            'resource_group': kwargs.get('resource_group'),
-            'type': kwargs.get('type', 'rsa'),
-        }
+        args = key_args(**kwargs)
 
         # Construct payload
-        payload = {}
-        for key, value in args.items():
-            if value is not None:
-                if key == "resource_group":
-                    rg_info = self.rg.get_resource_group(
-                        args["resource_group"])
-                    if "errors" in rg_info:
-                        return rg_info
-                    payload["resource_group"] = {"id": rg_info["id"]}
-                else:
-                    payload[key] = value
+        payload = build_payload(args)
+        if "resource_group" in payload:
+            rg_info = self.rg.get_resource_group(args["resource_group"])
+            if "errors" in rg_info:
+                return rg_info
+            payload["resource_group"] = {"id": rg_info["id"]}
 
         try:
             # Connect to api endpoint for keys
-            path = ("/v1/keys?version={}&generation={}".format(
-                self.cfg["version"], self.cfg["generation"]))
+            path = iaas_path(self.cfg, "keys")
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating key. {}".format(error))
             raise
 
+    @invalidate_resolution
     def delete_key(self, key):
         """Delete key
 
@@ -165,8 +178,7 @@ class Key():
                 return key_info
 
             # Connect to api endpoint for keys
-            path = ("/v1/keys/{}?version={}&generation={}".format(
-                key_info["id"], self.cfg["version"], self.cfg["generation"]))
+            path = iaas_path(self.cfg, "keys", key_info["id"])
 
             data = qw("iaas", "DELETE", path, headers())
 
@@ -1,20 +1,26 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.utils.common import paginate
 from ibmcloud_python_sdk.vpc import subnet
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 from ibmcloud_python_sdk.resource import resource_group
 
 
 class Loadbalancer():
 
-    def __init__(self):
-        self.cfg = params()
-        self.subnet = subnet.Subnet()
-        self.rg = resource_group.ResourceGroup()
+    subnet = shared(subnet.Subnet)
+    rg = shared(resource_group.ResourceGroup)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_lbs(self):
         """Retrieve load balancer list
@@ -34,6 +40,24 @@ class Loadbalancer():
             print("Error fetching load balancers. {}".format(error))
             raise
 
+    def iter_lbs(self, limit=None):
+        """Iterate over load balancers
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of load balancers per page
+        :type limit: int, optional
+        :return: Generator of load balancers
+        :rtype: generator
+        """
+        path = ("/v1/load_balancers?version={}&generation={}".format(
+            self.cfg["version"], self.cfg["generation"]))
+
+        return paginate(
+            lambda page: qw("iaas", "GET", page, headers())["data"],
+            path, "load_balancers", limit)
+
     def get_lb(self, lb):
         """Retrieve specific load balancer
 
@@ -42,18 +66,7 @@ class Loadbalancer():
         :return: Load balancer information
         :rtype: dict
         """
-        by_name = self.get_lb_by_name(lb)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_lb_by_id(lb)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_lb_by_id, self.get_lb_by_name, lb)
 
     def get_lb_by_id(self, id):
         """Retrieve specific load balancer by ID
@@ -85,13 +98,10 @@ class Loadbalancer():
         :rtype: dict
         """
         try:
-            # Retrieve load balancers
-            data = self.get_lbs()
-            if "errors" in data:
-                return data
-
             # Loop over load balancers until filter match
-            for lb in data["load_balancers"]:
+            for lb in self.iter_lbs():
+                if "errors" in lb:
+                    return lb
                 if lb["name"] == name:
                     # Return data
                     return lb
@@ -292,19 +302,9 @@ class Loadbalancer():
         :return: Listerner information
         :rtype: dict
         """
-        by_name = self.get_lb_listener_policy_by_name(lb, listener, policy)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_lb_listener_policy_by_id(lb, listener,
-                                                              policy)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_lb_listener_policy_by_id,
+                             self.get_lb_listener_policy_by_name, lb, listener,
+                             policy)
 
     def get_lb_listener_policy_by_id(self, lb, listener, id):
         """Retrieve specific policy from listener by ID
@@ -488,18 +488,8 @@ class Loadbalancer():
         :return: Pool information
         :rtype: dict
         """
-        by_name = self.get_lb_pool_by_name(lb, pool)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_lb_pool_by_id(lb, pool)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_lb_pool_by_id, self.get_lb_pool_by_name,
+                             lb, pool)
 
     def get_lb_pool_by_id(self, lb, id):
         """Retrieve specific pool from load balancer by ID
@@ -705,6 +695,7 @@ class Loadbalancer():
                   " load balancer {}. {}".format(member, pool, lb, error))
             raise
 
+    @invalidate_resolution
     def create_lb(self, **kwargs):
         """Create load balancer
 
@@ -779,12 +770,13 @@ class Loadbalancer():
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating load balancer. {}".format(error))
             raise
 
+    @invalidate_resolution
     def create_listener(self, **kwargs):
         """Create listener
 
@@ -852,13 +844,14 @@ class Loadbalancer():
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating listener in load balancer {}. {}".format(
                 lb_info["id"], error))
             raise
 
+    @invalidate_resolution
     def create_policy(self, **kwargs):
         """Create policy
 
@@ -922,13 +915,14 @@ class Loadbalancer():
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating policy for listener {} in load balancer"
                   " {}. {}".format(listener_info["id"], lb_info["id"], error))
             raise
 
+    @invalidate_resolution
     def create_rule(self, **kwargs):
         """Create rule
 
@@ -1000,7 +994,7 @@ class Loadbalancer():
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating rule for policy {} for listener {} in load"
@@ -1009,6 +1003,7 @@ class Loadbalancer():
                                             lb_info["id"], error))
             raise
 
+    @invalidate_resolution
     def create_pool(self, **kwargs):
         """Create pool
 
@@ -1072,13 +1067,14 @@ class Loadbalancer():
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating pool in load balancer {}. {}".format(
                 lb_info["id"], error))
             raise
 
+    @invalidate_resolution
     def create_member(self, **kwargs):
         """Create member and add member to the pool
 
@@ -1134,13 +1130,14 @@ class Loadbalancer():
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating member into pool {} for load balancer"
                   " {}. {}".format(pool_info["id"], lb_info["id"], error))
             raise
 
+    @invalidate_resolution
     def delete_lb(self, lb):
         """Delete load balancer
 
@@ -1173,6 +1170,7 @@ class Loadbalancer():
             print("Error deleting load balancer {}. {}".format(lb, error))
             raise
 
+    @invalidate_resolution
     def delete_listener(self, lb, listener):
         """Delete listener from load balancer
 
@@ -1214,6 +1212,7 @@ class Loadbalancer():
                   " {}".format(listener, lb, error))
             raise
 
+    @invalidate_resolution
     def delete_policy(self, lb, listener, policy):
         """Delete policy from listener
 
@@ -1264,6 +1263,7 @@ class Loadbalancer():
                   " {}. {}".format(policy, listener, lb, error))
             raise
 
+    @invalidate_resolution
     def delete_rule(self, lb, listener, policy, rule):
         """Delete rule from policy
 
@@ -1327,6 +1327,7 @@ class Loadbalancer():
                                                  error))
             raise
 
+    @invalidate_resolution
     def delete_pool(self, lb, pool):
         """Delete pool from load balancer
 
@@ -1368,6 +1369,7 @@ class Loadbalancer():
                   " {}".format(pool, lb, error))
             raise
 
+    @invalidate_resolution
     def delete_member(self, lb, pool, member):
         """Delete member from pool
 
@@ -1,22 +1,28 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.utils.common import paginate
 from ibmcloud_python_sdk.vpc import vpc
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 from ibmcloud_python_sdk.resource import resource_group
 from ibmcloud_python_sdk.vpc import instance
 
 
 class Security():
 
-    def __init__(self):
-        self.cfg = params()
-        self.vpc = vpc.Vpc()
-        self.rg = resource_group.ResourceGroup()
-        self.instance = instance.Instance()
+    vpc = shared(vpc.Vpc)
+    rg = shared(resource_group.ResourceGroup)
+    instance = shared(instance.Instance)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_security_groups(self):
         """Retrieve security group list
@@ -36,6 +42,24 @@ class Security():
             print("Error fetching security groups. {}".format(error))
             raise
 
+    def iter_security_groups(self, limit=None):
+        """Iterate over security groups
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of security groups per page
+        :type limit: int, optional
+        :return: Generator of security groups
+        :rtype: generator
+        """
+        path = ("/v1/security_groups?version={}&generation={}".format(
+            self.cfg["version"], self.cfg["generation"]))
+
+        return paginate(
+            lambda page: qw("iaas", "GET", page, headers())["data"],
+            path, "security_groups", limit)
+
     def get_security_group(self, security_group):
         """Retrieve specific security group
 
@@ -44,18 +68,8 @@ class Security():
         :return: Security group information
         :rtype: dict
         """
-        by_name = self.get_security_group_by_name(security_group)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_security_group_by_id(security_group)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_security_group_by_id,
+                             self.get_security_group_by_name, security_group)
 
     def get_security_group_by_id(self, id):
         """Retrieve specific security group by ID
@@ -87,13 +101,10 @@ class Security():
         :rtype: dict
         """
         try:
-            # Retrieve security groups
-            data = self.get_security_groups()
-            if "errors" in data:
-                return data
-
             # Loop over security groups until filter match
-            for sg in data['security_groups']:
+            for sg in self.iter_security_groups():
+                if "errors" in sg:
+                    return sg
                 if sg["name"] == name:
                     # Return data
                     return sg
@@ -144,20 +155,9 @@ class Security():
         :return: Target information
         :rtype: dict
         """
-        by_name = self.get_security_group_target_by_name(security_group,
-                                                         target)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_security_group_target_by_id(
-                        security_group, target)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_security_group_target_by_id,
+                             self.get_security_group_target_by_name,
+                             security_group, target)
 
     def get_security_group_target_by_id(self, security_group, id):
         """Retrieve specific network interface associated to a security group
@@ -357,6 +357,7 @@ class Security():
                   " {}. {}".format(target, args["security_group"], error))
             raise
 
+    @invalidate_resolution
     def create_security_group(self, **kwargs):
         """Create security group
 
@@ -411,12 +412,13 @@ class Security():
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating security group. {}".format(error))
             raise
 
+    @invalidate_resolution
     def create_security_group_rule(self, **kwargs):
         """Create security group rule
 
@@ -491,12 +493,13 @@ class Security():
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating security group rule. {}".format(error))
             raise
 
+    @invalidate_resolution
     def delete_security_group(self, security_group):
         """Delete security group
 
@@ -565,6 +568,7 @@ class Security():
                   " {}. {}".format(target, security_group, error))
             raise
 
+    @invalidate_resolution
     def delete_security_group_rule(self, security_group, rule):
         """Delete rule from security group
 
@@ -1,24 +1,31 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.utils.common import paginate
 from ibmcloud_python_sdk.vpc import gateway as gw
 from ibmcloud_python_sdk.vpc import vpc
 from ibmcloud_python_sdk.vpc import acl
+from ibmcloud_python_sdk.utils.common import iaas_path
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 from ibmcloud_python_sdk.resource import resource_group
 
 
 class Subnet():
 
-    def __init__(self):
-        self.cfg = params()
-        self.vpc = vpc.Vpc()
-        self.gateway = gw.Gateway()
-        self.acl = acl.Acl()
-        self.rg = resource_group.ResourceGroup()
+    vpc = shared(vpc.Vpc)
+    gateway = shared(gw.Gateway)
+    acl = shared(acl.Acl)
+    rg = shared(resource_group.ResourceGroup)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_subnets(self):
         """Retrieve subnet list
@@ -28,8 +35,7 @@ class Subnet():
         """
         try:
             # Connect to api endpoint for subnets
-            path = ("/v1/subnets?version={}&generation={}".format(
-                self.cfg["version"], self.cfg["generation"]))
+            path = iaas_path(self.cfg, "subnets")
 
             # Return data
             return qw("iaas", "GET", path, headers())["data"]
@@ -38,6 +44,23 @@ class Subnet():
             print("Error fetching subnets. {}".format(error))
             raise
 
+    def iter_subnets(self, limit=None):
+        """Iterate over subnets
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of subnets per page
+        :type limit: int, optional
+        :return: Generator of subnets
+        :rtype: generator
+        """
+        path = iaas_path(self.cfg, "subnets")
+
+        return paginate(
+            lambda page: qw("iaas", "GET", page, headers())["data"],
+            path, "subnets", limit)
+
     def get_subnet(self, subnet):
         """Retrieve specific subnet
 
@@ -46,18 +69,8 @@ class Subnet():
         :return: Subnet information
         :rtype: dict
         """
-        by_name = self.get_subnet_by_name(subnet)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_subnet_by_id(subnet)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_subnet_by_id, self.get_subnet_by_name,
+                             subnet)
 
     def get_subnet_by_id(self, id):
         """Retrieve specific subnet by ID
@@ -69,8 +82,7 @@ class Subnet():
         """
         try:
             # Connect to api endpoint for subnets
-            path = ("/v1/subnets/{}?version={}&generation={}".format(
-                id, self.cfg["version"], self.cfg["generation"]))
+            path = iaas_path(self.cfg, "subnets", id)
 
             # Return data
             return qw("iaas", "GET", path, headers())["data"]
@@ -88,13 +100,10 @@ class Subnet():
         :rtype: dict
         """
         try:
-            # Retrieve subnets
-            data = self.get_subnets()
-            if "errors" in data:
-                return data
-
             # Loop over subnets until filter match
-            for subnet in data["subnets"]:
+            for subnet in self.iter_subnets():
+                if "errors" in subnet:
+                    return subnet
                 if subnet["name"] == name:
                     # Return data
                     return subnet
@@ -121,10 +130,8 @@ class Subnet():
                 return subnet_info
 
             # Connect to api endpoint for subnets
-            path = ("/v1/subnets/{}/network_acl?version={}"
-                    "&generation={}".format(subnet_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "subnets", subnet_info["id"],
+                             "network_acl")
 
             return qw("iaas", "GET", path, headers())["data"]
 
@@ -148,10 +155,8 @@ class Subnet():
                 return subnet_info
 
             # Connect to api endpoint for subnets
-            path = ("/v1/subnets/{}/public_gateway?version={}"
-                    "&generation={}".format(subnet_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "subnets", subnet_info["id"],
+                             "public_gateway")
 
             return qw("iaas", "GET", path, headers())["data"]
 
@@ -160,6 +165,7 @@ class Subnet():
                 subnet, error))
             raise
 
+    @invalidate_resolution
     def create_subnet(self, **kwargs):
         """Create subnet
 
@@ -239,12 +245,11 @@ class Subnet():
 
         try:
             # Connect to api endpoint for subnets
-            path = ("/v1/subnets?version={}&generation={}".format(
-                self.cfg["version"], self.cfg["generation"]))
+            path = iaas_path(self.cfg, "subnets")
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating subnet. {}".format(error))
@@ -283,14 +288,12 @@ class Subnet():
 
         try:
             # Connect to api endpoint for subnets
-            path = ("/v1/subnets/{}/network_acl?version={}"
-                    "&generation={}".format(subnet_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "subnets", subnet_info["id"],
+                             "network_acl")
 
             # Return data
             return qw("iaas", "PUT", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error attaching network ACL {} to subnet"
@@ -330,14 +333,12 @@ class Subnet():
 
         try:
             # Connect to api endpoint for subnets
-            path = ("/v1/subnets/{}/public_gateway?version={}"
-                    "&generation={}".format(subnet_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "subnets", subnet_info["id"],
+                             "public_gateway")
 
             # Return data
             return qw("iaas", "PUT", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error attaching public gateway {} to subnet {}. {}".format(
@@ -360,10 +361,8 @@ class Subnet():
 
         try:
             # Connect to api endpoint for subnets
-            path = ("/v1/subnets/{}/public_gateway?version={}"
-                    "&generation={}".format(subnet_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "subnets", subnet_info["id"],
+                             "public_gateway")
 
             data = qw("iaas", "DELETE", path, headers())
 
@@ -379,6 +378,7 @@ class Subnet():
                   "subnet {}. {}".format(subnet, error))
             raise
 
+    @invalidate_resolution
     def delete_subnet(self, subnet):
         """Delete subnet
 
@@ -394,9 +394,7 @@ class Subnet():
                 return subnet_info
 
             # Connect to api endpoint for subnets
-            path = ("/v1/subnets/{}?version={}&generation={}".format(
-                subnet_info["id"], self.cfg["version"],
-                self.cfg["generation"]))
+            path = iaas_path(self.cfg, "subnets", subnet_info["id"])
 
             data = qw("iaas", "DELETE", path, headers())
 
@@ -1,18 +1,24 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.utils.common import paginate
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 from ibmcloud_python_sdk.resource import resource_group
 
 
 class Volume():
 
-    def __init__(self):
-        self.cfg = params()
-        self.rg = resource_group.ResourceGroup()
+    rg = shared(resource_group.ResourceGroup)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_volume_profiles(self):
         """Retrieve volume profile list
@@ -72,6 +78,24 @@ class Volume():
             print("Error fetching volumes. {}".format(error))
             raise
 
+    def iter_volumes(self, limit=None):
+        """Iterate over volumes
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of volumes per page
+        :type limit: int, optional
+        :return: Generator of volumes
+        :rtype: generator
+        """
+        path = ("/v1/volumes?version={}&generation={}".format(
+            self.cfg["version"], self.cfg["generation"]))
+
+        return paginate(
+            lambda page: qw("iaas", "GET", page, headers())["data"],
+            path, "volumes", limit)
+
     def get_volume(self, volume):
         """Retrieve specific volume by name or by ID
 
@@ -80,18 +104,8 @@ class Volume():
         :return: Volume information
         :rtype: dict
         """
-        by_name = self.get_volume_by_name(volume)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_volume_by_id(volume)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_volume_by_id, self.get_volume_by_name,
+                             volume)
 
     def get_volume_by_id(self, id):
         """Retrieve specific volume by ID
@@ -122,13 +136,10 @@ class Volume():
         :rtype: dict
         """
         try:
-            # Retrieve volumes
-            data = self.get_volumes()
-            if "errors" in data:
-                return data
-
             # Loop over volumes until filter match
-            for volume in data["volumes"]:
+            for volume in self.iter_volumes():
+                if "errors" in volume:
+                    return volume
                 if volume["name"] == name:
                     # Return response data
                     return volume
@@ -141,6 +152,7 @@ class Volume():
                                                                   error))
             raise
 
+    @invalidate_resolution
     def create_volume(self, **kwargs):
         """Create block volume
 
@@ -199,12 +211,13 @@ class Volume():
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating volume. {}".format(error))
             raise
 
+    @invalidate_resolution
     def delete_volume(self, volume):
         """Delete volume
 
@@ -1,19 +1,41 @@
-import json
-
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.utils.common import paginate
+from ibmcloud_python_sdk.utils.common import iaas_path
+from ibmcloud_python_sdk.utils.common import build_payload
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 from ibmcloud_python_sdk.resource import resource_group
 
 
+def vpc_args(**kwargs):
+    """Build the arguments of a VPC creation with their default values
+
+    :return: Arguments of create_vpc(), None when not set
+    :rtype: dict
+    """
+    return {
+        'name': kwargs.get('name'),
+        'resource_group': kwargs.get('resource_group'),
+        'address_prefix_management': kwargs.get(
+            'address_prefix_management', 'auto'),
+        'classic_access': kwargs.get('classic_access', False),
+    }
+
+
 class Vpc():
 
-    def __init__(self):
-        self.cfg = params()
-        self.rg = resource_group.ResourceGroup()
+    rg = shared(resource_group.ResourceGroup)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_vpcs(self):
         """Retrieve VPC list
@@ -23,8 +45,7 @@ class Vpc():
         """
         try:
             # Connect to api endpoint for vpcs
-            path = ("/v1/vpcs?version={}&generation={}".format(
-                self.cfg["version"], self.cfg["generation"]))
+            path = iaas_path(self.cfg, "vpcs")
 
             # Return data
             return qw("iaas", "GET", path, headers())["data"]
@@ -33,6 +54,23 @@ class Vpc():
             print("Error fetching VPCs. {}".format(error))
             raise
 
+    def iter_vpcs(self, limit=None):
+        """Iterate over VPCs
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of VPCs per page
+        :type limit: int, optional
+        :return: Generator of VPCs
+        :rtype: generator
+        """
+        path = iaas_path(self.cfg, "vpcs")
+
+        return paginate(
+            lambda page: qw("iaas", "GET", page, headers())["data"],
+            path, "vpcs", limit)
+
     def get_vpc(self, vpc):
         """Retrieve specific VPC by name or by ID
 
@@ -41,18 +79,7 @@ class Vpc():
         :return: VPC information
         :rtype: dict
         """
-        by_name = self.get_vpc_by_name(vpc)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_vpc_by_id(vpc)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_vpc_by_id, self.get_vpc_by_name, vpc)
 
     def get_vpc_by_id(self, id):
         """Retrieve specific VPC by ID
@@ -64,8 +91,7 @@ class Vpc():
         """
         try:
             # Connect to api endpoint for vpcs
-            path = ("/v1/vpcs/{}?version={}&generation={}".format(
-                id, self.cfg["version"], self.cfg["generation"]))
+            path = iaas_path(self.cfg, "vpcs", id)
 
             # Return data
             return qw("iaas", "GET", path, headers())["data"]
@@ -83,13 +109,10 @@ class Vpc():
         :rtype: dict
         """
         try:
-            # Retrieve VPCs
-            data = self.get_vpcs()
-            if "errors" in data:
-                return data
-
             # Loop over VPCs until filter match
-            for vpc in data['vpcs']:
+            for vpc in self.iter_vpcs():
+                if "errors" in vpc:
+                    return vpc
                 if vpc["name"] == name:
                     # Return data
                     return vpc
@@ -116,10 +139,8 @@ class Vpc():
 
         try:
             # Connect to api endpoint for vpcs
-            path = ("/v1/vpcs/{}/default_network_acl?version={}"
-                    "&generation={}".format(vpc_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "vpcs", vpc_info["id"],
+                             "default_network_acl")
 
             # Return data
             return qw("iaas", "GET", path, headers())["data"]
@@ -144,10 +165,8 @@ class Vpc():
 
         try:
             # Connect to api endpoint for vpcs
-            path = ("/v1/vpcs/{}/default_security_group?version={}"
-                    "&generation={}".format(vpc_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "vpcs", vpc_info["id"],
+                             "default_security_group")
 
             # Return data
             return qw("iaas", "GET", path, headers())["data"]
@@ -172,10 +191,8 @@ class Vpc():
 
         try:
             # Connect to api endpoint for vpcs
-            path = ("/v1/vpcs/{}/address_prefixes?version={}"
-                    "&generation={}".format(vpc_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "vpcs", vpc_info["id"],
+                             "address_prefixes")
 
             # Return data
             return qw("iaas", "GET", path, headers())["data"]
@@ -195,28 +212,9 @@ class Vpc():
         :return: Address prefix information
         :rtype: dict
         """
-        by_name = self.get_address_prefix_by_name(vpc, prefix)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_address_prefix_by_id(vpc, prefix)
-                    if "errors" in by_id:
-                        for key_id in by_id["errors"]:
-                            if key_id["code"] == "not_found":
-                                by_addr = self.get_address_prefix_by_cidr(
-                                    vpc, prefix)
-                                if "errors" in by_addr:
-                                    return by_addr
-                                else:
-                                    return by_addr
-                            else:
-                                return by_id
-                    else:
-                        return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_address_prefix_by_id,
+                             self.get_address_prefix_by_name, vpc, prefix,
+                             fallback=self.get_address_prefix_by_cidr)
 
     def get_address_prefix_by_id(self, vpc, id):
         """Retrieve specific VPC address prefix by ID
@@ -235,10 +233,8 @@ class Vpc():
 
         try:
             # Connect to api endpoint for vpcs
-            path = ("/v1/vpcs/{}/address_prefixes/{}?version={}"
-                    "&generation={}".format(vpc_info["id"], id,
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "vpcs", vpc_info["id"],
+                             "address_prefixes", id)
 
             # Return data
             return qw("iaas", "GET", path, headers())["data"]
@@ -333,10 +329,7 @@ class Vpc():
 
         try:
             # Connect to api endpoint for vpcs
-            path = ("/v1/vpcs/{}/routes?version={}"
-                    "&generation={}".format(vpc_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "vpcs", vpc_info["id"], "routes")
 
             # Return data
             return qw("iaas", "GET", path, headers())["data"]
@@ -357,18 +350,8 @@ class Vpc():
         :return: Routing table information
         :rtype: dict
         """
-        by_name = self.get_route_by_name(vpc, route)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_route_by_id(vpc, route)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_route_by_id, self.get_route_by_name, vpc,
+                             route)
 
     def get_route_by_id(self, vpc, id):
         """Retrieve specific route from VPC default routing table by ID
@@ -387,10 +370,7 @@ class Vpc():
 
         try:
             # Connect to api endpoint for vpcs
-            path = ("/v1/vpcs/{}/routes/{}?version={}"
-                    "&generation={}".format(vpc_info["id"], id,
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "vpcs", vpc_info["id"], "routes", id)
 
             # Return data
             return qw("iaas", "GET", path, headers())["data"]
@@ -435,6 +415,7 @@ class Vpc():
                 name, vpc, error))
             raise
 
+    @invalidate_resolution
     def create_vpc(self, **kwargs):
         """Create VPC (Virtual Private Cloud)
 
@@ -451,40 +432,29 @@ class Vpc():
         :type classic_access: bool, optional
         """
         # Build dict of argument and assign default value when needed
-        args = {
-            'name': kwargs.get('name'),
-            'resource_group': kwargs.get('resource_group'),
-            'address_prefix_management': kwargs.get(
-                'address_prefix_management', 'auto'),
-            'classic_access': kwargs.get('classic_access', False),
-        }
+        args = vpc_args(**kwargs)
 
         # Construct payload
-        payload = {}
-        for key, value in args.items():
-            if value is not None:
-                if key == "resource_group":
-                    rg_info = self.rg.get_resource_group(
-                        args["resource_group"])
-                    if "errors" in rg_info:
-                        return rg_info
-                    payload["resource_group"] = {"id": rg_info["id"]}
-                else:
-                    payload[key] = value
+        payload = build_payload(args)
+        if "resource_group" in payload:
+            rg_info = self.rg.get_resource_group(args["resource_group"])
+            if "errors" in rg_info:
+                return rg_info
+            payload["resource_group"] = {"id": rg_info["id"]}
 
         try:
             # Connect to api endpoint for vpcs
-            path = ("/v1/vpcs?version={}&generation={}".format(
-                self.cfg["version"], self.cfg["generation"]))
+            path = iaas_path(self.cfg, "vpcs")
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating VPC. {}".format(error))
             raise
 
+    @invalidate_resolution
     def create_address_prefix(self, **kwargs):
         """Create address prefix
 
@@ -530,20 +500,19 @@ class Vpc():
 
         try:
             # Connect to api endpoint for vpcs
-            path = ("/v1/vpcs/{}/address_prefixes?version={}"
-                    "&generation={}".format(vpc_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "vpcs", vpc_info["id"],
+                             "address_prefixes")
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating address prefix in VPC {}. {}".format(
                 args['vpc'], error))
             raise
 
+    @invalidate_resolution
     def create_route(self, **kwargs):
         """Create route in VPC default routing table
 
@@ -593,20 +562,18 @@ class Vpc():
 
         try:
             # Connect to api endpoint for vpcs
-            path = ("/v1/vpcs/{}/routes?version={}"
-                    "&generation={}".format(vpc_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "vpcs", vpc_info["id"], "routes")
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating route in VPC {}. {}".format(
                 args['vpc'], error))
             raise
 
+    @invalidate_resolution
     def delete_vpc(self, vpc):
         """Delete VPC
 
@@ -622,8 +589,7 @@ class Vpc():
 
         try:
             # Connect to api endpoint for vpcs
-            path = ("/v1/vpcs/{}?version={}&generation={}".format(
-                vpc_info["id"], self.cfg["version"], self.cfg["generation"]))
+            path = iaas_path(self.cfg, "vpcs", vpc_info["id"])
 
             data = qw("iaas", "DELETE", path, headers())
 
@@ -638,6 +604,7 @@ class Vpc():
             print("Error deleting VPC {}. {}".format(vpc, error))
             raise
 
+    @invalidate_resolution
     def delete_address_prefix(self, vpc, prefix):
         """Delete address prefix
 
@@ -660,10 +627,8 @@ class Vpc():
 
         try:
             # Connect to api endpoint for vpcs
-            path = ("/v1/vpcs/{}/address_prefixes/{}?version={}"
-                    "&generation={}".format(vpc_info["id"], prefix_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "vpcs", vpc_info["id"],
+                             "address_prefixes", prefix_info["id"])
 
             data = qw("iaas", "DELETE", path, headers())
 
@@ -679,6 +644,7 @@ class Vpc():
                 prefix, vpc, error))
             raise
 
+    @invalidate_resolution
     def delete_route(self, vpc, route):
         """Delete route from VPC default routing table
 
@@ -701,10 +667,8 @@ class Vpc():
 
         try:
             # Connect to api endpoint for vpcs
-            path = ("/v1/vpcs/{}/routes/{}?version={}"
-                    "&generation={}".format(vpc_info["id"], route_info["id"],
-                                            self.cfg["version"],
-                                            self.cfg["generation"]))
+            path = iaas_path(self.cfg, "vpcs", vpc_info["id"], "routes",
+                             route_info["id"])
 
             data = qw("iaas", "DELETE", path, headers())
 
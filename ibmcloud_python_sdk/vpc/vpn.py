@@ -1,22 +1,28 @@
-import json
-from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.session import default_session
+from ibmcloud_python_sdk.session import shared
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.utils.common import paginate
 from ibmcloud_python_sdk.vpc import subnet
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import resource_found
 from ibmcloud_python_sdk.utils.common import resource_created
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.common import find_resource
+from ibmcloud_python_sdk.utils.resolution import invalidate_resolution
 from ibmcloud_python_sdk.resource import resource_group
 
 
 class Vpn():
 
-    def __init__(self):
-        self.cfg = params()
-        self.subnet = subnet.Subnet()
-        self.rg = resource_group.ResourceGroup()
+    subnet = shared(subnet.Subnet)
+    rg = shared(resource_group.ResourceGroup)
+
+    def __init__(self, session=None):
+        self.session = session or default_session()
+        self.cfg = self.session.cfg
 
     def get_ike_policies(self):
         """Retrieve IKE policy list
@@ -36,6 +42,24 @@ class Vpn():
             print("Error fetching IKE policies. {}".format(error))
             raise
 
+    def iter_ike_policies(self, limit=None):
+        """Iterate over IKE policies
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of IKE policies per page
+        :type limit: int, optional
+        :return: Generator of IKE policies
+        :rtype: generator
+        """
+        path = ("/v1/ike_policies?version={}&generation={}".format(
+            self.cfg["version"], self.cfg["generation"]))
+
+        return paginate(
+            lambda page: qw("iaas", "GET", page, headers())["data"],
+            path, "ike_policies", limit)
+
     def get_ike_policy(self, policy):
         """Retrieve specific IKE policy
 
@@ -44,18 +68,8 @@ class Vpn():
         :return: IKE policy information
         :rtype: dict
         """
-        by_name = self.get_ike_policy_by_name(policy)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_ike_policy_by_id(policy)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_ike_policy_by_id,
+                             self.get_ike_policy_by_name, policy)
 
     def get_ike_policy_by_id(self, id):
         """Retrieve specific IKE policy by ID
@@ -86,13 +100,10 @@ class Vpn():
         :rtype: dict
         """
         try:
-            # Retrieve policies
-            data = self.get_ike_policies()
-            if "errors" in data:
-                return data
-
             # Loop over policies until filter match
-            for policy in data["ike_policies"]:
+            for policy in self.iter_ike_policies():
+                if "errors" in policy:
+                    return policy
                 if policy["name"] == name:
                     # Return data
                     return policy
@@ -150,6 +161,24 @@ class Vpn():
             print("Error fetching IPsec policies. {}".format(error))
             raise
 
+    def iter_ipsec_policies(self, limit=None):
+        """Iterate over IPsec policies
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of IPsec policies per page
+        :type limit: int, optional
+        :return: Generator of IPsec policies
+        :rtype: generator
+        """
+        path = ("/v1/ipsec_policies?version={}&generation={}".format(
+            self.cfg["version"], self.cfg["generation"]))
+
+        return paginate(
+            lambda page: qw("iaas", "GET", page, headers())["data"],
+            path, "ipsec_policies", limit)
+
     def get_ipsec_policy(self, policy):
         """Retrieve specific IPsec policy
 
@@ -158,18 +187,8 @@ class Vpn():
         :return: IPSec policy information
         :rtype: dict
         """
-        by_name = self.get_ipsec_policy_by_name(policy)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_ike_policy_by_id(policy)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_ipsec_policy_by_id,
+                             self.get_ipsec_policy_by_name, policy)
 
     def get_ipsec_policy_by_id(self, id):
         """Retrieve specific IPsec policy by ID
@@ -201,13 +220,10 @@ class Vpn():
         :rtype: dict
         """
         try:
-            # Retrieve policies
-            data = self.get_ipsec_policies()
-            if "errors" in data:
-                return data
-
             # Loop over policies until filter match
-            for policy in data["ipsec_policies"]:
+            for policy in self.iter_ipsec_policies():
+                if "errors" in policy:
+                    return policy
                 if policy["name"] == name:
                     # Return data
                     return policy
@@ -265,6 +281,24 @@ class Vpn():
             print("Error fetching VPN gateways. {}".format(error))
             raise
 
+    def iter_vpn_gateways(self, limit=None):
+        """Iterate over VPN gateways
+
+        Pages are retrieved while iterating, if the API returns an error it
+        is yielded and the iteration stops.
+
+        :param limit: Number of VPN gateways per page
+        :type limit: int, optional
+        :return: Generator of VPN gateways
+        :rtype: generator
+        """
+        path = ("/v1/vpn_gateways?version={}&generation={}".format(
+            self.cfg["version"], self.cfg["generation"]))
+
+        return paginate(
+            lambda page: qw("iaas", "GET", page, headers())["data"],
+            path, "vpn_gateways", limit)
+
     def get_vpn_gateway(self, gateway):
         """Retrieve specific VPN gateway
 
@@ -273,18 +307,8 @@ class Vpn():
         :return: Gateway information
         :rtype: dict
         """
-        by_name = self.get_vpn_gateway_by_name(gateway)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_vpn_gateway_by_id(gateway)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_vpn_gateway_by_id,
+                             self.get_vpn_gateway_by_name, gateway)
 
     def get_vpn_gateway_by_id(self, id):
         """Retrieve specific VPN gateway by ID
@@ -316,13 +340,10 @@ class Vpn():
         :rtype: dict
         """
         try:
-            # Retrieve gateways
-            data = self.get_vpn_gateways()
-            if "errors" in data:
-                return data
-
             # Loop over gateways until filter match
-            for gateway in data["vpn_gateways"]:
+            for gateway in self.iter_vpn_gateways():
+                if "errors" in gateway:
+                    return gateway
                 if gateway["name"] == name:
                     # Return data
                     return gateway
@@ -372,19 +393,9 @@ class Vpn():
         :return: Connection information
         :rtype: dict
         """
-        by_name = self.get_vpn_gateway_connection_by_name(gateway, connection)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_vpn_gateway_connection_by_id(gateway,
-                                                                  connection)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return find_resource(self.get_vpn_gateway_connection_by_id,
+                             self.get_vpn_gateway_connection_by_name, gateway,
+                             connection)
 
     def get_vpn_gateway_connection_by_id(self, gateway, id):
         """Retrieve specific connection for a VPN gateway by ID
@@ -630,6 +641,7 @@ class Vpn():
                                            connection, gateway, error))
             raise
 
+    @invalidate_resolution
     def create_ike_policy(self, **kwargs):
         """Create IKE policy
 
@@ -683,12 +695,13 @@ class Vpn():
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating IKE policy. {}".format(error))
             raise
 
+    @invalidate_resolution
     def create_ipsec_policy(self, **kwargs):
         """Create IPsec policy
 
@@ -739,12 +752,13 @@ class Vpn():
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating IPsec policy. {}".format(error))
             raise
 
+    @invalidate_resolution
     def create_gateway(self, **kwargs):
         """Create gateway
 
@@ -792,12 +806,13 @@ class Vpn():
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating gateway. {}".format(error))
             raise
 
+    @invalidate_resolution
     def create_connection(self, **kwargs):
         """Create connection
 
@@ -882,7 +897,7 @@ class Vpn():
 
             # Return data
             return qw("iaas", "POST", path, headers(),
-                      json.dumps(payload))["data"]
+                      codec.dumps(payload))["data"]
 
         except Exception as error:
             print("Error creating connection. {}".format(error))
@@ -1014,6 +1029,7 @@ class Vpn():
                                            args["gateway"], error))
             raise
 
+    @invalidate_resolution
     def delete_ike_policy(self, policy):
         """Delete IKE policy
 
@@ -1046,6 +1062,7 @@ class Vpn():
             print("Error deleting IKE policy {}. {}".format(policy, error))
             raise
 
+    @invalidate_resolution
     def delete_ipsec_policy(self, policy):
         """Delete IPsec policy
 
@@ -1078,6 +1095,7 @@ class Vpn():
             print("Error deleting IPsec policy {}. {}".format(policy, error))
             raise
 
+    @invalidate_resolution
     def delete_gateway(self, gateway):
         """Delete VPN gateway
 
@@ -1110,6 +1128,7 @@ class Vpn():
             print("Error deleting VPN gateway {}. {}".format(gateway, error))
             raise
 
+    @invalidate_resolution
     def delete_connection(self, gateway, connection):
         """Delete connection
 
@@ -0,0 +1,218 @@
+import asyncio
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk.aio import common as aio_common
+from ibmcloud_python_sdk.aio.transport import AsyncConnectionPool
+from ibmcloud_python_sdk.aio.vpc.subnet import Subnet
+from ibmcloud_python_sdk.aio.vpc import key as aio_key
+from ibmcloud_python_sdk.vpc import key
+from ibmcloud_python_sdk.utils import cache
+from ibmcloud_python_sdk.utils.resolution import resolution_cache
+from tests.common import fake_response, get_headers, run
+
+PAGES = {
+    '/v1/subnets?version=2020-03-10&generation=2': {
+        'subnets': [{'id': '0717-ba4c5b6c-a4f1-4a6b-8a1d-0c5b1e8e6c4a',
+                     'name': 'subnet-1'}],
+        'next': {'href': 'https://us-south.iaas.cloud.ibm.com/v1/subnets'
+                         '?start=abc'}
+    },
+    '/v1/subnets?start=abc&version=2020-03-10&generation=2': {
+        'subnets': [{'id': '0717-d7a9e5c2-6f8e-4c8e-9b3b-2d7a7e9c4f1b',
+                     'name': 'subnet-2'}],
+    },
+}
+
+
+class Server():
+    """Minimal HTTP/1.1 server counting accepted connections"""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.connections = 0
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            while (await reader.readline()) not in (b'\r\n', b''):
+                pass
+            answer = self.responses.pop(0)
+            if answer is None:
+                # Keep-alive connection closed by the server
+                break
+            writer.write(answer)
+            await writer.drain()
+        writer.close()
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, '127.0.0.1', 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return '127.0.0.1:{}'.format(port)
+
+
+def response(body, close=False):
+    return ('HTTP/1.1 200 OK\r\nContent-Length: {}\r\n{}\r\n{}'.format(
+        len(body), 'Connection: close\r\n' if close else '', body)).encode()
+
+
+async def qw_pages(conn_type, method, path, headers=None, payload=None):
+    return {'data': PAGES.get(path, {'errors': [{'code': 'not_found'}]})}
+
+
+class TransportTestCase(TestCase):
+
+    def request(self, responses, count, methods=()):
+        async def main():
+            server = Server(responses)
+            host = await server.start()
+            pool = AsyncConnectionPool(size=2, ssl_context=False)
+            results = []
+            for method in list(methods) or ['GET'] * count:
+                results.append(await pool.request(host, method, '/'))
+            pool.clear()
+            server.server.close()
+            return server, results
+
+        return run(main())
+
+    def test_keep_alive(self):
+        server, results = self.request(
+            [response('{"a": 1}'), response('{"b": 2}')], 2)
+        self.assertEqual([body for _, body in results],
+                         [b'{"a": 1}', b'{"b": 2}'])
+        self.assertEqual(server.connections, 1)
+
+    def test_connection_close(self):
+        server, results = self.request(
+            [response('{}', close=True), response('{}')], 2)
+        self.assertEqual(results[0][0].status, 200)
+        self.assertTrue(results[0][0].will_close)
+        self.assertEqual(server.connections, 2)
+
+    def test_timings(self):
+        _, results = self.request([response('{}'), response('{}')], 2)
+        first, second = results[0][0].timings, results[1][0].timings
+        self.assertEqual(set(first), {'connect', 'ttfb', 'read'})
+        self.assertEqual(set(second), {'ttfb', 'read'})
+
+    def test_stale_connection_resent(self):
+        server, results = self.request(
+            [response('{}'), None, response('{"a": 1}')], 2)
+        self.assertEqual(results[1][1], b'{"a": 1}')
+        self.assertEqual(server.connections, 2)
+
+    def test_stale_connection_post(self):
+        # A POST could have been processed, it is not resent
+        with self.assertRaises(ConnectionResetError):
+            self.request([response('{}'), None, response('{}')], 2,
+                         ['GET', 'POST'])
+
+    def test_chunked(self):
+        chunked = (b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n'
+                   b'4\r\n{"a"\r\n4\r\n: 1}\r\n0\r\n\r\n')
+        _, results = self.request([chunked], 1)
+        self.assertEqual(results[0][1], b'{"a": 1}')
+
+
+class AsyncSubnetTestCase(TestCase):
+
+    def setUp(self):
+        resolution_cache.invalidate()
+        self.patcher = patch('ibmcloud_python_sdk.auth.get_token',
+                             get_headers)
+        self.patcher.start()
+        self.subnet = Subnet()
+
+    def tearDown(self):
+        self.patcher.stop()
+        resolution_cache.invalidate()
+
+    @patch('ibmcloud_python_sdk.aio.vpc.subnet.qw', qw_pages)
+    def test_iter_subnets(self):
+        async def main():
+            return [subnet['name'] async for subnet in
+                    self.subnet.iter_subnets()]
+
+        self.assertEqual(run(main()), ['subnet-1', 'subnet-2'])
+
+    @patch('ibmcloud_python_sdk.aio.vpc.subnet.qw', qw_pages)
+    def test_get_subnet_by_name(self):
+        response = run(self.subnet.get_subnet('subnet-2'))
+        self.assertEqual(response['id'],
+                         '0717-d7a9e5c2-6f8e-4c8e-9b3b-2d7a7e9c4f1b')
+
+    @patch('ibmcloud_python_sdk.aio.vpc.subnet.qw', qw_pages)
+    def test_get_subnet_not_found(self):
+        response = run(self.subnet.get_subnet('subnet-3'))
+        self.assertEqual(response['errors'][0]['code'], 'not_found')
+
+    def test_gather(self):
+        async def qw(conn_type, method, path, headers=None, payload=None):
+            await asyncio.sleep(0)
+            return {'data': {'id': path.split('/')[3].split('?')[0]}}
+
+        async def main():
+            return await asyncio.gather(*[
+                self.subnet.get_subnet_by_id(id) for id in ('a', 'b', 'c')])
+
+        with patch('ibmcloud_python_sdk.aio.vpc.subnet.qw', qw):
+            response = run(main())
+        self.assertEqual([subnet['id'] for subnet in response],
+                         ['a', 'b', 'c'])
+
+
+class AsyncKeyTestCase(TestCase):
+
+    def setUp(self):
+        self.patcher = patch('ibmcloud_python_sdk.auth.get_token',
+                             get_headers)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_create_key_as_sync(self):
+        sent = []
+
+        def qw(conn_type, method, path, headers=None, payload=None):
+            sent.append((method, path, payload))
+            return {'data': {}}
+
+        async def aio_qw(*args, **kwargs):
+            return qw(*args, **kwargs)
+
+        with patch('ibmcloud_python_sdk.vpc.key.qw', qw):
+            key.Key().create_key(name='key-1', public_key='ssh-rsa AAAA')
+        with patch('ibmcloud_python_sdk.aio.vpc.key.qw', aio_qw):
+            run(aio_key.Key().create_key(name='key-1',
+                                         public_key='ssh-rsa AAAA'))
+        # Both APIs build the same query
+        self.assertEqual(sent[0], sent[1])
+        self.assertEqual(sent[0][1], '/v1/keys?version=2020-03-10'
+                                     '&generation=2')
+
+
+class AsyncQueryTestCase(TestCase):
+
+    def tearDown(self):
+        cache.local_cache.clear()
+
+    @patch('ibmcloud_python_sdk.utils.cache.sdk',
+           lambda: {'local_cache': {'max_entries': 10}})
+    def test_write_evicts_cache(self):
+        collection = '/v1/subnets?version=2020-03-10&generation=2'
+        cache.local_cache.set((None, 'iaas', collection), b'{}', 60)
+        response = fake_response(204, timings={})
+
+        async def request(*args):
+            return response, b''
+
+        with patch.object(aio_common.pool, 'request', request):
+            run(aio_common.query_wrapper(
+                'iaas', 'DELETE', '/v1/subnets/0717-ba4c5b6c-a4f1-4a6b-8a1d-'
+                '0c5b1e8e6c4a?version=2020-03-10&generation=2'))
+        # The cached collection is not served after an asyncio delete
+        self.assertIsNone(cache.local_cache.get((None, 'iaas', collection)))
@@ -1,9 +1,13 @@
 import json
 import os
+import threading
+import time
+from jwt import encode
 from unittest import TestCase
 from mock import patch
 from ibmcloud_python_sdk.utils import constants
-from ibmcloud_python_sdk.auth import decode_token, get_token
+from ibmcloud_python_sdk.auth import decode_token, get_token, \
+    token_expiration, TokenManager
 from tests.common import get_headers, qw_exception
 
 
@@ -18,7 +22,7 @@ class AuthTestCase(TestCase):
             except json.JSONDecodeError as err:
                 return err
 
-    def read_decode(token, verify):
+    def read_decode(token, options=None):
         """This function returns a decoded JSON token.
         """
         data_file = f'{os.path.dirname(__file__)}/decode.json'
@@ -28,7 +32,7 @@ class AuthTestCase(TestCase):
             except json.JSONDecodeError as err:
                 return err
 
-    def qw(arg1, arg2, path, headers=None, payload=None):
+    def qw(arg1, arg2, path, headers=None, payload=None, retry=None):
         """This function is used to mock the query_wrapper function from
         utils/common. It returns information collected from read_token()
         function.
@@ -61,4 +65,81 @@ class AuthTestCase(TestCase):
         with self.assertRaises(Exception):
             get_token(constants.AUTH_URL,
             '60230291428a3576752104555fa0f623b5045f08'
-        )
\ No newline at end of file
+        )
+
+
+class TokenManagerTestCase(TestCase):
+
+    def setUp(self):
+        self.manager = TokenManager()
+        self.calls = 0
+
+    def token(self, lifetime):
+        jwt = encode({'exp': int(time.time()) + lifetime},
+                     'unittest-secret-key-with-enough-length',
+                     algorithm='HS256')
+        return f'Bearer {jwt}'
+
+    def fake_get_token(self, lifetime, delay=0):
+        def get_token(url, key):
+            time.sleep(delay)
+            self.calls += 1
+            return self.token(lifetime)
+        return get_token
+
+    def test_token_expiration(self):
+        self.assertAlmostEqual(token_expiration(self.token(3600)),
+                               time.time() + 3600, delta=2)
+
+    def test_token_expiration_invalid(self):
+        self.assertAlmostEqual(token_expiration('Bearer invalid'),
+                               time.time() + constants.TOKEN_LIFETIME,
+                               delta=2)
+
+    def test_token_cached(self):
+        with patch('ibmcloud_python_sdk.auth.get_token',
+                   self.fake_get_token(3600)):
+            token = self.manager.get()
+            self.assertEqual(self.manager.get(), token)
+        self.assertEqual(self.calls, 1)
+
+    def test_token_expired(self):
+        with patch('ibmcloud_python_sdk.auth.get_token',
+                   self.fake_get_token(3600)):
+            self.manager.token = self.token(30)
+            self.manager.expires = time.time() + 30
+            self.assertNotEqual(self.manager.get(), self.token(30))
+        self.assertEqual(self.calls, 1)
+
+    def test_token_background_refresh(self):
+        with patch('ibmcloud_python_sdk.auth.get_token',
+                   self.fake_get_token(3600)):
+            old = self.token(120)
+            self.manager.token = old
+            self.manager.expires = time.time() + 120
+            self.assertEqual(self.manager.get(), old)
+            for _ in range(100):
+                if self.manager.token != old:
+                    break
+                time.sleep(0.01)
+        self.assertEqual(self.calls, 1)
+        self.assertNotEqual(self.manager.token, old)
+
+    def test_token_single_flight(self):
+        results = []
+        with patch('ibmcloud_python_sdk.auth.get_token',
+                   self.fake_get_token(3600, delay=0.1)):
+            threads = [threading.Thread(
+                target=lambda: results.append(self.manager.get()))
+                for _ in range(10)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len(set(results)), 1)
+
+    @patch('ibmcloud_python_sdk.auth.get_token', side_effect=Exception)
+    def test_token_exception(self, get_token):
+        with self.assertRaises(Exception):
+            self.manager.get()
@@ -0,0 +1,85 @@
+import threading
+import time
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk.utils import bulk
+from ibmcloud_python_sdk.vpc.instance import Instance
+from tests.common import get_headers
+
+
+def qw_instance(conn_type, method, path, headers=None, payload=None):
+    return {'data': {'id': path.split('/')[3].split('?')[0]}}
+
+
+class BulkTestCase(TestCase):
+
+    def test_run_order(self):
+        def func(item):
+            # Finish the first items last
+            time.sleep((5 - item) * 0.01)
+            return item * 2
+
+        self.assertEqual(bulk.run(func, range(5), max_workers=5),
+                         [0, 2, 4, 6, 8])
+
+    def test_run_arguments(self):
+        def func(a, b=0):
+            return a + b
+
+        self.assertEqual(bulk.run(func, [1, (1, 2), {'a': 1, 'b': 3}]),
+                         [1, 3, 4])
+
+    def test_run_errors(self):
+        def func(item):
+            if item == 'bad':
+                raise ValueError('invalid item')
+            return {'id': item}
+
+        items = ['a', 'bad', 'c']
+        results = bulk.run(func, items)
+        self.assertEqual(results[0], {'id': 'a'})
+        self.assertEqual(results[1]['errors']['message'], 'invalid item')
+        self.assertEqual(bulk.errors(items, results),
+                         [('bad', results[1])])
+
+    def test_run_max_workers(self):
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def func(item):
+            with lock:
+                running.append(item)
+                peak.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(item)
+
+        bulk.run(func, range(8), max_workers=2)
+        self.assertEqual(max(peak), 2)
+
+    def test_run_rate_limit(self):
+        start = time.monotonic()
+        bulk.run(lambda item: item, range(5), max_workers=5, rate_limit=50)
+        self.assertGreaterEqual(time.monotonic() - start, 0.08)
+
+    def test_run_empty(self):
+        self.assertEqual(bulk.run(lambda item: item, []), [])
+
+
+class BulkInstanceTestCase(TestCase):
+
+    def setUp(self):
+        self.patcher = patch('ibmcloud_python_sdk.auth.get_token',
+                             get_headers)
+        self.patcher.start()
+        self.instance = Instance()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    @patch('ibmcloud_python_sdk.vpc.instance.qw', qw_instance)
+    def test_get_instances_by_ids(self):
+        ids = ['id-{}'.format(i) for i in range(20)]
+        response = self.instance.get_instances_by_ids(ids, max_workers=4)
+        self.assertEqual([instance['id'] for instance in response], ids)
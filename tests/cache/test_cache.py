@@ -0,0 +1,324 @@
+import base64
+import time
+from jwt import encode
+from unittest import TestCase
+from mock import patch
+from pymemcache.client.base import PooledClient
+from pymemcache.client.hash import HashClient
+from ibmcloud_python_sdk.utils import cache
+from ibmcloud_python_sdk.utils import common
+from tests.common import fake_response
+
+
+SINGLE = {'memcached': ['127.0.0.1:11211'], 'cache_ttl': 60}
+MULTIPLE = {'memcached': ['127.0.0.1:11211', '127.0.0.1:11212'],
+            'cache_ttl': 60}
+
+
+class CacheClientTestCase(TestCase):
+
+    def setUp(self):
+        cache.reset()
+
+    def tearDown(self):
+        cache.reset()
+
+    @patch('ibmcloud_python_sdk.utils.cache.sdk', lambda: False)
+    def test_not_configured(self):
+        self.assertFalse(cache.client())
+
+    @patch('ibmcloud_python_sdk.utils.cache.sdk', lambda: SINGLE)
+    def test_single_node(self):
+        client = cache.client()
+        self.assertIsInstance(client, PooledClient)
+        self.assertIs(cache.client(), client)
+
+    @patch('ibmcloud_python_sdk.utils.cache.sdk', lambda: MULTIPLE)
+    def test_multiple_nodes(self):
+        client = cache.client()
+        self.assertIsInstance(client, HashClient)
+        self.assertIs(cache.client(), client)
+
+    def test_nodes_changed(self):
+        with patch('ibmcloud_python_sdk.utils.cache.sdk', lambda: SINGLE):
+            client = cache.client()
+        with patch('ibmcloud_python_sdk.utils.cache.sdk', lambda: MULTIPLE):
+            self.assertIsNot(cache.client(), client)
+
+
+class AccountKeyTestCase(TestCase):
+
+    def setUp(self):
+        common._account_prefix.cache_clear()
+        self.token = encode({'account': {'bss': 'abc123'}}, 'secret' * 8,
+                            algorithm='HS256')
+        self.headers = {'Authorization': 'Bearer {}'.format(self.token)}
+
+    def test_account_id(self):
+        self.assertEqual(common._account_id(self.headers),
+                         base64.b64encode(b'abc123').decode())
+
+    def test_account_id_computed_once(self):
+        with patch('ibmcloud_python_sdk.utils.common.decode',
+                   wraps=common.decode) as decode:
+            for _ in range(3):
+                common._account_id(self.headers)
+        self.assertEqual(decode.call_count, 1)
+
+    def query(self, client, method, path, body=b'{"vpcs": []}', status=200):
+        res = fake_response(status)
+        with patch('ibmcloud_python_sdk.utils.common.cache.client',
+                   return_value=client), \
+                patch('ibmcloud_python_sdk.utils.common.cache.set_item',
+                      client.set), \
+                patch('ibmcloud_python_sdk.utils.common._request',
+                      return_value=(res, body)) as request:
+            response = common.query_wrapper('iaas', method, path,
+                                            self.headers)
+        return response, request.call_count
+
+    def test_cached_query(self):
+        client = FakeMemcache()
+        self.query(client, 'GET', '/v1/vpcs')
+        response, calls = self.query(client, 'GET', '/v1/vpcs')
+        self.assertEqual(response['data'], {'vpcs': []})
+        self.assertEqual(calls, 0)
+
+    def test_error_not_cached(self):
+        client = FakeMemcache()
+        self.query(client, 'GET', '/v1/vpcs/x', b'{"errors": []}', 404)
+        _, calls = self.query(client, 'GET', '/v1/vpcs/x')
+        self.assertEqual(calls, 1)
+
+    def test_mutation_invalidates_collection(self):
+        client = FakeMemcache()
+        self.query(client, 'GET', '/v1/subnets?version=1')
+        self.query(client, 'GET', '/v1/subnets/abc?version=1')
+        self.query(client, 'GET', '/v1/vpcs?version=1')
+        self.query(client, 'DELETE', '/v1/subnets/abc?version=1', b'', 204)
+        for path, expected in (('/v1/subnets?version=1', 1),
+                               ('/v1/subnets/abc?version=1', 1),
+                               ('/v1/vpcs?version=1', 0)):
+            _, calls = self.query(client, 'GET', path)
+            self.assertEqual(calls, expected, path)
+
+
+class FakeMemcache():
+    """In-memory memcached client"""
+
+    def __init__(self):
+        self.items = {}
+
+    def get(self, key):
+        return self.items.get(key)
+
+    def set(self, key, value, expire=0, noreply=None):
+        self.items[key] = value if isinstance(value, bytes) else \
+            str(value).encode()
+        return True
+
+    def add(self, key, value, expire=0, noreply=None):
+        if key in self.items:
+            return False
+        return self.set(key, value)
+
+    def incr(self, key, value, noreply=False):
+        if key not in self.items:
+            return None
+        self.items[key] = str(int(self.items[key]) + value).encode()
+        return int(self.items[key])
+
+
+class CollectionTestCase(TestCase):
+
+    def test_collection(self):
+        self.assertEqual(cache.collection('/v1/subnets?version=1'),
+                         '/v1/subnets')
+        self.assertEqual(
+            cache.collection('/v1/instances/abc/actions?version=1'),
+            '/v1/instances')
+        self.assertEqual(
+            cache.collection('/pcloud/v1/cloud-instances/abc/pvm-instances'
+                             '/def'),
+            '/pcloud/v1/cloud-instances/abc/pvm-instances')
+        self.assertEqual(cache.collection('/v2/resource_groups/abc'),
+                         '/v2/resource_groups')
+
+    def test_long_key(self):
+        client = FakeMemcache()
+        key = cache.item_key(client, 'acc', 'iaas', '/v1/vpcs?' + 'a' * 300)
+        self.assertLessEqual(len(key), cache.MAX_KEY_LENGTH)
+
+    def test_generation_initialized(self):
+        client = FakeMemcache()
+        cache.invalidate(client, 'acc', 'iaas', '/v1/vpcs')
+        first = cache.item_key(client, 'acc', 'iaas', '/v1/vpcs')
+        cache.invalidate(client, 'acc', 'iaas', '/v1/vpcs')
+        self.assertNotEqual(cache.item_key(client, 'acc', 'iaas', '/v1/vpcs'),
+                            first)
+
+
+LOCAL = {'cache_ttl': 60,
+         'cache_ttls': {'/v1/regions': 86400, '/v1/instances': 5,
+                        '/v1/instance/profiles': 3600},
+         'local_cache': {'max_entries': 3, 'max_size': 100}}
+
+
+@patch('ibmcloud_python_sdk.utils.cache.sdk', lambda: LOCAL)
+class LocalCacheTestCase(TestCase):
+
+    def setUp(self):
+        self.cache = cache.LocalCache()
+
+    def test_ttl(self):
+        self.assertEqual(cache.ttl('/v1/regions?version=1'), 86400)
+        self.assertEqual(cache.ttl('/v1/regions/us-south/zones'), 86400)
+        self.assertEqual(cache.ttl('/v1/instances/abc'), 5)
+        self.assertEqual(cache.ttl('/v1/instance/profiles/bx2-2x8'), 3600)
+        self.assertEqual(cache.ttl('/v1/vpcs'), 60)
+
+    def test_get_set(self):
+        self.cache.set(('acc', 'iaas', '/v1/vpcs'), b'{}', 60)
+        self.assertEqual(self.cache.get(('acc', 'iaas', '/v1/vpcs')), b'{}')
+        self.assertIsNone(self.cache.get(('acc', 'iaas', '/v1/subnets')))
+
+    def test_expired(self):
+        self.cache.set(('acc', 'iaas', '/v1/vpcs'), b'{}', 60)
+        with patch('ibmcloud_python_sdk.utils.cache.time.monotonic',
+                   return_value=time.monotonic() + 61):
+            self.assertIsNone(self.cache.get(('acc', 'iaas', '/v1/vpcs')))
+        self.assertEqual(self.cache.size, 0)
+
+    def test_max_entries(self):
+        for name in ('a', 'b', 'c'):
+            self.cache.set(('acc', 'iaas', name), b'{}', 60)
+        # Use "a" so "b" is the least recently used
+        self.cache.get(('acc', 'iaas', 'a'))
+        self.cache.set(('acc', 'iaas', 'd'), b'{}', 60)
+        self.assertIsNone(self.cache.get(('acc', 'iaas', 'b')))
+        self.assertIsNotNone(self.cache.get(('acc', 'iaas', 'a')))
+
+    def test_max_size(self):
+        self.cache.set(('acc', 'iaas', 'a'), b'x' * 60, 60)
+        self.cache.set(('acc', 'iaas', 'b'), b'x' * 60, 60)
+        self.assertIsNone(self.cache.get(('acc', 'iaas', 'a')))
+        self.assertEqual(self.cache.size, 60)
+        self.cache.set(('acc', 'iaas', 'c'), b'x' * 101, 60)
+        self.assertIsNone(self.cache.get(('acc', 'iaas', 'c')))
+
+    def test_invalidate(self):
+        self.cache.set(('acc', 'iaas', '/v1/subnets?version=1'), b'{}', 60)
+        self.cache.set(('acc', 'iaas', '/v1/vpcs?version=1'), b'{}', 60)
+        self.cache.invalidate('acc', 'iaas', '/v1/subnets/abc')
+        self.assertIsNone(self.cache.get(('acc', 'iaas',
+                                          '/v1/subnets?version=1')))
+        self.assertIsNotNone(self.cache.get(('acc', 'iaas',
+                                             '/v1/vpcs?version=1')))
+
+    def test_disabled(self):
+        with patch('ibmcloud_python_sdk.utils.cache.sdk', lambda: {}):
+            self.cache.set(('acc', 'iaas', '/v1/vpcs'), b'{}', 60)
+        self.assertEqual(self.cache.entries, {})
+
+    def test_query_local_only(self):
+        token = encode({'account': {'bss': 'abc123'}}, 'secret' * 8,
+                       algorithm='HS256')
+        headers = {'Authorization': 'Bearer {}'.format(token)}
+        res = fake_response(200)
+        with patch('ibmcloud_python_sdk.utils.common.cache.client',
+                   return_value=False), \
+                patch('ibmcloud_python_sdk.utils.common.cache.local_cache',
+                      self.cache), \
+                patch('ibmcloud_python_sdk.utils.common._request',
+                      return_value=(res, b'{"regions": []}')) as request:
+            for _ in range(2):
+                response = common.query_wrapper('iaas', 'GET', '/v1/regions',
+                                                headers)
+        self.assertEqual(response['data'], {'regions': []})
+        self.assertEqual(request.call_count, 1)
+
+
+class EntryTestCase(TestCase):
+
+    def test_pack_unpack(self):
+        entry = cache.unpack(cache.pack(b'{"id": "a"}', '"abc"', 60).item)
+        self.assertEqual(bytes(entry.body), b'{"id": "a"}')
+        self.assertEqual(entry.etag, '"abc"')
+        self.assertTrue(entry.fresh())
+
+    def test_unpack_plain(self):
+        entry = cache.unpack(b'{"id": "a"}')
+        self.assertEqual(entry.body, b'{"id": "a"}')
+        self.assertTrue(entry.fresh())
+
+    def test_retention(self):
+        with patch('ibmcloud_python_sdk.utils.cache.sdk',
+                   lambda: {'cache_stale_ttl': 100}):
+            self.assertEqual(cache.pack(b'{}', None, 60).retention(), 59)
+            self.assertEqual(cache.pack(b'{}', '"a"', 60).retention(), 159)
+
+
+@patch('ibmcloud_python_sdk.utils.cache.sdk',
+       lambda: {'cache_ttl': 60, 'local_cache': {'max_entries': 10}})
+class RevalidationTestCase(TestCase):
+
+    def setUp(self):
+        self.local = cache.LocalCache()
+        self.sent = []
+
+    def query(self, status, body, headers=None):
+        res = fake_response(status, headers)
+
+        def request(host, timeout, method, path, payload=None,
+                    headers=None):
+            self.sent.append(dict(headers or {}))
+            return res, body
+
+        with patch('ibmcloud_python_sdk.utils.common.cache.client',
+                   return_value=False), \
+                patch('ibmcloud_python_sdk.utils.common.cache.local_cache',
+                      self.local), \
+                patch('ibmcloud_python_sdk.utils.common._account_id',
+                      return_value='acc'), \
+                patch('ibmcloud_python_sdk.utils.common._request', request):
+            return common.query_wrapper('iaas', 'GET', '/v1/instances/a',
+                                        {'Authorization': 'Bearer a'})
+
+    def expire(self):
+        return patch('ibmcloud_python_sdk.utils.cache.time.time',
+                     return_value=time.time() + 61)
+
+    def test_not_modified(self):
+        self.query(200, b'{"id": "a"}', {'ETag': '"v1"'})
+        with self.expire():
+            response = self.query(304, b'')
+        self.assertEqual(self.sent[1]['If-None-Match'], '"v1"')
+        self.assertEqual(response['data'], {'id': 'a'})
+        # The entry is fresh again
+        self.query(200, b'{"id": "b"}')
+        self.assertEqual(len(self.sent), 2)
+
+    def test_modified(self):
+        self.query(200, b'{"id": "a"}', {'ETag': '"v1"'})
+        with self.expire():
+            response = self.query(200, b'{"id": "b"}', {'ETag': '"v2"'})
+        self.assertEqual(response['data'], {'id': 'b'})
+        entry = cache.unpack(self.local.get(('acc', 'iaas',
+                                             '/v1/instances/a')))
+        self.assertEqual(entry.etag, '"v2"')
+
+    def test_without_etag(self):
+        self.query(200, b'{"id": "a"}')
+        with self.expire():
+            self.query(200, b'{"id": "a"}')
+        self.assertNotIn('If-None-Match', self.sent[1])
+
+    def test_ttl_zero(self):
+        with patch('ibmcloud_python_sdk.utils.cache.sdk',
+                   lambda: {'cache_ttls': {'/v1/instances': 0},
+                            'local_cache': {'max_entries': 10}}):
+            self.query(200, b'{"id": "a"}', {'ETag': '"v1"'})
+            self.query(200, b'{"id": "a"}', {'ETag': '"v1"'})
+        # Not stored for revalidation either
+        self.assertEqual(len(self.local.entries), 0)
+        self.assertNotIn('If-None-Match', self.sent[1])
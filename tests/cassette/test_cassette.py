@@ -0,0 +1,135 @@
+import gzip
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from jwt import decode
+from mock import patch
+from ibmcloud_python_sdk.auth import token_manager
+from ibmcloud_python_sdk.config import clear_cache
+from ibmcloud_python_sdk.emulator import VpcEmulator
+from ibmcloud_python_sdk.utils import cassette
+from ibmcloud_python_sdk.utils.cassette import Cassette, CassetteMiss
+from ibmcloud_python_sdk.utils.resolution import resolution_cache
+from ibmcloud_python_sdk.vpc.vpc import Vpc
+
+TOKEN = ("eyJhbGciOiJIUzI1NiJ9.eyJhY2NvdW50Ijp7ImJzcyI6IjEyMyIsIm93bmVyIjoi"
+         "bWUifSwiZW1haWwiOiJtZUBleGFtcGxlLmNvbSIsImV4cCI6MX0.c2lnbmF0dXJl")
+
+
+class CassetteTestCase(TestCase):
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.workdir, "queries.jsonl.gz")
+        self.emulator = VpcEmulator()
+        self.url = self.emulator.start()
+        resolution_cache.invalidate()
+        token_manager.reset()
+        self.patcher = patch.dict(os.environ, {
+            'IC_IS_URL': self.url, 'IC_AUTH_URL': self.url,
+            'IC_RG_URL': self.url, 'IC_SDK_CONFIG_FILE': '/nonexistent'})
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.emulator.stop()
+        cassette.use(None)
+        clear_cache()
+        resolution_cache.invalidate()
+        token_manager.reset()
+        shutil.rmtree(self.workdir)
+
+    def restart(self):
+        """Forget the token and the resolved names as a new process would"""
+        resolution_cache.invalidate()
+        token_manager.reset()
+
+    def scenario(self):
+        vc = Vpc()
+        return [vc.create_vpc(name='vpc-1'), vc.get_vpcs(),
+                vc.delete_vpc('vpc-1'), vc.get_vpcs()]
+
+    def test_record_replay(self):
+        with Cassette(self.path, mode='record'):
+            recorded = self.scenario()
+        self.assertEqual(len(recorded[1]['vpcs']), 1)
+        self.assertEqual(len(recorded[3]['vpcs']), 0)
+
+        self.restart()
+        requests = self.emulator.requests
+        with Cassette(self.path):
+            self.assertEqual(self.scenario(), recorded)
+        # Nothing was sent to the API
+        self.assertEqual(self.emulator.requests, requests)
+
+    def test_secrets(self):
+        with Cassette(self.path, mode='record'):
+            Vpc().get_vpcs()
+        with gzip.open(self.path, 'rt') as cassette_file:
+            content = cassette_file.read()
+        self.assertNotIn('apikey', content)
+        self.assertNotIn('Authorization', content)
+        self.assertNotIn(token_manager.token.split(' ')[1], content)
+
+    def test_scrub(self):
+        self.assertEqual(
+            cassette.scrub('grant_type=password&apikey=secret&password=x'),
+            'grant_type=password&apikey=REDACTED&password=REDACTED')
+        body = json.loads(cassette.scrub(json.dumps({
+            'access_token': TOKEN, 'refresh_token': 'secret',
+            'token_type': 'Bearer'})))
+        self.assertEqual(body['refresh_token'], 'REDACTED')
+        self.assertEqual(body['token_type'], 'Bearer')
+        claims = decode(body['access_token'],
+                        options={'verify_signature': False})
+        self.assertEqual(claims, {'account': {'bss': '123'},
+                                  'exp': cassette.TOKEN_EXPIRATION})
+        credentials = json.loads(cassette.scrub(json.dumps({
+            'cos_hmac_keys': {'access_key_id': 'id',
+                              'secret_access_key': 'secret'},
+            'composed': ['postgres://admin:secret@db:5432/ibmclouddb']})))
+        self.assertEqual(credentials['cos_hmac_keys']['secret_access_key'],
+                         'REDACTED')
+        self.assertEqual(credentials['composed'],
+                         ['postgres://REDACTED@db:5432/ibmclouddb'])
+        self.assertEqual(cassette.scrub('/v1/vpcs?token=secret&limit=1'),
+                         '/v1/vpcs?token=REDACTED&limit=1')
+        # Payloads differing only by their credentials are the same query
+        self.assertEqual(cassette.fingerprint('apikey=a'),
+                         cassette.fingerprint(b'apikey=b'))
+
+    def test_order(self):
+        tape = Cassette(self.path, mode='record')
+        response = cassette.Response(200, {'Content-Type': 'text/plain'})
+        for body in (b'first', b'second'):
+            tape.record('iaas', 'GET', '/v1/vpcs', None, response, body)
+        tape.record('iaas', 'GET', '/v1/vpcs?token=b', None, response,
+                    b'token')
+        tape.save()
+
+        tape = Cassette(self.path)
+        bodies = [tape.play('iaas', 'GET', '/v1/vpcs', None)[1]
+                  for _ in range(3)]
+        # The last response is repeated
+        self.assertEqual(bodies, [b'first', b'second', b'second'])
+        # Paths are matched once their credentials are removed
+        self.assertEqual(tape.play('iaas', 'GET', '/v1/vpcs?token=a', None)
+                         [1], b'token')
+        with self.assertRaises(CassetteMiss):
+            tape.play('iaas', 'GET', '/v1/subnets', None)
+
+    def test_sdk_config(self):
+        config = os.path.join(self.workdir, 'sdk.yaml')
+        with open(config, 'w') as config_file:
+            config_file.write('---\nsdk:\n  cassette:\n    path: {}\n'
+                              '    mode: record\n'.format(self.path))
+        with patch.dict(os.environ, {'IC_SDK_CONFIG_FILE': config}):
+            tape = cassette.current()
+            self.assertEqual(tape.mode, 'record')
+            Vpc().get_vpcs()
+            self.assertIs(cassette.current(), tape)
+        self.assertIsNone(cassette.current())
+        self.assertEqual([entry['conn_type'] for entry in tape.entries],
+                         ['auth', 'iaas'])
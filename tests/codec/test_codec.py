@@ -0,0 +1,25 @@
+import json
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk.utils import codec
+
+DATA = {'name': 'vsi-é', 'cpu': 2, 'tags': ['a', 'b'], 'enabled': True}
+
+
+class CodecTestCase(TestCase):
+
+    def check(self):
+        encoded = codec.dumps(DATA)
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(json.loads(encoded.decode('utf-8')), DATA)
+        self.assertEqual(codec.loads(encoded), DATA)
+        self.assertEqual(codec.loads(bytearray(encoded)), DATA)
+        self.assertEqual(codec.loads(memoryview(encoded)), DATA)
+        self.assertEqual(codec.loads(encoded.decode('utf-8')), DATA)
+
+    def test_default_backend(self):
+        self.check()
+
+    def test_json_backend(self):
+        with patch.object(codec, 'orjson', None):
+            self.check()
@@ -0,0 +1,59 @@
+import gzip
+import io
+import json
+import zlib
+from unittest import TestCase
+from mock import MagicMock
+from ibmcloud_python_sdk.utils.common import _send
+from ibmcloud_python_sdk.utils.compression import decompress, read_body
+
+BODY = json.dumps({'instances': [{'name': 'vsi-{}'.format(i)}
+                                 for i in range(1000)]}).encode()
+
+
+class Response(io.BytesIO):
+
+    def __init__(self, body, encoding=None):
+        super().__init__(body)
+        self.headers = {'Content-Encoding': encoding} if encoding else {}
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+
+def raw_deflate(data):
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+class CompressionTestCase(TestCase):
+
+    def test_read_plain(self):
+        self.assertEqual(read_body(Response(BODY)), BODY)
+
+    def test_read_gzip(self):
+        self.assertEqual(read_body(Response(gzip.compress(BODY), 'gzip')),
+                         BODY)
+
+    def test_read_deflate(self):
+        self.assertEqual(read_body(Response(zlib.compress(BODY), 'deflate')),
+                         BODY)
+
+    def test_read_raw_deflate(self):
+        self.assertEqual(read_body(Response(raw_deflate(BODY), 'deflate')),
+                         BODY)
+
+    def test_decompress(self):
+        self.assertEqual(decompress('gzip', gzip.compress(BODY)), BODY)
+        self.assertEqual(decompress(None, BODY), BODY)
+        self.assertEqual(decompress('gzip', b''), b'')
+
+    def test_send_accept_encoding(self):
+        conn = MagicMock()
+        conn.getresponse.return_value = Response(gzip.compress(BODY), 'gzip')
+        headers = {'Accept': 'application/json'}
+        res, data = _send(conn, 'GET', '/v1/instances', None, headers)
+        sent = conn.request.call_args[0][3]
+        self.assertEqual(sent['Accept-Encoding'], 'gzip, deflate')
+        self.assertNotIn('Accept-Encoding', headers)
+        self.assertEqual(data, BODY)
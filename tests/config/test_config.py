@@ -0,0 +1,81 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk import config
+
+
+class ConfigTestCase(TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.creds = os.path.join(self.folder, 'clouds.yaml')
+        shutil.copy('test-credentials.yaml', self.creds)
+        self.patcher = patch.dict(os.environ, {'IC_CONFIG_FILE': self.creds})
+        self.patcher.start()
+        config.clear_cache()
+
+    def tearDown(self):
+        self.patcher.stop()
+        config.clear_cache()
+        shutil.rmtree(self.folder)
+
+    def test_params(self):
+        response = config.params()
+        self.assertEqual(response['region'], 'us-south')
+        self.assertEqual(response['is_url'], 'us-south.iaas.cloud.ibm.com')
+
+    def test_params_cached(self):
+        with patch('ibmcloud_python_sdk.config.yaml.safe_load',
+                   wraps=config.yaml.safe_load) as load:
+            config.params()
+            config.params()
+            self.assertEqual(load.call_count, 1)
+
+    def test_params_copy(self):
+        config.params()['region'] = 'eu-de'
+        self.assertEqual(config.params()['region'], 'us-south')
+
+    def test_params_file_changed(self):
+        config.params()
+        with open(self.creds, 'r') as config_file:
+            content = config_file.read()
+        with open(self.creds, 'w') as config_file:
+            config_file.write(content.replace('us-south', 'eu-de', 1))
+        os.utime(self.creds, ns=(0, 0))
+        self.assertEqual(config.params()['region'], 'eu-de')
+
+    def test_params_env_changed(self):
+        config.params()
+        with patch('ibmcloud_python_sdk.config.yaml.safe_load',
+                   wraps=config.yaml.safe_load) as load:
+            with patch.dict(os.environ, {'IC_CONFIG_NAME': 'demo'}):
+                config.params()
+            self.assertEqual(load.call_count, 1)
+
+    def test_sdk_not_configured(self):
+        with patch.dict(os.environ, {
+                'IC_SDK_CONFIG_FILE': os.path.join(self.folder, 'sdk.yaml')}):
+            self.assertFalse(config.sdk())
+
+    def override(self, line):
+        with open(self.creds, 'r') as config_file:
+            content = config_file.read()
+        with open(self.creds, 'w') as config_file:
+            config_file.write(content.replace(
+                'generation: 2\n', 'generation: 2\n    {}\n'.format(line), 1))
+
+    def test_params_url_override(self):
+        self.override('is_url: http://127.0.0.1:8080')
+        self.assertEqual(config.params()['is_url'], 'http://127.0.0.1:8080')
+        self.assertEqual(config.params()['rg_url'],
+                         'resource-controller.cloud.ibm.com')
+
+    def test_params_url_override_env(self):
+        self.override('is_url: http://127.0.0.1:8080')
+        with patch.dict(os.environ, {'IC_IS_URL': 'http://127.0.0.1:9090',
+                                     'IC_PI_URL': 'http://127.0.0.1:9191'}):
+            response = config.params()
+        self.assertEqual(response['is_url'], 'http://127.0.0.1:9090')
+        self.assertEqual(response['pi_url'], 'http://127.0.0.1:9191')
@@ -0,0 +1,134 @@
+import json
+import os
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk.auth import token_manager
+from ibmcloud_python_sdk.emulator import VpcEmulator
+from ibmcloud_python_sdk.utils.resolution import resolution_cache
+from ibmcloud_python_sdk.vpc.floating_ip import Fip
+from ibmcloud_python_sdk.vpc.instance import Instance
+from ibmcloud_python_sdk.vpc.key import Key
+from ibmcloud_python_sdk.vpc.subnet import Subnet
+from ibmcloud_python_sdk.vpc.vpc import Vpc
+
+
+class EmulatorTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.emulator = VpcEmulator()
+        cls.url = cls.emulator.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.emulator.stop()
+
+    def setUp(self):
+        self.emulator.reset()
+        self.emulator.throttle = 0
+        resolution_cache.invalidate()
+        token_manager.reset()
+        self.patcher = patch.dict(os.environ, {
+            'IC_IS_URL': self.url, 'IC_AUTH_URL': self.url,
+            'IC_RG_URL': self.url, 'IC_SDK_CONFIG_FILE': '/nonexistent'})
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        resolution_cache.invalidate()
+        token_manager.reset()
+
+    def network(self):
+        vpc = Vpc().create_vpc(name='vpc-1')
+        subnet = Subnet().create_subnet(name='subnet-1', vpc='vpc-1',
+                                        ipv4_cidr_block='10.0.0.0/24')
+        return vpc, subnet
+
+    def test_create_vpc(self):
+        vpc = Vpc().create_vpc(name='vpc-1', resource_group='default')
+        self.assertEqual(Vpc().get_vpc('vpc-1')['id'], vpc['id'])
+        group = Vpc().get_default_security_group('vpc-1')
+        self.assertEqual(group['id'], vpc['default_security_group']['id'])
+        self.assertEqual(group['vpc']['id'], vpc['id'])
+
+    def test_name_unique(self):
+        Vpc().create_vpc(name='vpc-1')
+        response = Vpc().create_vpc(name='vpc-1')
+        self.assertEqual(response['errors'][0]['code'],
+                         'validation_unique_failed')
+
+    def test_reference_checked(self):
+        status, _, body = self.emulator.handle(
+            'POST', '/v1/subnets', json.dumps(
+                {'name': 'subnet-1', 'vpc': {'id': 'r006-unknown'}}))
+        self.assertEqual(status, 404)
+        self.assertEqual(json.loads(body)['errors'][0]['code'], 'not_found')
+        self.assertEqual(self.emulator.collections.get(
+            (None, 'subnets')), None)
+
+    def test_delete_restricted(self):
+        vpc, subnet = self.network()
+        response = Vpc().delete_vpc('vpc-1')
+        self.assertEqual(response['errors'][0]['code'], 'conflict')
+        self.assertEqual(Subnet().delete_subnet('subnet-1'),
+                         {'status': 'deleted'})
+        self.assertEqual(Vpc().delete_vpc('vpc-1'), {'status': 'deleted'})
+        # Default security group and network ACL are deleted with the VPC
+        self.assertNotIn(vpc['default_security_group']['id'],
+                         self.emulator.index)
+        self.assertNotIn(subnet['network_acl']['id'], self.emulator.index)
+
+    def test_instance(self):
+        self.network()
+        Key().create_key(name='key-1', public_key='ssh-rsa AAAA')
+        instance = Instance().create_instance(
+            name='instance-1', profile='bx2-2x8', zone='us-south-1',
+            image='ibm-ubuntu-22-04-minimal-amd64-1', keys=['key-1'],
+            primary_network_interface={'subnet': 'subnet-1'})
+        interface = instance['primary_network_interface']
+        self.assertEqual(interface['primary_ipv4_address'], '10.0.0.4')
+        self.assertEqual(instance['vpc']['name'], 'vpc-1')
+        self.assertEqual(Subnet().delete_subnet('subnet-1')['errors'][0]
+                         ['code'], 'conflict')
+
+        Fip().reserve_floating_ip(name='fip-1', zone='us-south-1')
+        Instance().associate_floating_ip(instance='instance-1',
+                                         interface=interface['id'],
+                                         fip='fip-1')
+        self.assertEqual(Fip().get_floating_ip('fip-1')['target']['id'],
+                         interface['id'])
+        self.assertEqual(Instance().delete_instance('instance-1'),
+                         {'status': 'deleted'})
+        # Floating IPs are released with the instance
+        self.assertNotIn('target', Fip().get_floating_ip('fip-1'))
+        self.assertEqual(Subnet().delete_subnet('subnet-1'),
+                         {'status': 'deleted'})
+
+    def test_pagination(self):
+        for index in range(120):
+            self.emulator.add('keys', name='key-{}'.format(index),
+                              public_key='ssh-rsa AAAA')
+        requests = self.emulator.requests
+        keys = list(Key().iter_keys())
+        self.assertEqual(len(keys), 120)
+        self.assertEqual(len(set(key['id'] for key in keys)), 120)
+        self.assertEqual(self.emulator.requests - requests, 3)
+
+    def test_throttle(self):
+        self.emulator.throttle = 1
+        self.emulator.retry_after = 0
+        throttled = self.emulator.throttled
+        response = Vpc().get_vpcs()
+        self.assertEqual(response['errors'][0]['code'], 'too_many_requests')
+        # GET queries are retried
+        self.assertEqual(self.emulator.throttled - throttled, 4)
+
+    def test_handle(self):
+        emulator = VpcEmulator(throttle=1, retry_after=2)
+        status, headers, _ = emulator.handle('GET', '/v1/vpcs')
+        self.assertEqual((status, headers['Retry-After']), (429, '2'))
+        emulator.throttle = 0
+        status, _, body = emulator.handle('GET', '/v1/images?limit=2')
+        data = json.loads(body)
+        self.assertEqual((status, len(data['images'])), (200, 2))
+        self.assertIn('start=2', data['next']['href'])
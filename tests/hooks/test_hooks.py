@@ -0,0 +1,104 @@
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk.aio import common as aio_common
+from ibmcloud_python_sdk.utils.hooks import Call, Hooks
+from tests.common import fake_response as response, query, run
+
+ID = 'r006-0b6cbcb4-d4e2-4b42-9b3c-5b8b2a1b9e9f'
+
+
+class CallTestCase(TestCase):
+
+    def test_template(self):
+        call = Call('iaas', 'GET', '/v1/instances/{}/network_interfaces'
+                    '?version=2021-01-01'.format(ID))
+        self.assertEqual(call.template,
+                         '/v1/instances/{id}/network_interfaces')
+
+    def test_request_bytes(self):
+        self.assertEqual(Call('iaas', 'POST', '/v1/vpcs', {},
+                              b'{"a": 1}').request_bytes, 8)
+        self.assertEqual(Call('iaas', 'GET', '/v1/vpcs').request_bytes, 0)
+
+    def test_unknown_event(self):
+        with self.assertRaises(ValueError):
+            Hooks().register('after_request', print)
+
+
+class QueryHooksTestCase(TestCase):
+
+    def setUp(self):
+        self.hooks = Hooks()
+        self.events = []
+        for event in ('before_request', 'after_response', 'on_error'):
+            self.hooks.register(event, lambda call, event=event:
+                                self.events.append((event, call)))
+        self.patcher = patch('ibmcloud_python_sdk.utils.common.hooks',
+                             self.hooks)
+        self.patcher.start()
+        self.sleep = patch('ibmcloud_python_sdk.utils.common.time.sleep')
+        self.sleep.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.sleep.stop()
+
+    def query(self, method, results, headers=None):
+        sent = []
+        query(results, method, '/v1/vpcs/{}'.format(ID), headers, b'{}',
+              b'{"ok": true}', sent)
+        return [request.headers for request in sent]
+
+    def test_after_response(self):
+        self.query('GET', [response(503), response(200)])
+        self.assertEqual([event for event, _ in self.events],
+                         ['before_request', 'after_response'])
+        call = self.events[1][1]
+        self.assertEqual((call.conn_type, call.method, call.template),
+                         ('iaas', 'GET', '/v1/vpcs/{id}'))
+        self.assertEqual((call.status, call.attempts), (200, 2))
+        self.assertEqual((call.request_bytes, call.response_bytes), (2, 12))
+        self.assertIn('total', call.timings)
+        self.assertIsNone(call.error)
+
+    def test_on_error(self):
+        with self.assertRaises(ConnectionResetError):
+            self.query('POST', [ConnectionResetError()])
+        self.assertEqual([event for event, _ in self.events],
+                         ['before_request', 'on_error'])
+        call = self.events[1][1]
+        self.assertIsInstance(call.error, ConnectionResetError)
+        self.assertIsNone(call.status)
+
+    def test_add_header(self):
+        self.hooks.register('before_request', lambda call:
+                            call.headers.update({'traceparent': 'trace'}))
+        headers = {'Authorization': 'Bearer a'}
+        sent = self.query('GET', [response(200)], headers)
+        self.assertEqual(sent[0]['traceparent'], 'trace')
+        self.assertNotIn('traceparent', headers)
+
+    def test_unregister(self):
+        before = self.hooks.handlers['before_request'][0]
+        self.hooks.unregister('before_request', before)
+        self.query('GET', [response(200)])
+        self.assertEqual([event for event, _ in self.events],
+                         ['after_response'])
+
+
+class AsyncQueryHooksTestCase(TestCase):
+
+    def test_after_response(self):
+        hooks = Hooks()
+        calls = []
+        hooks.register('after_response', calls.append)
+
+        async def request(host, method, path, payload, headers, timeout):
+            return response(200), b'{"ok": true}'
+
+        with patch('ibmcloud_python_sdk.aio.common.hooks', hooks), \
+                patch.object(aio_common.pool, 'request', request):
+            run(aio_common.query_wrapper('iaas', 'GET', '/v1/vpcs'))
+
+        self.assertEqual((calls[0].status, calls[0].response_bytes),
+                         (200, 12))
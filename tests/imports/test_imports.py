@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase
+
+MODULES = [
+    "ibmcloud_python_sdk.auth",
+    "ibmcloud_python_sdk.config",
+    "ibmcloud_python_sdk.utils.cache",
+    "ibmcloud_python_sdk.utils.common",
+    "ibmcloud_python_sdk.power",
+    "ibmcloud_python_sdk.power.instance",
+    "ibmcloud_python_sdk.vpc.instance",
+    "ibmcloud_python_sdk.aio.vpc.instance",
+    "ibmcloud_python_sdk.cis.baremetal.hardware",
+    "ibmcloud_python_sdk.cis.storage.object",
+    "ibmcloud_python_sdk.dns.public",
+]
+
+# Fail if anything reads a file under HOME while importing
+SNIPPET = """
+import builtins, os
+home = os.environ["HOME"]
+real_open = builtins.open
+
+def guarded_open(file, *args, **kwargs):
+    if str(file).startswith(home):
+        raise AssertionError("%s opened at import time" % file)
+    return real_open(file, *args, **kwargs)
+
+builtins.open = guarded_open
+import {}
+"""
+
+
+class ImportTestCase(TestCase):
+
+    def test_imports_without_config(self):
+        with tempfile.TemporaryDirectory() as home:
+            env = {key: value for key, value in os.environ.items()
+                   if not key.startswith(("IC_", "SL_"))}
+            env["HOME"] = home
+            for module in MODULES:
+                with self.subTest(module=module):
+                    result = subprocess.run(
+                        [sys.executable, "-c", SNIPPET.format(module)],
+                        env=env, stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE, universal_newlines=True)
+                    self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_optional_dependencies_not_imported(self):
+        snippet = ("import sys; import ibmcloud_python_sdk.cis.storage.file; "
+                   "import ibmcloud_python_sdk.dns.public; "
+                   "print(sorted(set(sys.modules) & "
+                   "{'SoftLayer', 'ibm_boto3', 'botocore'}))")
+        result = subprocess.run([sys.executable, "-c", snippet],
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE,
+                                universal_newlines=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "[]")
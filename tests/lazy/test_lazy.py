@@ -0,0 +1,22 @@
+import sys
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk.utils import lazy
+
+
+class LazyModuleTestCase(TestCase):
+
+    def test_import_on_first_access(self):
+        module = lazy.LazyModule("colorsys", "extra")
+        self.assertIsNone(module._module)
+        self.assertEqual(module.rgb_to_hsv(0, 0, 0), (0.0, 0.0, 0.0))
+        self.assertIs(module._module, sys.modules["colorsys"])
+
+    def test_missing_module(self):
+        module = lazy.LazyModule("ibmcloud_missing_module", "softlayer")
+        with patch('builtins.print') as printed:
+            with self.assertRaises(ImportError):
+                module.client
+        self.assertIn("ibmcloud-python-sdk[softlayer]",
+                      printed.call_args[0][0])
+        self.assertIsNone(module._module)
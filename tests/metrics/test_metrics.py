@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk.auth import TokenManager
+from ibmcloud_python_sdk.utils import cache
+from ibmcloud_python_sdk.utils import metrics
+from ibmcloud_python_sdk.utils.softlayer import MetricsTransport, instrument
+from tests.common import fake_response as response, query
+
+ID = 'r006-0b6cbcb4-d4e2-4b42-9b3c-5b8b2a1b9e9f'
+
+
+class RegistryTestCase(TestCase):
+
+    def setUp(self):
+        self.registry = metrics.Registry()
+
+    def test_counter(self):
+        counter = self.registry.counter('queries_total', 'Queries',
+                                        ('path',))
+        counter.inc('/v1/"vpcs"')
+        counter.inc('/v1/"vpcs"', amount=2)
+        self.assertEqual(self.registry.render(),
+                         '# HELP queries_total Queries\n'
+                         '# TYPE queries_total counter\n'
+                         'queries_total{path="/v1/\\"vpcs\\""} 3\n')
+
+    def test_histogram(self):
+        histogram = self.registry.histogram('duration_seconds', 'Duration',
+                                            ('path',), buckets=(0.1, 1))
+        histogram.observe('/v1/vpcs', value=0.05)
+        histogram.observe('/v1/vpcs', value=0.5)
+        histogram.observe('/v1/vpcs', value=5)
+        lines = self.registry.render().splitlines()
+        self.assertEqual(lines[2:], [
+            'duration_seconds_bucket{path="/v1/vpcs",le="0.1"} 1',
+            'duration_seconds_bucket{path="/v1/vpcs",le="1"} 2',
+            'duration_seconds_bucket{path="/v1/vpcs",le="+Inf"} 3',
+            'duration_seconds_sum{path="/v1/vpcs"} 5.55',
+            'duration_seconds_count{path="/v1/vpcs"} 3'])
+
+    def test_reset(self):
+        counter = self.registry.counter('queries_total', 'Queries')
+        counter.inc()
+        self.registry.reset()
+        self.assertEqual(counter.value(), 0)
+
+
+class RecordTestCase(TestCase):
+
+    def setUp(self):
+        metrics.registry.reset()
+
+    def query(self, result):
+        return query([result], 'POST', '/v1/vpcs/{}?version=1'.format(ID),
+                     {}, b'{"name": "a"}', b'{"id": "a"}')
+
+    def test_query(self):
+        self.query(response(201))
+        labels = ('iaas', 'POST', '/v1/vpcs/{id}')
+        self.assertEqual(metrics.REQUESTS.value(*labels, '201'), 1)
+        self.assertEqual(metrics.DURATION.value(*labels), 1)
+        self.assertEqual(metrics.SENT.value('iaas'), 13)
+        self.assertEqual(metrics.RECEIVED.value('iaas'), 11)
+        self.assertIn('ibmcloud_sdk_requests_total{conn_type="iaas",'
+                      'method="POST",path="/v1/vpcs/{id}",status="201"} 1',
+                      metrics.snapshot())
+
+    def test_query_error(self):
+        with self.assertRaises(ConnectionResetError):
+            self.query(ConnectionResetError())
+        self.assertEqual(metrics.ERRORS.value(
+            'iaas', 'POST', '/v1/vpcs/{id}', 'ConnectionResetError'), 1)
+
+    def test_cache(self):
+        metrics.record_cache('local', None)
+        metrics.record_cache('local', cache.pack(b'{}', None, 60))
+        metrics.record_cache('memcached', cache.pack(b'{}', None, -1))
+        self.assertEqual(metrics.CACHE.value('local', 'miss'), 1)
+        self.assertEqual(metrics.CACHE.value('local', 'hit'), 1)
+        self.assertEqual(metrics.CACHE.value('memcached', 'stale'), 1)
+
+    def test_token_refresh(self):
+        manager = TokenManager()
+        with patch('ibmcloud_python_sdk.auth.get_token',
+                   side_effect=ConnectionResetError()):
+            with self.assertRaises(ConnectionResetError):
+                manager.get()
+        self.assertEqual(metrics.TOKEN_REFRESHES.value('error'), 1)
+
+    def test_softlayer_transport(self):
+        request = SimpleNamespace(service='SoftLayer_Account',
+                                  method='getHardware')
+        client = instrument(SimpleNamespace(transport=lambda request: []))
+        self.assertIsInstance(client.transport, MetricsTransport)
+        instrument(client)
+        self.assertNotIsInstance(client.transport.transport,
+                                 MetricsTransport)
+
+        self.assertEqual(client.transport(request), [])
+        self.assertEqual(metrics.REQUESTS.value(
+            'softlayer', 'getHardware', 'SoftLayer_Account', '200'), 1)
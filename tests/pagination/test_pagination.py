@@ -0,0 +1,75 @@
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk.utils.common import next_page, paginate
+from ibmcloud_python_sdk.vpc.subnet import Subnet
+from tests.common import get_headers, qw_not_found
+
+PAGES = {
+    '/v1/subnets?version=2020-03-10&generation=2&limit=2': {
+        'subnets': [{'name': 'subnet-1'}, {'name': 'subnet-2'}],
+        'next': {'href': 'https://us-south.iaas.cloud.ibm.com/v1/subnets'
+                         '?limit=2&start=abc'}
+    },
+    '/v1/subnets?limit=2&start=abc&version=2020-03-10&generation=2': {
+        'subnets': [{'name': 'subnet-3'}],
+    },
+}
+
+
+def qw_pages(arg1, arg2, path, headers=None, payload=None):
+    return {'data': PAGES[path]}
+
+
+class PaginationTestCase(TestCase):
+
+    def setUp(self):
+        self.path = '/v1/subnets?version=2020-03-10&generation=2'
+        self.patcher = patch('ibmcloud_python_sdk.auth.get_token', get_headers)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_next_page(self):
+        data = {'next': {'href': 'https://us-south.iaas.cloud.ibm.com'
+                                 '/v1/subnets?start=abc&limit=2'}}
+        self.assertEqual(
+            next_page(self.path, data),
+            '/v1/subnets?start=abc&limit=2&version=2020-03-10&generation=2')
+
+    def test_next_page_last(self):
+        self.assertIsNone(next_page(self.path, {'subnets': []}))
+
+    def test_paginate(self):
+        response = paginate(lambda page: PAGES[page], self.path, 'subnets', 2)
+        self.assertEqual([subnet['name'] for subnet in response],
+                         ['subnet-1', 'subnet-2', 'subnet-3'])
+
+    def test_paginate_lazy(self):
+        pages = []
+
+        def query(page):
+            pages.append(page)
+            return PAGES[page]
+
+        response = paginate(query, self.path, 'subnets', 2)
+        self.assertEqual(next(response)['name'], 'subnet-1')
+        self.assertEqual(len(pages), 1)
+
+    def test_paginate_error(self):
+        response = list(paginate(lambda page: qw_not_found(
+            None, None)['data'], self.path, 'subnets'))
+        self.assertEqual(len(response), 1)
+        self.assertEqual(response[0]['errors'][0]['code'], 'not_found')
+
+    @patch('ibmcloud_python_sdk.vpc.subnet.qw', qw_pages)
+    def test_iter_subnets(self):
+        response = Subnet().iter_subnets(limit=2)
+        self.assertEqual(len(list(response)), 3)
+
+    @patch('ibmcloud_python_sdk.vpc.subnet.qw', qw_pages)
+    def test_get_subnet_by_name_next_page(self):
+        with patch('ibmcloud_python_sdk.utils.common.sdk',
+                   lambda: {'page_limit': 2}):
+            response = Subnet().get_subnet_by_name('subnet-3')
+        self.assertEqual(response['name'], 'subnet-3')
@@ -0,0 +1,117 @@
+import http.client
+import socket
+from types import SimpleNamespace
+from unittest import TestCase
+from mock import MagicMock, patch
+from ibmcloud_python_sdk.utils import common
+from ibmcloud_python_sdk.utils.pool import Connection, ConnectionPool, \
+    PlainConnection, connection
+
+
+class PoolTestCase(TestCase):
+
+    def setUp(self):
+        self.pool = ConnectionPool(size=2)
+        self.host = 'iaas.cloud.ibm.com'
+
+    def tearDown(self):
+        self.pool.clear()
+
+    def connection(self, sock=None):
+        conn = MagicMock()
+        conn.sock = sock
+        return conn
+
+    def test_get_new_connection(self):
+        conn = self.pool.get(self.host, 30)
+        self.assertEqual(conn.host, self.host)
+        self.assertEqual(conn.timeout, 30)
+
+    def test_connection_scheme(self):
+        conn = connection('http://127.0.0.1:8080', 30)
+        self.assertIsInstance(conn, PlainConnection)
+        self.assertEqual((conn.host, conn.port), ('127.0.0.1', 8080))
+        conn = connection('https://127.0.0.1:8443', 30)
+        self.assertIsInstance(conn, Connection)
+        self.assertEqual((conn.host, conn.port), ('127.0.0.1', 8443))
+        self.assertIsInstance(connection(self.host, 30), Connection)
+
+    def test_reuse_connection(self):
+        conn = self.connection()
+        self.pool.put(self.host, conn)
+        self.assertIs(self.pool.get(self.host, 30), conn)
+
+    def test_pool_per_host(self):
+        conn = self.connection()
+        self.pool.put(self.host, conn)
+        self.assertIsNot(self.pool.get('iam.cloud.ibm.com', 30), conn)
+
+    def test_pool_size(self):
+        conns = [self.connection() for _ in range(3)]
+        for conn in conns:
+            self.pool.put(self.host, conn)
+        conns[2].close.assert_called_once()
+        conns[0].close.assert_not_called()
+
+    def test_pool_size_reloaded(self):
+        pool = ConnectionPool()
+        with patch('ibmcloud_python_sdk.utils.pool.sdk',
+                   return_value={'pool_size': 1}):
+            pool.put(self.host, self.connection())
+            conn = self.connection()
+            pool.put(self.host, conn)
+            conn.close.assert_called_once()
+        # sdk.yaml changed, a connection more is kept
+        with patch('ibmcloud_python_sdk.utils.pool.sdk',
+                   return_value={'pool_size': 2}):
+            conn = self.connection()
+            pool.put(self.host, conn)
+            conn.close.assert_not_called()
+
+    def test_dead_connection_discarded(self):
+        local, remote = socket.socketpair()
+        remote.close()
+        conn = self.connection(local)
+        self.pool.put(self.host, conn)
+        self.assertIsNot(self.pool.get(self.host, 30), conn)
+        conn.close.assert_called_once()
+        local.close()
+
+    def test_alive_connection_reused(self):
+        local, remote = socket.socketpair()
+        conn = self.connection(local)
+        self.pool.put(self.host, conn)
+        self.assertIs(self.pool.get(self.host, 30), conn)
+        local.close()
+        remote.close()
+
+    def test_release_will_close(self):
+        conn = self.connection()
+        response = SimpleNamespace(will_close=True, close=lambda: None)
+        self.pool.release(self.host, conn, response)
+        conn.close.assert_called_once()
+        self.assertIsNot(self.pool.get(self.host, 30), conn)
+
+    def test_release_keep_alive(self):
+        conn = self.connection()
+        response = SimpleNamespace(will_close=False, close=lambda: None)
+        self.pool.release(self.host, conn, response)
+        self.assertIs(self.pool.get(self.host, 30), conn)
+
+    def test_stale_connection_resent(self):
+        conn = self.connection(sock=object())
+        error = http.client.RemoteDisconnected()
+        for method, calls in (('GET', 2), ('DELETE', 2), ('POST', 1)):
+            send = MagicMock(side_effect=[error, ('response', b'')])
+            with patch.object(common.pool, 'get', return_value=conn), \
+                    patch.object(common.pool, 'release'), \
+                    patch('ibmcloud_python_sdk.utils.common._send', send):
+                if calls == 1:
+                    # A POST could have been processed, it is not resent
+                    with self.assertRaises(http.client.RemoteDisconnected):
+                        common._request(self.host, 30, method, '/v1/vpcs')
+                else:
+                    self.assertEqual(common._request(
+                        self.host, 30, method, '/v1/vpcs'),
+                        ('response', b''))
+            self.assertEqual(send.call_count, calls)
@@ -0,0 +1,174 @@
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk.utils.common import find_resource, is_id
+from ibmcloud_python_sdk.utils.resolution import kind, resolution_cache
+from ibmcloud_python_sdk.vpc.subnet import Subnet
+from ibmcloud_python_sdk.vpc.vpn import Vpn
+from tests.common import get_headers, get_one, qw, qw_not_found
+
+
+class ResolveTestCase(TestCase):
+
+    def setUp(self):
+        self.content = get_one('subnets')
+        self.paths = []
+        resolution_cache.invalidate()
+        self.patcher = patch('ibmcloud_python_sdk.auth.get_token', get_headers)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        resolution_cache.invalidate()
+
+    def qw_count(self, arg1, arg2, path, headers=None, payload=None):
+        self.paths.append(path)
+        return qw(arg1, arg2, path, headers, payload)
+
+    def test_is_id(self):
+        self.assertTrue(is_id('r006-2f4dfb2a-6e8f-4b7c-9f64-2a52e7a7c1b3'))
+        self.assertTrue(is_id('2f4dfb2a-6e8f-4b7c-9f64-2a52e7a7c1b3'))
+        self.assertTrue(is_id('a3e57ea0e2fc4d2d8bfbb2e2c8d0c9a1'))
+        self.assertTrue(is_id('crn:v1:bluemix:public:is:us-south:a/123::vpc:'
+                              'r006-2f4dfb2a-6e8f-4b7c-9f64-2a52e7a7c1b3'))
+        self.assertFalse(is_id('my-subnet'))
+        self.assertFalse(is_id(12345))
+
+    def test_find_resource_by_name_first(self):
+        calls = []
+        response = find_resource(lambda value: calls.append('id') or {},
+                                 lambda value: calls.append('name') or {},
+                                 'my-subnet')
+        self.assertEqual(response, {})
+        self.assertEqual(calls, ['name'])
+
+    def test_find_resource_by_id_first(self):
+        calls = []
+        find_resource(lambda value: calls.append('id') or {},
+                      lambda value: calls.append('name') or {},
+                      '2f4dfb2a-6e8f-4b7c-9f64-2a52e7a7c1b3')
+        self.assertEqual(calls, ['id'])
+
+    def test_find_resource_fallback(self):
+        not_found = qw_not_found(None, 'not_found')
+        response = find_resource(lambda value: not_found,
+                                 lambda value: not_found,
+                                 '10.0.0.1',
+                                 fallback=lambda value: {'address': value})
+        self.assertEqual(response['address'], '10.0.0.1')
+
+    def test_find_resource_not_found(self):
+        not_found = qw_not_found(None, 'not_found')
+        response = find_resource(lambda value: not_found,
+                                 lambda value: not_found, 'my-subnet')
+        self.assertEqual(response['errors'][0]['code'], 'not_found')
+
+    def test_get_subnet_with_id_no_list(self):
+        with patch('ibmcloud_python_sdk.vpc.subnet.qw', self.qw_count):
+            response = Subnet().get_subnet(self.content['data']['id'])
+        self.assertEqual(response['id'], self.content['data']['id'])
+        self.assertEqual(len(self.paths), 1)
+        self.assertIn(self.content['data']['id'], self.paths[0])
+
+    def test_get_ipsec_policy_with_id(self):
+        id = 'r006-2f4dfb2a-6e8f-4b7c-9f64-2a52e7a7c1b3'
+
+        def policy(arg1, arg2, path, headers=None, payload=None):
+            self.paths.append(path)
+            return {'data': {'id': id, 'name': 'my-policy'}}
+
+        with patch('ibmcloud_python_sdk.vpc.vpn.qw', policy):
+            self.assertEqual(Vpn().get_ipsec_policy(id)['id'], id)
+        self.assertEqual(len(self.paths), 1)
+        self.assertTrue(self.paths[0].startswith(
+            '/v1/ipsec_policies/{}?'.format(id)))
+
+    def test_get_subnet_with_name_cached(self):
+        name = self.content['data']['name']
+        with patch('ibmcloud_python_sdk.vpc.subnet.qw', self.qw_count):
+            Subnet().get_subnet(name)
+            self.paths = []
+            response = Subnet().get_subnet(name)
+        self.assertEqual(response['name'], name)
+        self.assertEqual(len(self.paths), 1)
+        self.assertIn(self.content['data']['id'], self.paths[0])
+
+    def test_get_subnet_cache_invalidated(self):
+        name = self.content['data']['name']
+        with patch('ibmcloud_python_sdk.vpc.subnet.qw', self.qw_count):
+            Subnet().get_subnet(name)
+            resolution_cache.invalidate(kind(Subnet))
+            self.paths = []
+            Subnet().get_subnet(name)
+        self.assertNotIn(self.content['data']['id'], self.paths[0])
+
+    def test_get_subnet_cache_disabled(self):
+        name = self.content['data']['name']
+        with patch('ibmcloud_python_sdk.utils.resolution.sdk',
+                   lambda: {'resolution_ttl': 0}):
+            with patch('ibmcloud_python_sdk.vpc.subnet.qw', qw):
+                Subnet().get_subnet(name)
+        self.assertEqual(resolution_cache.entries, {})
+
+    def test_get_subnet_cached_deleted(self):
+        name = self.content['data']['name']
+        with patch('ibmcloud_python_sdk.vpc.subnet.qw', qw):
+            Subnet().get_subnet(name)
+        with patch('ibmcloud_python_sdk.vpc.subnet.qw', qw_not_found):
+            response = Subnet().get_subnet(name)
+        self.assertEqual(response['errors'][0]['code'], 'not_found')
+        self.assertEqual(resolution_cache.entries, {})
+
+    def test_delete_invalidates(self):
+        with patch('ibmcloud_python_sdk.vpc.subnet.qw', qw):
+            Subnet().get_subnet(self.content['data']['name'])
+        self.assertEqual(len(resolution_cache.entries), 1)
+        with patch('ibmcloud_python_sdk.vpc.subnet.qw', qw_not_found):
+            Subnet().delete_subnet('wrong_subnet_name')
+        self.assertEqual(resolution_cache.entries, {})
+
+    def test_kind_per_module(self):
+        from ibmcloud_python_sdk.aio.vpc.subnet import Subnet as AioSubnet
+        from ibmcloud_python_sdk.power.image import Image as PowerImage
+        from ibmcloud_python_sdk.vpc.image import Image
+        self.assertNotEqual(
+            resolution_cache.key(Image().get_image_by_id, ('my-image',)),
+            resolution_cache.key(PowerImage().get_image_by_id,
+                                 ('my-image',)))
+        self.assertEqual(kind(AioSubnet), kind(Subnet))
+
+    def test_find_resource_renamed(self):
+        not_found = qw_not_found(None, 'not_found')
+        resources = {'id-1': {'id': 'id-1', 'serverName': 'new-name'}}
+
+        def by_id(value):
+            return resources.get(value, not_found)
+
+        key = resolution_cache.key(by_id, ('old-name',))
+        resolution_cache.set(key, 'id-1')
+        response = find_resource(by_id, lambda value: not_found, 'old-name',
+                                 name_key='serverName')
+        # The cached ID now belongs to a resource with another name
+        self.assertEqual(response['errors'][0]['code'], 'not_found')
+        self.assertEqual(resolution_cache.get(key), None)
+
+    def test_find_resource_power_deleted(self):
+        # Power API errors have no "errors" key
+        not_found = {'code': 404, 'description': 'pvm-instance does not '
+                     'exist', 'error': 'pvm-instance not found'}
+        resources = {'id-2': {'pvmInstanceID': 'id-2',
+                              'serverName': 'server'}}
+
+        def by_id(value):
+            return resources.get(value, not_found)
+
+        def by_name(value):
+            return resources['id-2']
+
+        key = resolution_cache.key(by_id, ('server',))
+        resolution_cache.set(key, 'id-1')
+        response = find_resource(by_id, by_name, 'server',
+                                 id_key='pvmInstanceID',
+                                 name_key='serverName')
+        # The stale ID is replaced by the one found by name
+        self.assertEqual(response['pvmInstanceID'], 'id-2')
+        self.assertEqual(resolution_cache.get(key), 'id-2')
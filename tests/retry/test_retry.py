@@ -0,0 +1,88 @@
+import time
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk.utils.retry import RetryPolicy, retry_after
+from tests.common import fake_response as response, query
+
+
+class RetryPolicyTestCase(TestCase):
+
+    def setUp(self):
+        self.policy = RetryPolicy(attempts=3, backoff=1, max_backoff=4,
+                                  timeout=60, statuses=[429, 503])
+
+    def test_allowed(self):
+        self.assertTrue(self.policy.allowed('GET'))
+        self.assertTrue(self.policy.allowed('DELETE'))
+        self.assertFalse(self.policy.allowed('POST'))
+        self.assertTrue(self.policy.allowed('POST', retry=True))
+        self.assertFalse(self.policy.allowed('GET', retry=False))
+
+    def test_retryable(self):
+        self.assertTrue(self.policy.retryable(response(429)))
+        self.assertFalse(self.policy.retryable(response(404)))
+
+    def test_delay_jitter(self):
+        for attempt in range(1, 6):
+            delay = self.policy.delay(attempt)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(4, 2 ** (attempt - 1)))
+
+    def test_delay_retry_after(self):
+        self.assertEqual(
+            self.policy.delay(1, response(429, {'Retry-After': '2'})), 2)
+        self.assertEqual(
+            self.policy.delay(1, response(429, {'Retry-After': '120'})), 4)
+
+    def test_retry_after_date(self):
+        self.assertEqual(retry_after(response(
+            503, {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})), 0)
+        self.assertIsNone(retry_after(response(503, {'Retry-After': 'x'})))
+
+    def test_schedule_attempts(self):
+        self.assertIsNotNone(self.policy.schedule(2, time.monotonic()))
+        self.assertIsNone(self.policy.schedule(3, time.monotonic()))
+
+    def test_schedule_timeout(self):
+        self.assertIsNone(self.policy.schedule(
+            1, time.monotonic() - 60, response(429, {'Retry-After': '1'})))
+
+
+class QueryRetryTestCase(TestCase):
+
+    def setUp(self):
+        self.sleep = patch('ibmcloud_python_sdk.utils.common.time.sleep')
+        self.sleep.start()
+
+    def tearDown(self):
+        self.sleep.stop()
+
+    def query(self, method, results, retry=None):
+        calls = []
+        data = query(results, method, headers={}, body=b'{"ok": true}',
+                     sent=calls, retry=retry)
+        return data, calls
+
+    def test_retry_throttled(self):
+        data, calls = self.query('GET', [response(429), response(200)])
+        self.assertEqual(data['response'].status, 200)
+        self.assertEqual(len(calls), 2)
+
+    def test_retry_connection_error(self):
+        data, calls = self.query('GET', [ConnectionResetError(),
+                                         response(200)])
+        self.assertEqual(len(calls), 2)
+
+    def test_no_retry_post(self):
+        data, calls = self.query('POST', [response(503), response(200)])
+        self.assertEqual(data['response'].status, 503)
+        self.assertEqual(len(calls), 1)
+
+    def test_retry_safe_post(self):
+        data, calls = self.query('POST', [response(503), response(200)],
+                                 retry=True)
+        self.assertEqual(data['response'].status, 200)
+
+    def test_attempts_exhausted(self):
+        with self.assertRaises(ConnectionResetError):
+            self.query('GET', [ConnectionResetError() for _ in range(10)])
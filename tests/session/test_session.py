@@ -0,0 +1,57 @@
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk import session as sdk_session
+from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.resource.resource_group import ResourceGroup
+from ibmcloud_python_sdk.vpc.instance import Instance
+from ibmcloud_python_sdk.vpc.security import Security
+from ibmcloud_python_sdk.vpc.subnet import Subnet
+
+
+class SessionTestCase(TestCase):
+
+    def setUp(self):
+        self.session = sdk_session.Session()
+
+    def test_resources_created_on_first_access(self):
+        security = Security(session=self.session)
+        self.assertEqual(self.session._resources, {})
+        self.assertIsInstance(security.instance, Instance)
+        self.assertEqual(list(self.session._resources), [Instance])
+
+    def test_resources_shared(self):
+        security = Security(session=self.session)
+        subnet = self.session.resource(Subnet)
+        self.assertIs(security.rg, subnet.rg)
+        self.assertIs(security.instance.rg, subnet.rg)
+        self.assertIs(security.instance.subnet, subnet)
+        self.assertIs(security.instance.session, self.session)
+
+    def test_config_read_once(self):
+        with patch('ibmcloud_python_sdk.session.params',
+                   side_effect=params) as mocked:
+            security = Security(session=self.session)
+            security.instance.subnet.vpc.rg
+            self.assertEqual(security.instance.cfg['region'], 'us-south')
+        self.assertEqual(mocked.call_count, 1)
+
+    def test_config_from_params(self):
+        with patch('ibmcloud_python_sdk.session.params',
+                   return_value={'region': 'eu-de'}):
+            session = sdk_session.Session()
+            self.assertEqual(ResourceGroup(session=session).cfg['region'],
+                             'eu-de')
+
+    def test_default_session(self):
+        session = sdk_session.default_session()
+        self.assertIs(sdk_session.default_session(), session)
+        self.assertIs(Subnet().session, session)
+        self.assertIs(Subnet().rg, Security().rg)
+
+    def test_default_session_config_changed(self):
+        session = sdk_session.default_session()
+        with patch('ibmcloud_python_sdk.session.params',
+                   return_value={'region': 'eu-de'}):
+            changed = sdk_session.default_session()
+        self.assertIsNot(changed, session)
+        self.assertEqual(changed.cfg['region'], 'eu-de')
@@ -0,0 +1,105 @@
+import threading
+import time
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk.utils import common
+from ibmcloud_python_sdk.utils.singleflight import SingleFlight
+from tests.common import fake_request, fake_response
+
+
+def run_threads(count, target):
+    results = [None] * count
+
+    def run(index):
+        try:
+            results[index] = target()
+        except Exception as error:
+            results[index] = error
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results
+
+
+class SingleFlightTestCase(TestCase):
+
+    def setUp(self):
+        self.flights = SingleFlight()
+        self.calls = 0
+
+    def slow(self, result=None, error=None):
+        def func():
+            self.calls += 1
+            time.sleep(0.05)
+            if error is not None:
+                raise error
+            return result
+        return func
+
+    def test_coalesce(self):
+        result = {'vpcs': []}
+        results = run_threads(8, lambda: self.flights.do(
+            'key', self.slow(result)))
+        self.assertEqual(self.calls, 1)
+        for item in results:
+            self.assertIs(item, result)
+        self.assertEqual(self.flights.calls, {})
+
+    def test_different_keys(self):
+        run_threads(2, lambda: self.flights.do(
+            threading.current_thread().name, self.slow()))
+        self.assertEqual(self.calls, 2)
+
+    def test_error_shared(self):
+        results = run_threads(4, lambda: self.flights.do(
+            'key', self.slow(error=ValueError('boom'))))
+        self.assertEqual(self.calls, 1)
+        for item in results:
+            self.assertIsInstance(item, ValueError)
+
+    def test_sequential_calls(self):
+        self.flights.do('key', self.slow())
+        self.flights.do('key', self.slow())
+        self.assertEqual(self.calls, 2)
+
+
+class QueryCoalescingTestCase(TestCase):
+
+    def query(self, method, token='Bearer a'):
+        return common.query_wrapper('iaas', method, '/v1/vpcs',
+                                    {'Authorization': token})
+
+    def setUp(self):
+        self.requests = []
+        # Patched once, queries are sent by several threads
+        request = fake_request([fake_response(200) for _ in range(6)],
+                               b'{"vpcs": []}', self.requests, 0.05)
+        self.patchers = [
+            patch('ibmcloud_python_sdk.utils.common._request', request),
+            patch('ibmcloud_python_sdk.utils.common.cache.client',
+                  return_value=False),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def test_get_coalesced(self):
+        results = run_threads(6, lambda: self.query('GET'))
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(results[0]['data'], {'vpcs': []})
+
+    def test_tokens_not_shared(self):
+        run_threads(2, lambda: self.query(
+            'GET', 'Bearer {}'.format(threading.current_thread().name)))
+        self.assertEqual(len(self.requests), 2)
+
+    def test_delete_not_coalesced(self):
+        run_threads(3, lambda: self.query('DELETE'))
+        self.assertEqual(len(self.requests), 3)
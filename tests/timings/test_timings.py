@@ -0,0 +1,59 @@
+import socket
+from unittest import TestCase
+from mock import MagicMock, patch
+from ibmcloud_python_sdk.utils import common
+from ibmcloud_python_sdk.utils.pool import Connection
+from tests.common import fake_response as response, query
+
+
+class ConnectionTestCase(TestCase):
+
+    def test_connect_timing(self):
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)
+        try:
+            conn = Connection('127.0.0.1', server.getsockname()[1],
+                              timeout=5)
+            sock = conn._create_connection(server.getsockname(), 5)
+            sock.close()
+            self.assertGreaterEqual(conn.timings['connect'], 0)
+        finally:
+            server.close()
+
+    def test_send_timings(self):
+        conn = MagicMock()
+        with patch('ibmcloud_python_sdk.utils.common.read_body',
+                   return_value=b'{}'):
+            res, data = common._send(conn, 'GET', '/v1/vpcs')
+        self.assertEqual(set(res.timings), {'ttfb', 'read'})
+        self.assertIs(conn.timings, res.timings)
+
+
+class QueryTimingsTestCase(TestCase):
+
+    def query(self, results):
+        with patch('ibmcloud_python_sdk.utils.common.time.sleep'):
+            return query(results, headers={}, body=b'{"vpcs": []}')
+
+    def test_result_timings(self):
+        result = self.query([response(200, timings={
+            'connect': 0.1, 'tls': 0.2, 'ttfb': 0.3, 'read': 0.4})])
+        self.assertEqual(result['data'], {'vpcs': []})
+        self.assertEqual(set(result['timings']),
+                         {'connect', 'tls', 'ttfb', 'read', 'decode',
+                          'total'})
+        self.assertEqual(result['timings']['ttfb'], 0.3)
+
+    def test_retry_timings(self):
+        result = self.query([response(503, timings={'ttfb': 0.1}),
+                             response(200, timings={'ttfb': 0.2})])
+        self.assertAlmostEqual(result['timings']['ttfb'], 0.3)
+        self.assertIn('retry_wait', result['timings'])
+
+    def test_debug_log(self):
+        with self.assertLogs('ibmcloud_python_sdk.utils.common',
+                             'DEBUG') as logs:
+            self.query([response(200, timings={'ttfb': 0.25})])
+        self.assertIn('iaas GET /v1/vpcs: 200', logs.output[0])
+        self.assertIn('ttfb=250.0ms', logs.output[0])